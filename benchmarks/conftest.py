@@ -0,0 +1,21 @@
+"""Settings module for the Py.test tool."""
+import pytest
+
+from django_project import models
+
+
+@pytest.fixture()
+def rows(db):
+    """Create given number of users with a message written by each."""
+
+    def create(size, chunk=10000):
+        for start in range(1, size + 1, chunk):
+            keys = range(start, min(start + chunk, size + 1))
+            models.UserModel.objects.bulk_create(
+                models.UserModel(id=key, name="", about="", avatar="") for key in keys
+            )
+            models.MessageModel.objects.bulk_create(
+                models.MessageModel(id=key, user_id=key, text="") for key in keys
+            )
+
+    return create
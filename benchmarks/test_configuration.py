@@ -0,0 +1,35 @@
+"""Benchmarks related to the mapper configuration."""
+import pytest
+
+from django_project import models
+from examples import dataclasses as e
+from mappers import Mapper
+from mappers.configuration import cache_clear
+
+
+def _flat_mapper():
+    return Mapper(e.User, models.UserModel, {"primary_key": "id"})
+
+
+def _nested_mapper():
+    return Mapper(
+        e.Message,
+        models.MessageModel,
+        {"primary_key": "id", "user": Mapper({"primary_key": "id"})},
+    )
+
+
+@pytest.mark.benchmark(group="configuration")
+@pytest.mark.parametrize("define", [_flat_mapper, _nested_mapper])
+def test_configure(benchmark, define):
+    """Measure configuration of the mapper from scratch."""
+    benchmark.pedantic(define, setup=cache_clear, rounds=100)
+
+
+@pytest.mark.benchmark(group="configuration")
+@pytest.mark.parametrize("define", [_flat_mapper, _nested_mapper])
+def test_cached_configuration(benchmark, define):
+    """Measure definition of the mapper with cached configuration."""
+    define()
+
+    benchmark(define)
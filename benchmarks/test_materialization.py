@@ -0,0 +1,93 @@
+"""Benchmarks related to the entities materialization."""
+from typing import List
+from typing import Optional
+
+import pytest
+
+from django_project import models
+from examples import attrs
+from examples import dataclasses
+from examples import pydantic_model
+from mappers import Mapper
+
+
+# Million rows take longer than the timeout of the test suite.
+pytestmark = pytest.mark.timeout(0)
+
+
+def _flat_reader(e, ret):
+    mapper = Mapper(e.User, models.UserModel, {"primary_key": "id"})
+
+    @mapper.reader.of(ret(e.User))
+    def load_users():
+        return models.UserModel.objects.order_by("id")
+
+    return load_users
+
+
+def _nested_reader(e, ret):
+    mapper = Mapper(
+        e.Message,
+        models.MessageModel,
+        {"primary_key": "id", "user": Mapper({"primary_key": "id"})},
+    )
+
+    @mapper.reader.of(ret(e.Message))
+    def load_messages():
+        return models.MessageModel.objects.order_by("id")
+
+    return load_messages
+
+
+def _list(entity):
+    return List[entity]
+
+
+def _optional(entity):
+    return Optional[entity]
+
+
+def _entity(entity):
+    return entity
+
+
+@pytest.mark.benchmark(group="rows")
+@pytest.mark.parametrize("size", [1, 1000, 1000000])
+@pytest.mark.parametrize("define", [_flat_reader, _nested_reader])
+def test_list_converter(benchmark, rows, define, size):
+    """Measure materialization of growing number of rows."""
+    rows(size)
+
+    reader = define(dataclasses, _list)
+
+    result = benchmark(reader)
+
+    assert len(result) == size
+
+
+@pytest.mark.benchmark(group="entities")
+@pytest.mark.parametrize("e", [dataclasses, attrs, pydantic_model])
+@pytest.mark.parametrize("define", [_flat_reader, _nested_reader])
+def test_entity_libraries(benchmark, rows, define, e):
+    """Compare materialization of entities defined with different libraries."""
+    rows(1000)
+
+    reader = define(e, _list)
+
+    result = benchmark(reader)
+
+    assert len(result) == 1000
+
+
+@pytest.mark.benchmark(group="converters")
+@pytest.mark.parametrize("ret", [_entity, _optional])
+@pytest.mark.parametrize("define", [_flat_reader, _nested_reader])
+def test_single_converters(benchmark, rows, define, ret):
+    """Measure materialization of a single entity."""
+    rows(1)
+
+    reader = define(dataclasses, ret)
+
+    result = benchmark(reader)
+
+    assert result is not None
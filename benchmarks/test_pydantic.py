@@ -0,0 +1,30 @@
+"""Benchmarks related to the pydantic entities construction."""
+from typing import List
+
+import pytest
+
+from django_project import models
+from examples import pydantic_model as e
+from mappers import Mapper
+
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.mark.benchmark(group="pydantic")
+@pytest.mark.parametrize("trusted", [False, True])
+def test_pydantic_model_construction(benchmark, trusted):
+    """Compare validated and trusted construction of pydantic models."""
+    models.UserModel.objects.bulk_create(
+        models.UserModel(name="", about="", avatar="") for _ in range(1000)
+    )
+
+    mapper = Mapper(e.User, models.UserModel, {"primary_key": "id"}, trusted=trusted)
+
+    @mapper.reader.of(List[e.User])
+    def load_users():
+        return models.UserModel.objects.all()
+
+    result = benchmark(load_users)
+
+    assert len(result) == 1000
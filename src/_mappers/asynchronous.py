@@ -0,0 +1,86 @@
+from timeit import default_timer
+from typing import AsyncIterable
+from typing import AsyncIterator
+from typing import List
+from typing import Optional
+
+from _mappers.exceptions import MapperError
+from _mappers.tracing import _current_timer
+from _mappers.tracing import _is_tracing
+from _mappers.tracing import _report
+from _mappers.tracing import _Timer
+from _mappers.tracing import _trace
+
+
+class _AsyncReader(object):
+    def __init__(self, f, iterable, entity, ret, chunk_size):
+        self.f = f
+        self.iterable = iterable
+        self.entity = entity
+        self.ret = ret
+        self.converter = _get_async_converter(ret, entity, chunk_size)
+        self.streaming = ret in (AsyncIterator[entity], AsyncIterable[entity])
+
+    def __call__(self, *args, **kwargs):
+        if not _is_tracing():
+            return self.read(*args, **kwargs)
+        elif self.streaming:
+            # Streamed rows are fetched after the call, the same way as
+            # rows of the synchronous iterator.
+            return _trace(self, args, kwargs)
+        else:
+            return _trace_coroutine(self, args, kwargs)
+
+    def read(self, *args, **kwargs):
+        return self.converter(self.raw(*args, **kwargs))
+
+    async def raw(self, *args, **kwargs):
+        return self.iterable(await self.f(*args, **kwargs))
+
+
+async def _trace_coroutine(reader, args, kwargs):
+    timer = _Timer()
+    token = _current_timer.set(timer)
+    start = default_timer()
+    try:
+        result = await reader.read(*args, **kwargs)
+    finally:
+        elapsed = default_timer() - start
+        _current_timer.reset(token)
+    _report(reader, timer, elapsed)
+    return result
+
+
+def _get_async_converter(ret, entity, chunk_size):
+    if ret is entity:
+        return _get
+    elif ret == List[entity]:
+        return _list
+    elif ret == Optional[entity]:
+        return _first
+    elif ret in (AsyncIterator[entity], AsyncIterable[entity]):
+        return _get_async_iterator_converter(chunk_size)
+    else:
+        raise MapperError
+
+
+async def _get(raw):
+    return await (await raw).aget()
+
+
+async def _list(raw):
+    return [entity async for entity in await raw]
+
+
+async def _first(raw):
+    return await (await raw).afirst()
+
+
+def _get_async_iterator_converter(chunk_size):
+    arguments = {} if chunk_size is None else {"chunk_size": chunk_size}
+
+    async def converter(raw):
+        async for entity in (await raw).aiterator(**arguments):
+            yield entity
+
+    return converter
@@ -0,0 +1,43 @@
+from typing import _SpecialForm
+from typing import Any
+from typing import AsyncIterator
+from typing import Awaitable
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from django.db.models.query import ValuesQuerySet
+
+from _mappers.entities import _Entity
+from _mappers.entities import _EntityClass
+from _mappers.sources.django import _ValuesList
+
+_Raw = Awaitable[ValuesQuerySet]
+
+class _AsyncReader:
+    def __init__(
+        self,
+        f: Callable,
+        iterable: _ValuesList,
+        entity: _EntityClass,
+        ret: _SpecialForm,
+        chunk_size: Optional[int],
+    ) -> None: ...
+    def __call__(self, *args: Any, **kwargs: Any) -> Any: ...
+    def read(self, *args: Any, **kwargs: Any) -> Any: ...
+    async def raw(self, *args: Any, **kwargs: Any) -> ValuesQuerySet: ...
+
+async def _trace_coroutine(
+    reader: _AsyncReader, args: Tuple[Any, ...], kwargs: Dict[str, Any]
+) -> Any: ...
+def _get_async_converter(
+    ret: _SpecialForm, entity: _EntityClass, chunk_size: Optional[int]
+) -> Callable[[_Raw], Any]: ...
+async def _get(raw: _Raw) -> _Entity: ...
+async def _list(raw: _Raw) -> List[_Entity]: ...
+async def _first(raw: _Raw) -> Optional[_Entity]: ...
+def _get_async_iterator_converter(
+    chunk_size: Optional[int],
+) -> Callable[[_Raw], AsyncIterator[_Entity]]: ...
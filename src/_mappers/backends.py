@@ -0,0 +1,31 @@
+from _mappers.entities import _registry as _entities
+from _mappers.registry import _Backend
+from _mappers.sources import _registry as _data_sources
+
+
+def register_entity(detect, get_fields, get_factory):
+    """Support entity classes accepted by the given detector.
+
+    Registered backends take precedence over built-in ones.  Detection
+    result is cached per entity class.
+    """
+    _entities.register(_Backend(detect, get_fields, get_factory))
+
+
+def unregister_entity(detect):
+    """Stop supporting entity classes accepted by the given detector."""
+    _entities.unregister(detect)
+
+
+def register_data_source(detect, get_fields, factory):
+    """Support data sources accepted by the given detector.
+
+    Registered backends take precedence over built-in ones.  Detection
+    result is cached per data source type.
+    """
+    _data_sources.register(_Backend(detect, get_fields, factory))
+
+
+def unregister_data_source(detect):
+    """Stop supporting data sources accepted by the given detector."""
+    _data_sources.unregister(detect)
@@ -0,0 +1,26 @@
+from typing import Any
+from typing import Callable
+
+from _mappers.entities import _EntityFactory
+from _mappers.entities import _EntityFields
+from _mappers.registry import _Detect
+from _mappers.sources import _DataSourceFields
+from _mappers.sources import _Iterable
+from _mappers.validation import _Mapping
+
+_GetEntityFields = Callable[[Any], _EntityFields]
+
+_GetEntityFactory = Callable[[_EntityFields, Any, bool], _EntityFactory]
+
+_GetDataSourceFields = Callable[[Any], _DataSourceFields]
+
+_Factory = Callable[[Any, _EntityFields, _EntityFactory, _Mapping], _Iterable]
+
+def register_entity(
+    detect: _Detect, get_fields: _GetEntityFields, get_factory: _GetEntityFactory
+) -> None: ...
+def unregister_entity(detect: _Detect) -> None: ...
+def register_data_source(
+    detect: _Detect, get_fields: _GetDataSourceFields, factory: _Factory
+) -> None: ...
+def unregister_data_source(detect: _Detect) -> None: ...
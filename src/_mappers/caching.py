@@ -0,0 +1,100 @@
+import threading
+from collections import namedtuple
+from collections import OrderedDict
+from timeit import default_timer
+
+from _mappers.compat import _get_signature
+
+
+_CacheInfo = namedtuple("CacheInfo", ["hits", "misses"])
+
+
+class LRUCache(object):
+    """Keep recent reader results in the process memory.
+
+    Least recently used results are evicted when the cache grows over
+    `maxsize`.  Results older than `ttl` seconds are never returned.
+    """
+
+    def __init__(self, maxsize=1024, ttl=None, timer=default_timer):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.timer = timer
+        self.data = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        """Return cached value or None if there is no fresh one."""
+        with self.lock:
+            item = self.data.pop(key, None)
+            if item is not None and item[1] > self.timer():
+                self.data[key] = item
+                return item[0]
+
+    def set(self, key, value):
+        """Store value under the given key."""
+        expires = float("inf") if self.ttl is None else self.timer() + self.ttl
+        with self.lock:
+            self.data.pop(key, None)
+            self.data[key] = value, expires
+            while len(self.data) > self.maxsize:
+                self.data.popitem(last=False)
+
+    def delete(self, key):
+        """Remove value stored under the given key."""
+        with self.lock:
+            self.data.pop(key, None)
+
+    def clear(self, namespace):
+        """Remove all values stored by the reader."""
+        with self.lock:
+            for key in [key for key in self.data if key[0] == namespace]:
+                del self.data[key]
+
+
+class _CachedReader(object):
+    def __init__(self, reader, backend, namespace):
+        self.reader = reader
+        self.backend = backend
+        self.namespace = _get_namespace(reader) if namespace is None else namespace
+        self.signature = _get_signature(reader.f)
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __call__(self, *args, **kwargs):
+        key = self.key(args, kwargs)
+        cached = self.backend.get(key)
+        if cached is not None:
+            with self.lock:
+                self.hits += 1
+            return cached[0]
+        with self.lock:
+            self.misses += 1
+        result = self.reader(*args, **kwargs)
+        # Results are wrapped, so readers returning None are cached too.
+        self.backend.set(key, (result,))
+        return result
+
+    def key(self, args, kwargs):
+        if self.signature is not None:
+            # Arguments passed by position and by name share the key.
+            bound = self.signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            args, kwargs = bound.args, bound.kwargs
+        return self.namespace, args, tuple(sorted(kwargs.items()))
+
+    def invalidate(self, *args, **kwargs):
+        self.backend.delete(self.key(args, kwargs))
+
+    def clear(self):
+        self.backend.clear(self.namespace)
+
+    def cache_info(self):
+        return _CacheInfo(self.hits, self.misses)
+
+
+def _get_namespace(reader):
+    # Namespace is the same in every process sharing the backend.
+    f = reader.f
+    return f.__module__ + "." + getattr(f, "__qualname__", f.__name__)
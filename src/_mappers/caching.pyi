@@ -0,0 +1,61 @@
+import threading
+from inspect import Signature
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Hashable
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+
+from typing_extensions import Protocol
+
+from _mappers.mapper import _Reader
+
+class _CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+
+_Key = Tuple[str, Tuple[Any, ...], Tuple[Tuple[str, Any], ...]]
+
+class _Backend(Protocol):
+    def get(self, key: _Key) -> Optional[Any]: ...
+    def set(self, key: _Key, value: Any) -> None: ...
+    def delete(self, key: _Key) -> None: ...
+    def clear(self, namespace: str) -> None: ...
+
+class LRUCache:
+    maxsize: int
+    ttl: Optional[float]
+    timer: Callable[[], float]
+    data: Dict[Hashable, Tuple[Any, float]]
+    lock: threading.Lock
+    def __init__(
+        self,
+        maxsize: int = ...,
+        ttl: Optional[float] = ...,
+        timer: Callable[[], float] = ...,
+    ) -> None: ...
+    def get(self, key: _Key) -> Optional[Any]: ...
+    def set(self, key: _Key, value: Any) -> None: ...
+    def delete(self, key: _Key) -> None: ...
+    def clear(self, namespace: str) -> None: ...
+
+class _CachedReader:
+    reader: _Reader
+    backend: _Backend
+    namespace: str
+    signature: Optional[Signature]
+    lock: threading.Lock
+    hits: int
+    misses: int
+    def __init__(
+        self, reader: _Reader, backend: _Backend, namespace: Optional[str]
+    ) -> None: ...
+    def __call__(self, *args: Any, **kwargs: Any) -> Any: ...
+    def key(self, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> _Key: ...
+    def invalidate(self, *args: Any, **kwargs: Any) -> None: ...
+    def clear(self) -> None: ...
+    def cache_info(self) -> _CacheInfo: ...
+
+def _get_namespace(reader: _Reader) -> str: ...
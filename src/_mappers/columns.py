@@ -0,0 +1,64 @@
+from collections import OrderedDict
+from typing import Generic
+from typing import TypeVar
+
+from _mappers.exceptions import MapperError
+
+
+_T = TypeVar("_T")
+
+
+class Columns(Generic[_T]):
+    """Read entity fields as arrays of columns instead of entity instances."""
+
+
+def _get_columns_converter(fields, mapping):
+    _check_columns(fields, mapping)
+    numpy = _import_numpy()
+    names = [field for field, _field_type in fields]
+    column_dtypes = [_get_dtype(field_type) for _field, field_type in fields]
+
+    def converter(chunks):
+        # Arrays are filled chunk by chunk and joined once at the end.
+        parts = [[numpy.array((), dtype=dtype)] for dtype in column_dtypes]
+        for columns in chunks:
+            for part, column, dtype in zip(parts, columns, column_dtypes):
+                part.append(numpy.array(column, dtype=dtype))
+        return OrderedDict(
+            (name, numpy.concatenate(part)) for name, part in zip(names, parts)
+        )
+
+    return converter
+
+
+def _check_columns(fields, mapping):
+    from _mappers.mapper import Deferred
+
+    for field, field_type in fields:
+        if field_type["is_entity"] or isinstance(mapping[field], Deferred):
+            raise MapperError
+
+
+def _import_numpy():
+    # NumPy is imported on demand to keep the package import cheap.
+    try:
+        import numpy
+    except ImportError:
+        raise MapperError
+    return numpy
+
+
+def _get_dtype(field_type):
+    if field_type["is_optional"]:
+        return object
+    else:
+        return dtypes.get(_get_supertype(field_type["type"]), object)
+
+
+def _get_supertype(t):
+    while hasattr(t, "__supertype__"):
+        t = t.__supertype__
+    return t
+
+
+dtypes = {bool: bool, int: "int64", float: "float64"}
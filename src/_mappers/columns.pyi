@@ -0,0 +1,29 @@
+from types import ModuleType
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Generic
+from typing import Iterable
+from typing import List
+from typing import Sequence
+from typing import TypeVar
+
+from _mappers.entities import _EntityFields
+from _mappers.entities import _FieldDef
+from _mappers.validation import _Mapping
+
+_T = TypeVar("_T")
+
+class Columns(Generic[_T]): ...
+
+_Columns = List[Sequence[Any]]
+
+def _get_columns_converter(
+    fields: _EntityFields, mapping: _Mapping
+) -> Callable[[Iterable[_Columns]], Dict[str, Any]]: ...
+def _check_columns(fields: _EntityFields, mapping: _Mapping) -> None: ...
+def _import_numpy() -> ModuleType: ...
+def _get_dtype(field_type: _FieldDef) -> Any: ...
+def _get_supertype(t: Any) -> Any: ...
+
+dtypes: Dict[type, Any]
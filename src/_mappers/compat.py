@@ -1,4 +1,5 @@
-from inspect import isclass
+from typing import Dict
+from typing import List
 from typing import Union
 
 try:
@@ -9,6 +10,26 @@ except ImportError:
         pass
 
 
+def _is_coroutine_function(f):
+    # Inspect module is expensive to import, it is imported on demand.
+    try:
+        from inspect import iscoroutinefunction
+    except ImportError:
+        # We are on Python 2.7 without native coroutines.
+        return False
+    return iscoroutinefunction(f)
+
+
+def _get_signature(f):
+    # Inspect module is expensive to import, it is imported on demand.
+    try:
+        from inspect import signature
+    except ImportError:
+        # We are on Python 2.7 without function signatures.
+        return None
+    return signature(f)
+
+
 try:
     from typing import _Union
 except ImportError:
@@ -22,6 +43,19 @@ def _is_optional(t):
         isinstance(t, (_GenericAlias, _Union))
         and t.__origin__ is Union
         and len(t.__args__) == 2
-        and isclass(t.__args__[-1])
+        and isinstance(t.__args__[-1], type)
         and isinstance(None, t.__args__[-1])
     )
+
+
+def _is_dict_of(t, value):
+    return (
+        getattr(t, "__origin__", None) in (dict, Dict)
+        and len(t.__args__) == 2
+        and t.__args__[-1] is value
+    )
+
+
+def _get_list_item(t):
+    if getattr(t, "__origin__", None) in (list, List) and t.__args__:
+        return t.__args__[0]
@@ -1,3 +1,10 @@
+from inspect import Signature
 from typing import Any
+from typing import Callable
+from typing import Optional
 
+def _is_coroutine_function(f: Any) -> bool: ...
+def _get_signature(f: Callable) -> Optional[Signature]: ...
 def _is_optional(t: Any) -> bool: ...
+def _is_dict_of(t: Any, value: Any) -> bool: ...
+def _get_list_item(t: Any) -> Any: ...
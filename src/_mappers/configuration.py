@@ -0,0 +1,69 @@
+from collections import namedtuple
+
+from _mappers.mapper import _LazyMapper
+from _mappers.mapper import Deferred
+from _mappers.mapper import Evaluated
+
+
+_CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "currsize"])
+
+
+class _Cache(object):
+    def __init__(self):
+        self.entries = {}
+        # Entity factories and projections shared between configurations.
+        self.shared = {}
+        self.hits = 0
+        self.misses = 0
+
+
+_cache = _Cache()
+
+
+def cache_info():
+    """Report statistics of the mapper configuration cache."""
+    return _CacheInfo(_cache.hits, _cache.misses, len(_cache.entries))
+
+
+def cache_clear():
+    """Clear the mapper configuration cache and its statistics."""
+    _cache.entries.clear()
+    _cache.shared.clear()
+    _cache.hits = 0
+    _cache.misses = 0
+
+
+def _get_configuration(configure, entity, data_source, config, trusted):
+    try:
+        key = (entity, data_source, _config_key(config), trusted)
+        iterable = _cache.entries[key]
+    except KeyError:
+        iterable = configure(entity, data_source, config, trusted)
+        _cache.entries[key] = iterable
+        _cache.misses += 1
+    except TypeError:
+        # Unhashable definitions are invalid.  Let validation report it.
+        return configure(entity, data_source, config, trusted)
+    else:
+        _cache.hits += 1
+    return iterable
+
+
+def _get_shared(build, key, *args):
+    key = (build, key)
+    if key not in _cache.shared:
+        _cache.shared[key] = build(*args)
+    return _cache.shared[key]
+
+
+def _config_key(config):
+    return frozenset((key, _config_value_key(value)) for key, value in config.items())
+
+
+def _config_value_key(value):
+    if isinstance(value, _LazyMapper):
+        return _LazyMapper, _config_key(value.config)
+    elif isinstance(value, (Evaluated, Deferred)):
+        return type(value), value.name
+    else:
+        return value
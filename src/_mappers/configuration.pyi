@@ -0,0 +1,47 @@
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import FrozenSet
+from typing import Hashable
+from typing import NamedTuple
+from typing import Tuple
+from typing import TypeVar
+
+from _mappers.entities import _Entity
+from _mappers.mapper import _Config
+from _mappers.mapper import _ConfigValue
+from _mappers.sources import _DataSource
+from _mappers.sources import _Iterable
+
+_T = TypeVar("_T")
+
+_ConfigKey = FrozenSet[Tuple[str, Hashable]]
+
+_CacheKey = Tuple[_Entity, _DataSource, _ConfigKey, bool]
+
+class _CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    currsize: int
+
+class _Cache:
+    entries: Dict[_CacheKey, _Iterable]
+    shared: Dict[Tuple[Callable, Hashable], Any]
+    hits: int
+    misses: int
+    def __init__(self) -> None: ...
+
+_cache: _Cache
+
+def cache_info() -> _CacheInfo: ...
+def cache_clear() -> None: ...
+def _get_configuration(
+    configure: Callable[[_Entity, _DataSource, _Config, bool], _Iterable],
+    entity: _Entity,
+    data_source: _DataSource,
+    config: _Config,
+    trusted: bool,
+) -> _Iterable: ...
+def _get_shared(build: Callable[..., _T], key: Hashable, *args: Any) -> _T: ...
+def _config_key(config: _Config) -> _ConfigKey: ...
+def _config_value_key(value: _ConfigValue) -> Hashable: ...
@@ -0,0 +1,67 @@
+from datetime import date
+from datetime import time
+from typing import Generic
+from typing import Iterable
+from typing import Iterator
+from typing import TypeVar
+
+from _mappers.exceptions import MapperError
+
+
+_T = TypeVar("_T")
+
+
+class JSON(Generic[_T]):
+    """Read entities as JSON encoded bytes instead of entity instances."""
+
+
+def _get_json_converter(ret, entity):
+    if ret == JSON[entity]:
+        return _encode_array
+    elif ret in (Iterator[JSON[entity]], Iterable[JSON[entity]]):
+        return _stream_array
+    else:
+        raise MapperError
+
+
+def _check_encoded(fields, mapping):
+    from _mappers.mapper import _Mapper
+    from _mappers.mapper import Deferred
+
+    for field, field_type in fields:
+        value = mapping[field]
+        if field_type["is_collection"] or isinstance(value, Deferred):
+            raise MapperError
+        elif isinstance(value, _Mapper):
+            _check_encoded(value.iterable.fields, value.iterable.mapping)
+
+
+def _encode_array(objects):
+    return ("[" + ",".join(objects) + "]").encode("utf-8")
+
+
+def _stream_array(objects):
+    # Array is encoded piece by piece, so neither entities nor encoded
+    # objects are kept in memory.
+    separator = b"["
+    for encoded in objects:
+        yield separator + encoded.encode("utf-8")
+        separator = b","
+    yield b"]" if separator == b"," else b"[]"
+
+
+def _get_dumps():
+    # Encoder is created on demand to keep the package import cheap.
+    from decimal import Decimal
+    from json import JSONEncoder
+    from uuid import UUID
+
+    def default(value):
+        if isinstance(value, (date, time)):
+            return value.isoformat()
+        elif isinstance(value, (Decimal, UUID)):
+            return str(value)
+        else:
+            raise TypeError
+
+    return JSONEncoder(separators=(",", ":"), default=default).encode
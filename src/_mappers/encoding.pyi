@@ -0,0 +1,23 @@
+from typing import Any
+from typing import Callable
+from typing import Generic
+from typing import Iterable
+from typing import Iterator
+from typing import TypeVar
+from typing import Union
+
+from _mappers.entities import _EntityClass
+from _mappers.entities import _EntityFields
+from _mappers.validation import _Mapping
+
+_T = TypeVar("_T")
+
+class JSON(Generic[_T]): ...
+
+_Converter = Callable[[Iterable[str]], Union[bytes, Iterator[bytes]]]
+
+def _get_json_converter(ret: Any, entity: _EntityClass) -> _Converter: ...
+def _check_encoded(fields: _EntityFields, mapping: _Mapping) -> None: ...
+def _encode_array(objects: Iterable[str]) -> bytes: ...
+def _stream_array(objects: Iterable[str]) -> Iterator[bytes]: ...
+def _get_dumps() -> Callable[[Any], str]: ...
@@ -1,21 +1,31 @@
-from _mappers.entities import attrs
-from _mappers.entities import dataclasses
-from _mappers.entities import pydantic
-from _mappers.exceptions import MapperError
-
-
-def _entity_factory(entity):
-    if dataclasses._is_dataclass(entity):
-        fields = dataclasses._get_fields(entity)
-        factory = dataclasses._get_factory(fields, entity)
-        return fields, factory
-    elif pydantic._is_pydantic(entity):
-        fields = pydantic._get_fields(entity)
-        factory = pydantic._get_factory(fields, entity)
-        return fields, factory
-    elif attrs._is_attrs(entity):
-        fields = attrs._get_fields(entity)
-        factory = attrs._get_factory(fields, entity)
-        return fields, factory
-    else:
-        raise MapperError
+from _mappers.configuration import _get_shared
+from _mappers.registry import _Registry
+
+
+_registry = _Registry(
+    "_get_factory",
+    [
+        ("dataclasses", "_mappers.entities.dataclasses", "_is_dataclass"),
+        ("pydantic", "_mappers.entities.pydantic", "_is_pydantic"),
+        ("attr", "_mappers.entities.attrs", "_is_attrs"),
+        ("msgspec", "_mappers.entities.msgspec", "_is_struct"),
+        (None, "_mappers.entities.namedtuples", "_is_namedtuple"),
+    ],
+)
+
+
+def _entity_factory(entity, trusted):
+    return _get_shared(_build_entity_factory, (entity, trusted), entity, trusted)
+
+
+def _build_entity_factory(entity, trusted):
+    backend = _registry.get(entity)
+    fields = backend.get_fields(entity)
+    factory = backend.build(fields, entity, trusted)
+    return fields, factory
+
+
+def _entity_hooks(entity):
+    # Hooks are defined by built-in backends only.
+    has_hooks = getattr(_registry.get(entity).adapter, "_has_hooks", None)
+    return has_hooks is not None and has_hooks(entity)
@@ -6,11 +6,14 @@ from typing import Type
 from typing_extensions import Protocol
 from typing_extensions import TypedDict
 
+from _mappers.registry import _Registry
+
 _FieldName = str
 
 class _FieldDef(TypedDict):
     is_optional: bool
     is_entity: bool
+    is_collection: bool
     type: Type[Any]
 
 _EntityField = Tuple[_FieldName, _FieldDef]
@@ -24,4 +27,12 @@ _EntityClass = Type[_Entity]
 class _EntityFactory(Protocol):
     def __call__(self, *row: Any) -> _Entity: ...
 
-def _entity_factory(entity: Any) -> Tuple[_EntityFields, _EntityFactory]: ...
+_registry: _Registry
+
+def _entity_factory(
+    entity: Any, trusted: bool
+) -> Tuple[_EntityFields, _EntityFactory]: ...
+def _build_entity_factory(
+    entity: Any, trusted: bool
+) -> Tuple[_EntityFields, _EntityFactory]: ...
+def _entity_hooks(entity: Any) -> bool: ...
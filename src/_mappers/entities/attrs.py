@@ -2,7 +2,8 @@ from __future__ import absolute_import
 
 import inspect
 
-from _mappers.compat import _is_optional
+from _mappers.entities.common import _compile_fast_factory
+from _mappers.entities.common import _get_field_def
 
 try:
     import attr
@@ -21,17 +22,20 @@ def _is_attrs(entity):
 
 def _get_fields(entity):
     return [
-        (
-            attribute.name,
-            {
-                "is_optional": _is_optional(attribute.type),
-                "is_entity": _is_attrs(attribute.type),
-                "type": attribute.type,
-            },
-        )
+        (attribute.name, _get_field_def(attribute.type, _is_attrs))
         for attribute in entity.__attrs_attrs__
     ]
 
 
-def _get_factory(fields, entity):
-    return entity
+def _get_factory(fields, entity, trusted):
+    if trusted and not _has_hooks(entity):
+        return _compile_fast_factory(fields, entity)
+    else:
+        return entity
+
+
+def _has_hooks(entity):
+    return hasattr(entity, "__attrs_post_init__") or any(
+        getattr(attribute, "converter", None) is not None
+        for attribute in entity.__attrs_attrs__
+    )
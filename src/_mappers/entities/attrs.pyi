@@ -6,4 +6,7 @@ from _mappers.entities import _EntityFields
 
 def _is_attrs(entity: Any) -> bool: ...
 def _get_fields(entity: _EntityClass) -> _EntityFields: ...
-def _get_factory(fields: _EntityFields, entity: _EntityClass) -> _EntityFactory: ...
+def _get_factory(
+    fields: _EntityFields, entity: _EntityClass, trusted: bool
+) -> _EntityFactory: ...
+def _has_hooks(entity: _EntityClass) -> bool: ...
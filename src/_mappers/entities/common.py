@@ -0,0 +1,42 @@
+from types import MemberDescriptorType
+
+from _mappers.compat import _get_list_item
+from _mappers.compat import _is_optional
+
+
+def _get_field_def(t, is_entity):
+    item = _get_list_item(t)
+    is_collection = is_entity(item)
+    return {
+        "is_optional": _is_optional(t),
+        "is_entity": is_collection or is_entity(t),
+        "is_collection": is_collection,
+        "type": item if is_collection else t,
+    }
+
+
+def _compile_fast_factory(fields, entity):
+    # Instances are created without calling the generated constructor.
+    # Values are stored into slots or into the instance dictionary
+    # directly, so frozen classes are supported as well.
+    namespace = {"new": object.__new__, "entity": entity}
+    arguments = []
+    lines = ["    instance = new(entity)"]
+    for index, (name, _field_type) in enumerate(fields):
+        argument = "value_{:d}".format(index)
+        arguments.append(argument)
+        lines.append(_build_field_setter(entity, name, argument, namespace))
+    lines.append("    return instance")
+    source = "def factory({}):\n{}\n".format(", ".join(arguments), "\n".join(lines))
+    exec(compile(source, "<mappers>", "exec"), namespace)  # nosec
+    return namespace["factory"]
+
+
+def _build_field_setter(entity, name, argument, namespace):
+    descriptor = getattr(entity, name, None)
+    if isinstance(descriptor, MemberDescriptorType):
+        setter = "set_{}".format(name)
+        namespace[setter] = descriptor.__set__
+        return "    {}(instance, {})".format(setter, argument)
+    else:
+        return "    instance.__dict__[{!r}] = {}".format(name, argument)
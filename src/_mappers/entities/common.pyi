@@ -0,0 +1,16 @@
+from typing import Any
+from typing import Callable
+from typing import Dict
+
+from _mappers.entities import _EntityClass
+from _mappers.entities import _EntityFactory
+from _mappers.entities import _EntityFields
+from _mappers.entities import _FieldDef
+
+def _get_field_def(t: Any, is_entity: Callable[[Any], bool]) -> _FieldDef: ...
+def _compile_fast_factory(
+    fields: _EntityFields, entity: _EntityClass
+) -> _EntityFactory: ...
+def _build_field_setter(
+    entity: _EntityClass, name: str, argument: str, namespace: Dict[str, Any]
+) -> str: ...
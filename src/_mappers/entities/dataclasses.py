@@ -2,7 +2,8 @@ from __future__ import absolute_import
 
 import inspect
 
-from _mappers.compat import _is_optional
+from _mappers.entities.common import _compile_fast_factory
+from _mappers.entities.common import _get_field_def
 
 
 try:
@@ -22,17 +23,36 @@ def _is_dataclass(entity):
 
 def _get_fields(entity):
     return [
-        (
-            field.name,
-            {
-                "is_optional": _is_optional(field.type),
-                "is_entity": _is_dataclass(field.type),
-                "type": field.type,
-            },
-        )
+        (field.name, _get_field_def(field.type, _is_dataclass))
         for field in dataclasses.fields(entity)
     ]
 
 
-def _get_factory(fields, entity):
-    return entity
+def _get_factory(fields, entity, trusted):
+    if trusted and _is_pydantic_dataclass(entity):
+        return _get_unvalidated_factory(fields, entity)
+    elif trusted and not _has_hooks(entity):
+        return _compile_fast_factory(fields, entity)
+    else:
+        return entity
+
+
+def _has_hooks(entity):
+    # Trusted pydantic dataclass is created without its hooks.
+    return not _is_pydantic_dataclass(entity) and hasattr(entity, "__post_init__")
+
+
+def _is_pydantic_dataclass(entity):
+    return getattr(entity, "__pydantic_model__", None) is not None
+
+
+def _get_unvalidated_factory(fields, entity):
+    names = tuple(name for name, _field_type in fields)
+
+    def factory(*row):
+        instance = object.__new__(entity)
+        instance.__dict__.update(zip(names, row))
+        instance.__dict__["__pydantic_initialised__"] = True
+        return instance
+
+    return factory
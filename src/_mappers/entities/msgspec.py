@@ -0,0 +1,44 @@
+from __future__ import absolute_import
+
+from _mappers.entities.common import _get_field_def
+
+try:
+    import msgspec
+
+    IS_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    IS_AVAILABLE = False
+
+
+def _is_struct(entity):
+    if IS_AVAILABLE:
+        return isinstance(entity, type) and issubclass(entity, msgspec.Struct)
+    else:
+        return False  # pragma: no cover
+
+
+def _get_fields(entity):
+    return [
+        (field.name, _get_field_def(field.type, _is_struct))
+        for field in msgspec.structs.fields(entity)
+    ]
+
+
+def _get_factory(fields, entity, trusted):
+    if trusted:
+        return _get_constructor(fields, entity)
+    names = tuple(field.encode_name for field in msgspec.structs.fields(entity))
+    return lambda *row: msgspec.convert(dict(zip(names, row)), entity)
+
+
+def _has_hooks(entity):
+    return hasattr(entity, "__post_init__")
+
+
+def _get_constructor(fields, entity):
+    # Struct constructor does not validate values.  It is the fastest
+    # way to create an instance if every field could be positional.
+    if entity.__match_args__ == entity.__struct_fields__:
+        return entity
+    names = tuple(name for name, _field_type in fields)
+    return lambda *row: entity(**dict(zip(names, row)))
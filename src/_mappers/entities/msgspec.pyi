@@ -0,0 +1,13 @@
+from _mappers.entities import _EntityClass
+from _mappers.entities import _EntityFactory
+from _mappers.entities import _EntityFields
+
+IS_AVAILABLE: bool
+
+def _is_struct(entity: object) -> bool: ...
+def _get_fields(entity: _EntityClass) -> _EntityFields: ...
+def _get_factory(
+    fields: _EntityFields, entity: _EntityClass, trusted: bool
+) -> _EntityFactory: ...
+def _has_hooks(entity: _EntityClass) -> bool: ...
+def _get_constructor(fields: _EntityFields, entity: _EntityClass) -> _EntityFactory: ...
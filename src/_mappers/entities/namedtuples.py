@@ -0,0 +1,56 @@
+from typing import Any
+from typing import NamedTuple
+
+from _mappers.configuration import _get_shared
+from _mappers.entities.common import _get_field_def
+from _mappers.exceptions import MapperError
+
+
+def _is_namedtuple(entity):
+    return (
+        isinstance(entity, type)
+        and issubclass(entity, tuple)
+        and hasattr(entity, "_fields")
+    )
+
+
+def _get_fields(entity):
+    types = getattr(entity, "__annotations__", {})
+    return [
+        (name, _get_field_def(types.get(name, Any), _is_namedtuple))
+        for name in entity._fields
+    ]
+
+
+def _get_factory(fields, entity, trusted):
+    new = tuple.__new__
+    return lambda *row: new(entity, row)
+
+
+def _get_read_model(name, fields):
+    key = (name, tuple(fields))
+    return _get_shared(_build_read_model, key, key)
+
+
+def _build_read_model(key):
+    name, fields = key
+    try:
+        read_model = NamedTuple(name, list(fields))
+    except ValueError:
+        # Field names should be identifiers without leading underscore.
+        raise MapperError
+    read_model._read_model_key = key
+    read_model.__reduce__ = _reduce_read_model
+    return read_model
+
+
+def _reduce_read_model(entity):
+    # Generated classes are not module attributes.  Entities are pickled
+    # together with the definition of their class, which is generated
+    # again on unpickling.
+    name, fields = type(entity)._read_model_key
+    return _restore_read_model, (name, fields, tuple(entity))
+
+
+def _restore_read_model(name, fields, values):
+    return tuple.__new__(_get_read_model(name, list(fields)), values)
@@ -0,0 +1,33 @@
+from typing import Any
+from typing import Callable
+from typing import List
+from typing import Tuple
+from typing import Type
+
+from _mappers.entities import _EntityClass
+from _mappers.entities import _EntityFactory
+from _mappers.entities import _EntityFields
+
+def _is_namedtuple(entity: Any) -> bool: ...
+def _get_fields(entity: _EntityClass) -> _EntityFields: ...
+def _get_factory(
+    fields: _EntityFields, entity: _EntityClass, trusted: bool
+) -> _EntityFactory: ...
+
+_ReadModelField = Tuple[str, Any]
+
+_ReadModelKey = Tuple[str, Tuple[_ReadModelField, ...]]
+
+def _get_read_model(
+    name: str, fields: List[_ReadModelField]
+) -> Type[Tuple[Any, ...]]: ...
+def _build_read_model(key: _ReadModelKey) -> Type[Tuple[Any, ...]]: ...
+def _reduce_read_model(
+    entity: Tuple[Any, ...]
+) -> Tuple[
+    Callable[..., Tuple[Any, ...]],
+    Tuple[str, Tuple[_ReadModelField, ...], Tuple[Any, ...]],
+]: ...
+def _restore_read_model(
+    name: str, fields: Tuple[_ReadModelField, ...], values: Tuple[Any, ...]
+) -> Tuple[Any, ...]: ...
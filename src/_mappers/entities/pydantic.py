@@ -2,6 +2,7 @@ from __future__ import absolute_import
 
 import inspect
 
+from _mappers.compat import _get_list_item
 
 try:
     import pydantic
@@ -25,6 +26,7 @@ def _get_fields(entity):
             {
                 "is_optional": field.allow_none,
                 "is_entity": _is_pydantic(field.type_),
+                "is_collection": _is_pydantic(_get_list_item(field.outer_type_)),
                 "type": field.type_,
             },
         )
@@ -32,5 +34,7 @@ def _get_fields(entity):
     ]
 
 
-def _get_factory(fields, entity):
-    return lambda *row: entity(**{k: v for (k, t), v in zip(fields, row)})
+def _get_factory(fields, entity, trusted):
+    names = tuple(name for name, _field_type in fields)
+    create = entity.construct if trusted else entity
+    return lambda *row: create(**dict(zip(names, row)))
@@ -6,4 +6,6 @@ from _mappers.entities import _EntityFields
 
 def _is_pydantic(entity: Any) -> bool: ...
 def _get_fields(entity: _EntityClass) -> _EntityFields: ...
-def _get_factory(fields: _EntityFields, entity: _EntityClass) -> _EntityFactory: ...
+def _get_factory(
+    fields: _EntityFields, entity: _EntityClass, trusted: bool
+) -> _EntityFactory: ...
@@ -2,3 +2,15 @@ class MapperError(Exception):
     """Broken mapper configuration error."""
 
     pass
+
+
+class NotFoundError(LookupError):
+    """Raw query returned no rows for a single entity."""
+
+    pass
+
+
+class MultipleResultsError(LookupError):
+    """Raw query returned many rows for a single entity."""
+
+    pass
@@ -1 +1,3 @@
 class MapperError(Exception): ...
+class NotFoundError(LookupError): ...
+class MultipleResultsError(LookupError): ...
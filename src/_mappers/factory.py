@@ -1,25 +1,41 @@
+from _mappers.configuration import _get_configuration
 from _mappers.entities import _entity_factory
 from _mappers.exceptions import MapperError
 from _mappers.mapper import _LazyMapper
 from _mappers.mapper import _Mapper
 from _mappers.sources import _data_source_factory
+from _mappers.sources import _read_model_factory
 from _mappers.validation import _validate
 
 
-def mapper_factory(entity=None, data_source=None, config=None):
-    """Define declarative mapper from data source to domain entity."""
+def mapper_factory(
+    entity=None, data_source=None, config=None, trusted=False, chunk_size=None
+):
+    """Define declarative mapper from data source to domain entity.
+
+    Trusted mappers skip entity validation which entity library may
+    perform on instantiation.  Use it only for values read from your
+    own typed columns.
+
+    Chunk size is used by readers returning an iterator of entities.
+
+    If only data source and config are given, immutable entity class is
+    generated from the config with field types of the data source.
+    """
     entity, data_source, config = _decompose(entity, data_source, config)
     if not isinstance(config, dict):
         raise MapperError
     if entity and data_source:
-        iterable = _configure(entity, data_source, config)
-        return _Mapper(entity, data_source, config, iterable)
+        iterable = _get_configuration(_configure, entity, data_source, config, trusted)
+        return _Mapper(entity, data_source, config, iterable, chunk_size)
     else:
         return _LazyMapper(config)
 
 
 def _decompose(*args):
     args = tuple(filter(None, args))
+    if len(args) == 2 and isinstance(args[1], dict):
+        return _data_source_and_config(*args)
     return arguments[len(args)](*args)
 
 
@@ -35,6 +51,10 @@ def _entity_and_data_source(entity, data_source):
     return entity, data_source, {}
 
 
+def _data_source_and_config(data_source, config):
+    return _read_model_factory(data_source, config), data_source, config
+
+
 def _everything(entity, data_source, config):
     return entity, data_source, config
 
@@ -47,9 +67,11 @@ arguments = {
 }
 
 
-def _configure(entity, data_source, config):
-    fields, entity_factory = _entity_factory(entity)
+def _configure(entity, data_source, config, trusted):
+    fields, entity_factory = _entity_factory(entity, trusted)
     data_source_fields, data_source_factory = _data_source_factory(data_source)
-    mapping = _validate(dict(fields), data_source_fields, config, data_source)
+    mapping = _validate(
+        entity, dict(fields), data_source_fields, config, data_source, trusted
+    )
     iterable = data_source_factory(fields, entity_factory, mapping)
     return iterable
@@ -8,16 +8,34 @@ from _mappers.mapper import _Config
 from _mappers.mapper import _LazyMapper
 from _mappers.mapper import _Mapper
 from _mappers.sources import _DataSource
-from _mappers.sources.django import _ValuesList
+from _mappers.sources import _Iterable
 @overload
 def mapper_factory() -> _LazyMapper: ...
 @overload
-def mapper_factory(entity: _Entity, data_source: _DataSource) -> _Mapper: ...
+def mapper_factory(
+    entity: _Entity,
+    data_source: _DataSource,
+    *,
+    trusted: bool = ...,
+    chunk_size: Optional[int] = ...,
+) -> _Mapper: ...
 @overload
 def mapper_factory(config: _Config) -> _LazyMapper: ...
 @overload
 def mapper_factory(
-    entity: _Entity, data_source: _DataSource, config: _Config
+    data_source: _DataSource,
+    config: _Config,
+    *,
+    trusted: bool = ...,
+    chunk_size: Optional[int] = ...,
+) -> _Mapper: ...
+@overload
+def mapper_factory(
+    entity: _Entity,
+    data_source: _DataSource,
+    config: _Config,
+    trusted: bool = ...,
+    chunk_size: Optional[int] = ...,
 ) -> _Mapper: ...
 def _decompose(
     *args: Optional[Union[_Entity, _DataSource, _Config]]
@@ -27,9 +45,12 @@ def _config_only(config: _Config) -> Tuple[None, None, _Config]: ...
 def _entity_and_data_source(
     entity: _Entity, data_source: _DataSource
 ) -> Tuple[_Entity, _DataSource, _Config]: ...
+def _data_source_and_config(
+    data_source: _DataSource, config: _Config
+) -> Tuple[_Entity, _DataSource, _Config]: ...
 def _everything(
     entity: _Entity, data_source: _DataSource, config: _Config
 ) -> Tuple[_Entity, _DataSource, _Config]: ...
 def _configure(
-    entity: _Entity, data_source: _DataSource, config: _Config
-) -> _ValuesList: ...
+    entity: _Entity, data_source: _DataSource, config: _Config, trusted: bool
+) -> _Iterable: ...
@@ -1,8 +1,23 @@
 import operator
+from collections import OrderedDict
+from functools import partial
+from typing import Iterable
+from typing import Iterator
 from typing import List
 from typing import Optional
 
+from _mappers.caching import _CachedReader
+from _mappers.caching import LRUCache
+from _mappers.columns import _get_columns_converter
+from _mappers.columns import Columns
+from _mappers.compat import _is_coroutine_function
+from _mappers.compat import _is_dict_of
+from _mappers.encoding import _check_encoded
+from _mappers.encoding import _get_json_converter
+from _mappers.encoding import JSON
 from _mappers.exceptions import MapperError
+from _mappers.tracing import _is_tracing
+from _mappers.tracing import _trace
 
 
 class Evaluated(object):
@@ -12,58 +27,314 @@ class Evaluated(object):
         self.name = name
 
 
+class Deferred(object):
+    """Mark data source field as loaded on the first access."""
+
+    def __init__(self, name=None):
+        self.name = name
+
+
 class _LazyMapper(object):
     def __init__(self, config):
         self.config = config
 
 
 class _Mapper(object):
-    def __init__(self, entity, data_source, config, iterable):
+    def __init__(self, entity, data_source, config, iterable, chunk_size):
         self.entity = entity
         self.data_source = data_source
         self.config = config
         self.iterable = iterable
+        self.chunk_size = chunk_size
 
     @property
     def reader(self):
-        return _ReaderGetter(self.iterable, self.entity)
+        return _ReaderGetter(self.iterable, self.entity, self.chunk_size)
+
+    def batch_reader(self, key, batch_size=500):
+        return _BatchReaderGetter(self.iterable, self.entity, key, batch_size)
+
+    def projection(self):
+        if not hasattr(self.iterable, "projection"):
+            raise MapperError
+        return self.iterable.projection(self.data_source)
+
+    def writer(self, batch_size=None, ignore_conflicts=False):
+        if not hasattr(self.iterable, "writer"):
+            raise MapperError
+        return self.iterable.writer(self.data_source, batch_size, ignore_conflicts)
 
 
 class _ReaderGetter(object):
-    def __init__(self, iterable, entity):
+    def __init__(self, iterable, entity, chunk_size):
         self.iterable = iterable
         self.entity = entity
+        self.chunk_size = chunk_size
         self.ret = None
+        self.backend = None
+        self.namespace = None
+        self.is_chunked = False
+        self.parallel_options = None
 
     def __call__(self, f):
         if self.ret is None:
             self.ret = getattr(f, "__annotations__", {}).get("return")
-        return _Reader(f, self.iterable, self.entity, self.ret)
+        reader = self.build(f)
+        if self.backend is None:
+            return reader
+        elif _is_cacheable(reader):
+            return _CachedReader(reader, self.backend, self.namespace)
+        else:
+            raise MapperError
+
+    def build(self, f):
+        reader_class = self.get_reader_class(f)
+        _check_options(reader_class, self.is_chunked, self.parallel_options)
+        if reader_class is _ParallelReader:
+            options = self.parallel_options
+        else:
+            options = self.chunk_size
+        return reader_class(f, self.iterable, self.entity, self.ret, options)
+
+    def get_reader_class(self, f):
+        if _is_coroutine_function(f):
+            # Native coroutines are a syntax error on Python 2.
+            from _mappers.asynchronous import _AsyncReader
+
+            return _AsyncReader
+        elif self.ret == Columns[self.entity]:
+            return _ColumnsReader
+        elif _is_encoded(self.ret, self.entity):
+            return _JSONReader
+        elif self.parallel_options is not None:
+            return _ParallelReader
+        else:
+            return _Reader
 
     def of(self, ret):
         self.ret = ret
         return self
 
+    def chunked(self, chunk_size):
+        self.chunk_size = chunk_size
+        self.is_chunked = True
+        return self
+
+    def cached(self, backend=None, namespace=None):
+        self.backend = LRUCache() if backend is None else backend
+        self.namespace = namespace
+        return self
+
+    def parallel(self, processes=None, batch_size=10000, ordered=True):
+        if not hasattr(self.iterable, "parallel"):
+            raise MapperError
+        self.parallel_options = (processes, batch_size, ordered)
+        return self
+
+
+def _check_options(reader_class, is_chunked, parallel_options):
+    # Options of other readers would be silently ignored.
+    if parallel_options is not None and reader_class is not _ParallelReader:
+        raise MapperError
+    elif is_chunked and reader_class in (_ColumnsReader, _JSONReader, _ParallelReader):
+        raise MapperError
+
+
+def _is_encoded(ret, entity):
+    return ret in (JSON[entity], Iterator[JSON[entity]], Iterable[JSON[entity]])
+
+
+def _is_cacheable(reader):
+    # Iterators and coroutines could be consumed only once.
+    return isinstance(reader, _Reader) and reader.ret not in (
+        Iterator[reader.entity],
+        Iterable[reader.entity],
+        Iterator[JSON[reader.entity]],
+        Iterable[JSON[reader.entity]],
+    )
+
 
 class _Reader(object):
-    def __init__(self, f, iterable, entity, ret):
+    def __init__(self, f, iterable, entity, ret, chunk_size):
         self.f = f
         self.iterable = iterable
-        self.converter = _get_converter(ret, entity)
+        self.entity = entity
+        self.ret = ret
+        self.converter = _get_converter(ret, entity, chunk_size)
 
     def __call__(self, *args, **kwargs):
+        if _is_tracing():
+            return _trace(self, args, kwargs)
+        return self.read(*args, **kwargs)
+
+    def read(self, *args, **kwargs):
         return self.converter(self.raw(*args, **kwargs))
 
     def raw(self, *args, **kwargs):
         return self.iterable(self.f(*args, **kwargs))
 
+    def explain(self, *args, **kwargs):
+        if not hasattr(self.iterable, "explain"):
+            raise MapperError
+        return self.iterable.explain(self.f(*args, **kwargs))
+
+
+class _ColumnsReader(_Reader):
+    def __init__(self, f, iterable, entity, ret, chunk_size):
+        self.f = f
+        self.iterable = iterable
+        self.entity = entity
+        self.ret = ret
+        self.converter = _get_columns_converter(iterable.fields, iterable.mapping)
+
+    def raw(self, *args, **kwargs):
+        return self.iterable.columnar(self.f(*args, **kwargs))
 
-def _get_converter(ret, entity):
+
+class _JSONReader(_Reader):
+    def __init__(self, f, iterable, entity, ret, chunk_size):
+        if not hasattr(iterable, "encoded"):
+            raise MapperError
+        _check_encoded(iterable.fields, iterable.mapping)
+        self.f = f
+        self.iterable = iterable
+        self.entity = entity
+        self.ret = ret
+        self.converter = _get_json_converter(ret, entity)
+
+    def raw(self, *args, **kwargs):
+        return self.iterable.encoded(self.f(*args, **kwargs))
+
+
+class _ParallelReader(_Reader):
+    def __init__(self, f, iterable, entity, ret, options):
+        self.f = f
+        self.iterable = iterable
+        self.entity = entity
+        self.ret = ret
+        self.options = options
+        self.converter = _get_parallel_converter(ret, entity)
+
+    def raw(self, *args, **kwargs):
+        return self.iterable.parallel(self.f(*args, **kwargs), *self.options)
+
+
+class _BatchReaderGetter(_ReaderGetter):
+    def __init__(self, iterable, entity, key, batch_size):
+        super(_BatchReaderGetter, self).__init__(iterable, entity, None)
+        if not hasattr(iterable, "lookup"):
+            raise MapperError
+        self.key = key
+        self.lookup = iterable.lookup(key)
+        self.batch_size = batch_size
+
+    def cached(self, backend=None, namespace=None):
+        raise MapperError
+
+    def chunked(self, chunk_size):
+        raise MapperError
+
+    def parallel(self, processes=None, batch_size=10000, ordered=True):
+        raise MapperError
+
+    def build(self, f):
+        return _BatchReader(
+            f,
+            self.iterable,
+            self.entity,
+            self.ret,
+            self.key,
+            self.lookup,
+            self.batch_size,
+        )
+
+
+class _BatchReader(object):
+    def __init__(self, f, iterable, entity, ret, key, lookup, batch_size):
+        self.f = f
+        self.iterable = iterable
+        self.entity = entity
+        self.ret = ret
+        self.key = key
+        self.lookup = lookup
+        self.batch_size = batch_size
+        self.converter = _get_batch_converter(ret, entity)
+
+    def __call__(self, keys, *args, **kwargs):
+        if _is_tracing():
+            return _trace(self, (keys,) + args, kwargs)
+        return self.read(keys, *args, **kwargs)
+
+    def read(self, keys, *args, **kwargs):
+        keys = list(keys)
+        entities = self.raw(keys, *args, **kwargs)
+        found = {getattr(entity, self.key): entity for entity in entities}
+        return self.converter(keys, found)
+
+    def raw(self, keys, *args, **kwargs):
+        queryset = self.f(*args, **kwargs)
+        keys = list(OrderedDict.fromkeys(keys))
+        for start in range(0, len(keys), self.batch_size):
+            end = start + self.batch_size
+            for entity in self.iterable(self.lookup(queryset, keys[start:end])):
+                yield entity
+
+
+def _get_converter(ret, entity, chunk_size):
     if ret is entity:
         return operator.methodcaller("get")
     elif ret == List[entity]:
         return list
     elif ret == Optional[entity]:
         return operator.methodcaller("first")
+    elif ret in (Iterator[entity], Iterable[entity]):
+        return _get_iterator_converter(chunk_size)
+    else:
+        raise MapperError
+
+
+def _get_iterator_converter(chunk_size):
+    if chunk_size is None:
+        return operator.methodcaller("iterator")
+    else:
+        return partial(_iterate_chunked, chunk_size)
+
+
+def _iterate_chunked(chunk_size, result):
+    try:
+        return result.iterator(chunk_size=chunk_size)
+    except TypeError:
+        # QuerySet.iterator accepts chunk size since Django 2.0.
+        raise MapperError
+
+
+def _get_parallel_converter(ret, entity):
+    if ret == List[entity]:
+        return list
+    elif ret in (Iterator[entity], Iterable[entity]):
+        return iter
     else:
         raise MapperError
+
+
+def _get_batch_converter(ret, entity):
+    if _is_dict_of(ret, entity):
+        return _found_dict
+    elif ret == List[Optional[entity]]:
+        return _found_optional_list
+    elif ret == List[entity]:
+        return _found_list
+    else:
+        raise MapperError
+
+
+def _found_dict(keys, found):
+    return found
+
+
+def _found_optional_list(keys, found):
+    return [found.get(key) for key in keys]
+
+
+def _found_list(keys, found):
+    return [found[key] for key in keys if key in found]
@@ -2,24 +2,35 @@ from typing import _SpecialForm
 from typing import Any
 from typing import Callable
 from typing import Dict
+from typing import Hashable
 from typing import Iterable
+from typing import Iterator
+from typing import List
 from typing import Optional
 from typing import Tuple
+from typing import Type
 from typing import Union
 
+from _mappers.caching import _Backend
+from _mappers.columns import _Columns
 from _mappers.entities import _EntityClass
 from _mappers.sources import _DataSource
-from _mappers.sources.django import _ValuesList
+from _mappers.sources import _Iterable
+from _mappers.sources.common import _Projection
+from _mappers.sources.django import _BulkWriter
 
 _RelatedField = Tuple[str, ...]
 
-_ConfigValue = Union[str, _LazyMapper, Evaluated, _RelatedField]
+_ConfigValue = Union[str, _LazyMapper, Evaluated, Deferred, _RelatedField]
 
 _Config = Dict[str, _ConfigValue]
 
 class Evaluated:
     def __init__(self, name: Optional[str] = ...) -> None: ...
 
+class Deferred:
+    def __init__(self, name: Optional[str] = ...) -> None: ...
+
 class _LazyMapper:
     def __init__(self, config: _Config) -> None: ...
 
@@ -29,25 +40,117 @@ class _Mapper:
         entity: _EntityClass,
         data_source: _DataSource,
         config: _Config,
-        iterable: _ValuesList,
+        iterable: _Iterable,
+        chunk_size: Optional[int],
     ) -> None: ...
     @property
     def reader(self) -> _ReaderGetter: ...
+    def batch_reader(self, key: str, batch_size: int = ...) -> _BatchReaderGetter: ...
+    def projection(self) -> _Projection: ...
+    def writer(
+        self, batch_size: Optional[int] = ..., ignore_conflicts: bool = ...
+    ) -> _BulkWriter: ...
 
 class _ReaderGetter:
-    def __init__(self, iterable: _ValuesList, entity: _EntityClass) -> None: ...
-    def __call__(self, f: Callable) -> _Reader: ...
+    def __init__(
+        self, iterable: _Iterable, entity: _EntityClass, chunk_size: Optional[int]
+    ) -> None: ...
+    def __call__(self, f: Callable) -> Any: ...
+    def build(self, f: Callable) -> Any: ...
+    def get_reader_class(self, f: Callable) -> Type[Any]: ...
     def of(self, ret: _SpecialForm) -> _ReaderGetter: ...
+    def chunked(self, chunk_size: int) -> _ReaderGetter: ...
+    def cached(
+        self, backend: Optional[_Backend] = ..., namespace: Optional[str] = ...
+    ) -> _ReaderGetter: ...
+    def parallel(
+        self, processes: Optional[int] = ..., batch_size: int = ..., ordered: bool = ...
+    ) -> _ReaderGetter: ...
+
+def _check_options(
+    reader_class: Type[Any], is_chunked: bool, parallel_options: Optional[_ParallelOptions]
+) -> None: ...
+def _is_encoded(ret: Any, entity: _EntityClass) -> bool: ...
+def _is_cacheable(reader: Any) -> bool: ...
 
 class _Reader:
+    f: Callable
+    iterable: _Iterable
+    entity: _EntityClass
+    ret: _SpecialForm
+    converter: Callable
     def __init__(
         self,
         f: Callable,
-        iterable: _ValuesList,
+        iterable: _Iterable,
         entity: _EntityClass,
         ret: _SpecialForm,
+        chunk_size: Optional[int],
     ) -> None: ...
     def __call__(self, *args: Any, **kwargs: Any) -> Any: ...
+    def read(self, *args: Any, **kwargs: Any) -> Any: ...
     def raw(self, *args: Any, **kwargs: Any) -> Iterable: ...
+    def explain(self, *args: Any, **kwargs: Any) -> str: ...
+
+class _ColumnsReader(_Reader):
+    def raw(self, *args: Any, **kwargs: Any) -> _Columns: ...
+
+class _JSONReader(_Reader):
+    def raw(self, *args: Any, **kwargs: Any) -> Iterator[str]: ...
+
+_ParallelOptions = Tuple[Optional[int], int, bool]
+
+class _ParallelReader(_Reader):
+    options: _ParallelOptions
+    def __init__(
+        self,
+        f: Callable,
+        iterable: _Iterable,
+        entity: _EntityClass,
+        ret: _SpecialForm,
+        options: _ParallelOptions,
+    ) -> None: ...
+    def raw(self, *args: Any, **kwargs: Any) -> Iterator[Any]: ...
+
+class _BatchReaderGetter(_ReaderGetter):
+    def __init__(
+        self, iterable: _Iterable, entity: _EntityClass, key: str, batch_size: int
+    ) -> None: ...
+    def chunked(self, chunk_size: int) -> _ReaderGetter: ...
+    def cached(
+        self, backend: Optional[_Backend] = ..., namespace: Optional[str] = ...
+    ) -> _ReaderGetter: ...
+    def parallel(
+        self, processes: Optional[int] = ..., batch_size: int = ..., ordered: bool = ...
+    ) -> _ReaderGetter: ...
+    def build(self, f: Callable) -> _BatchReader: ...
+
+_Found = Dict[Hashable, Any]
+
+class _BatchReader:
+    def __init__(
+        self,
+        f: Callable,
+        iterable: _Iterable,
+        entity: _EntityClass,
+        ret: _SpecialForm,
+        key: str,
+        lookup: Callable[[Any, List[Hashable]], Any],
+        batch_size: int,
+    ) -> None: ...
+    def __call__(self, keys: Iterable[Hashable], *args: Any, **kwargs: Any) -> Any: ...
+    def read(self, keys: Iterable[Hashable], *args: Any, **kwargs: Any) -> Any: ...
+    def raw(self, keys: Iterable[Hashable], *args: Any, **kwargs: Any) -> Iterable: ...
 
-def _get_converter(ret: _SpecialForm, entity: _EntityClass) -> Callable: ...
+def _get_converter(
+    ret: _SpecialForm, entity: _EntityClass, chunk_size: Optional[int]
+) -> Callable: ...
+def _get_iterator_converter(chunk_size: Optional[int]) -> Callable: ...
+def _iterate_chunked(chunk_size: int, result: Any) -> Iterator[Any]: ...
+def _get_parallel_converter(ret: _SpecialForm, entity: _EntityClass) -> Callable: ...
+def _get_batch_converter(
+    ret: _SpecialForm, entity: _EntityClass
+) -> Callable[[List[Hashable], _Found], Any]: ...
+def _found_dict(keys: List[Hashable], found: _Found) -> _Found: ...
+def _found_optional_list(keys: List[Hashable], found: _Found) -> List[Any]: ...
+def _found_list(keys: List[Hashable], found: _Found) -> List[Any]: ...
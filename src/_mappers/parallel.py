@@ -0,0 +1,52 @@
+from functools import partial
+
+from _mappers.exceptions import MapperError
+
+
+_jobs = {}
+
+
+def _parallel_map(job, get_tasks, processes, ordered):
+    # Workers are started on the first iteration, so iterators which are
+    # never consumed do not leave worker processes behind.
+    tasks = get_tasks()
+    # Jobs are closures over compiled getters which could not be
+    # pickled.  Workers get them in the memory copied on fork.
+    token = id(job)
+    _jobs[token] = job
+    try:
+        pool = _get_pool(processes)
+    finally:
+        del _jobs[token]
+    imap = pool.imap if ordered else pool.imap_unordered
+    for entity in _iterate(pool, imap(partial(_run, token), tasks)):
+        yield entity
+
+
+def _get_pool(processes):
+    # Multiprocessing is imported on demand to keep the package import cheap.
+    import multiprocessing
+
+    try:
+        context = multiprocessing.get_context("fork")
+    except AttributeError:
+        # We are on Python 2.7 which always forks worker processes.
+        context = multiprocessing
+    except ValueError:
+        # Fork is not available on Windows.
+        raise MapperError
+    return context.Pool(processes)
+
+
+def _run(token, task):
+    return _jobs[token](task)
+
+
+def _iterate(pool, batches):
+    try:
+        for batch in batches:
+            for entity in batch:
+                yield entity
+    finally:
+        pool.terminate()
+        pool.join()
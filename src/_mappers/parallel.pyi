@@ -0,0 +1,24 @@
+from multiprocessing.pool import Pool
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+
+from _mappers.entities import _Entity
+
+_Job = Callable[[Any], List[_Entity]]
+
+_jobs: Dict[int, _Job]
+
+def _parallel_map(
+    job: _Job,
+    get_tasks: Callable[[], Iterable[Any]],
+    processes: Optional[int],
+    ordered: bool,
+) -> Iterator[_Entity]: ...
+def _get_pool(processes: Optional[int]) -> Pool: ...
+def _run(token: int, task: Any) -> List[_Entity]: ...
+def _iterate(pool: Pool, batches: Iterable[List[_Entity]]) -> Iterator[_Entity]: ...
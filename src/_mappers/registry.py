@@ -0,0 +1,69 @@
+import sys
+from importlib import import_module
+
+from _mappers.configuration import cache_clear
+from _mappers.exceptions import MapperError
+
+
+class _Backend(object):
+    def __init__(self, detect, get_fields, build, adapter=None):
+        self.detect = detect
+        self.get_fields = get_fields
+        self.build = build
+        self.adapter = adapter
+
+
+class _Registry(object):
+    def __init__(self, build, builtins):
+        self.build = build
+        self.builtins = builtins
+        self.backends = []
+        self.dispatch = {}
+
+    def register(self, backend):
+        self.backends.insert(0, backend)
+        self.clear()
+
+    def unregister(self, detect):
+        self.backends = [
+            backend for backend in self.backends if backend.detect is not detect
+        ]
+        self.clear()
+
+    def clear(self):
+        # Configurations and projections built by the previous backend
+        # are dropped together with the detection result.
+        self.dispatch.clear()
+        cache_clear()
+
+    def get(self, value):
+        # Detection happens once per class.
+        key = value if isinstance(value, type) else type(value)
+        if key not in self.dispatch:
+            self.dispatch[key] = self.detect(value)
+        return self.dispatch[key]
+
+    def detect(self, value):
+        for backend in self.backends + self.loaded():
+            if backend.detect(value):
+                return backend
+        raise MapperError
+
+    def loaded(self):
+        # Values of the library which was never imported could not
+        # exist.  Its adapter is not imported either.
+        return [
+            _load_backend(module, detect, self.build)
+            for library, module, detect in self.builtins
+            if library is None or library in sys.modules
+        ]
+
+
+def _load_backend(module, detect, build):
+    adapter = import_module(module)
+    return _Backend(
+        getattr(adapter, detect),
+        adapter._get_fields,
+        getattr(adapter, build),
+        adapter,
+    )
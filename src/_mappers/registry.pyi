@@ -0,0 +1,40 @@
+from types import ModuleType
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Type
+
+_Detect = Callable[[Any], bool]
+
+_Builtin = Tuple[Optional[str], str, str]
+
+class _Backend:
+    detect: _Detect
+    get_fields: Callable[[Any], Any]
+    build: Callable[..., Any]
+    adapter: Optional[ModuleType]
+    def __init__(
+        self,
+        detect: _Detect,
+        get_fields: Callable[[Any], Any],
+        build: Callable[..., Any],
+        adapter: Optional[ModuleType] = ...,
+    ) -> None: ...
+
+class _Registry:
+    build: str
+    builtins: List[_Builtin]
+    backends: List[_Backend]
+    dispatch: Dict[Type[Any], _Backend]
+    def __init__(self, build: str, builtins: List[_Builtin]) -> None: ...
+    def register(self, backend: _Backend) -> None: ...
+    def unregister(self, detect: _Detect) -> None: ...
+    def clear(self) -> None: ...
+    def get(self, value: Any) -> _Backend: ...
+    def detect(self, value: Any) -> _Backend: ...
+    def loaded(self) -> List[_Backend]: ...
+
+def _load_backend(module: str, detect: str, build: str) -> _Backend: ...
@@ -1,10 +1,30 @@
+from functools import partial
+
+from _mappers.entities.namedtuples import _get_read_model
 from _mappers.exceptions import MapperError
-from _mappers.sources import django
+from _mappers.registry import _Registry
+
+
+_registry = _Registry(
+    "_factory",
+    [
+        ("django.db.models", "_mappers.sources.django", "_is_django_model"),
+        ("sqlalchemy", "_mappers.sources.sqlalchemy", "_is_sqlalchemy_model"),
+        (None, "_mappers.sources.dbapi", "_is_description"),
+    ],
+)
 
 
 def _data_source_factory(data_source):
-    if django._is_django_model(data_source):
-        fields = django._get_fields(data_source)
-        return fields, django._factory
-    else:
+    backend = _registry.get(data_source)
+    fields = backend.get_fields(data_source)
+    return fields, partial(backend.build, data_source)
+
+
+def _read_model_factory(data_source, config):
+    backend = _registry.get(data_source)
+    if not hasattr(backend.adapter, "_get_read_model_fields"):
         raise MapperError
+    name = data_source.__name__ + "Projection"
+    fields = backend.adapter._get_read_model_fields(data_source, config)
+    return _get_read_model(name, fields)
@@ -3,13 +3,21 @@ from typing import Callable
 from typing import Dict
 from typing import Optional
 from typing import Tuple
+from typing import Type
+from typing import Union
 
 from typing_extensions import TypedDict
 
 from _mappers.entities import _EntityFactory
 from _mappers.entities import _EntityFields
+from _mappers.mapper import _Config
+from _mappers.registry import _Registry
+from _mappers.sources.dbapi import _Rows
+from _mappers.sources.dbapi import Description
 from _mappers.sources.django import _DjangoModel
 from _mappers.sources.django import _ValuesList
+from _mappers.sources.sqlalchemy import _Select
+from _mappers.sources.sqlalchemy import _SQLAlchemyModel
 from _mappers.validation import _Mapping
 
 _FieldName = str
@@ -18,15 +26,22 @@ class _FieldDef(TypedDict):
     is_nullable: bool
     is_link: bool
     is_collection: bool
-    link: Optional[_DjangoModel]
+    link: Optional[_DataSource]
     link_to: Any  # A recursive type actually.
 
 _DataSourceFields = Dict[_FieldName, _FieldDef]
 
-_DataSource = _DjangoModel
+_DataSource = Union[_DjangoModel, _SQLAlchemyModel, Description]
 
-_DataSourceFactory = Callable[[_EntityFields, _EntityFactory, _Mapping], _ValuesList]
+_Iterable = Union[_ValuesList, _Select, _Rows]
+
+_DataSourceFactory = Callable[[_EntityFields, _EntityFactory, _Mapping], _Iterable]
+
+_registry: _Registry
 
 def _data_source_factory(
     data_source: _DataSource,
 ) -> Tuple[_DataSourceFields, _DataSourceFactory]: ...
+def _read_model_factory(
+    data_source: _DataSource, config: _Config
+) -> Type[Tuple[Any, ...]]: ...
@@ -0,0 +1,206 @@
+from collections import namedtuple
+from collections import OrderedDict
+from itertools import islice
+
+from _mappers.encoding import _get_dumps
+from _mappers.mapper import _Mapper
+from _mappers.mapper import Deferred
+from _mappers.mapper import Evaluated
+from _mappers.tracing import _timed
+
+
+_Projection = namedtuple("Projection", ["columns", "joins", "offsets"])
+
+
+class _LazyFields(object):
+    def __init__(self, get_fields, *arguments):
+        self.get_fields = get_fields
+        self.arguments = arguments
+
+    def __getitem__(self, name):
+        return self.get_fields(*self.arguments)[name]
+
+
+def _get_mapping_key(mapping):
+    return frozenset(
+        (field, _get_mapping_value_key(value)) for field, value in mapping.items()
+    )
+
+
+def _get_mapping_value_key(value):
+    if isinstance(value, _Mapper):
+        # Nested projections are shared, so they are compared by identity.
+        return _Mapper, value.iterable
+    elif isinstance(value, (Evaluated, Deferred)):
+        return type(value), value.name
+    else:
+        return value
+
+
+def _deduplicate(columns, key=None):
+    # Entity fields mapped to the same column share its row offset.
+    # Columns are compared by the key, the first spelling is selected.
+    unique = OrderedDict()
+    indexes = []
+    for column in columns:
+        _column, index = unique.setdefault(
+            column if key is None else key(column), (column, len(unique))
+        )
+        indexes.append(index)
+    return tuple(column for column, _index in unique.values()), tuple(indexes)
+
+
+def _has_duplicates(indexes):
+    return len(set(indexes)) < len(indexes)
+
+
+def _transpose(rows, indexes, chunk_size=1000):
+    # Rows are transposed chunk by chunk, so neither the whole row list
+    # nor its transposed copy is kept in memory.  Rows are counted by
+    # the tracer, if any.
+    timed = _timed(tuple)
+    rows = iter(rows)
+    chunk = [timed(row) for row in islice(rows, chunk_size)]
+    while chunk:
+        columns = list(zip(*chunk))
+        yield [columns[index] for index in indexes]
+        chunk = [timed(row) for row in islice(rows, chunk_size)]
+
+
+def _compile_entity_getter(entity_factory, fields, mapping, indexes=None):
+    namespace = {}
+    expression, _offset = _build_entity_getter(
+        entity_factory, fields, mapping, 0, namespace, indexes
+    )
+    arguments = "row, lazy" if _has_lazy_fields(fields, mapping) else "row"
+    code = compile("lambda " + arguments + ": " + expression, "<mappers>", "eval")
+    return eval(code, namespace)  # nosec
+
+
+def _has_lazy_fields(fields, mapping):
+    return any(
+        _is_lazy_field(mapping[field], field_type) for field, field_type in fields
+    )
+
+
+def _is_lazy_field(value, field_type):
+    return isinstance(value, Deferred) or field_type["is_collection"]
+
+
+def _build_field_getter(offset, indexes):
+    index = offset if indexes is None else indexes[offset]
+    return "row[{:d}]".format(index), offset + 1
+
+
+def _build_lazy_getter(field, offset, indexes):
+    key, offset = _build_field_getter(offset, indexes)
+    return "lazy({!r}, {})".format(field, key), offset
+
+
+def _build_entity_getter(entity_factory, fields, mapping, offset, namespace, indexes):
+    name = "entity_{:d}".format(len(namespace))
+    namespace[name] = entity_factory
+    arguments = []
+
+    for field, field_type in fields:
+        target_field = mapping[field]
+        if _is_lazy_field(target_field, field_type):
+            argument, offset = _build_lazy_getter(field, offset, indexes)
+        elif isinstance(target_field, _Mapper):
+            argument, offset = _build_entity_getter(
+                target_field.iterable.entity_factory,
+                target_field.iterable.fields,
+                target_field.iterable.mapping,
+                offset,
+                namespace,
+                indexes,
+            )
+        else:
+            argument, offset = _build_field_getter(offset, indexes)
+        arguments.append(argument)
+
+    return "{}({})".format(name, ", ".join(arguments)), offset
+
+
+def _get_encoder(encoders, fields, mapping, indexes=None):
+    if indexes not in encoders:
+        encoders[indexes] = _compile_encoder(fields, mapping, indexes)
+    return _timed(encoders[indexes])
+
+
+def _compile_encoder(fields, mapping, indexes):
+    dumps = _get_dumps()
+    expression, _offset = _build_object_encoder(fields, mapping, 0, indexes, dumps)
+    code = compile("lambda row: " + expression, "<mappers>", "eval")
+    return eval(code, {"dumps": dumps})  # nosec
+
+
+def _build_object_encoder(fields, mapping, offset, indexes, dumps):
+    # Keys are encoded once at compile time, only values are encoded
+    # for every row.
+    parts = []
+    separator = "{"
+
+    for field, _field_type in fields:
+        target_field = mapping[field]
+        if isinstance(target_field, _Mapper):
+            value, offset = _build_object_encoder(
+                target_field.iterable.fields,
+                target_field.iterable.mapping,
+                offset,
+                indexes,
+                dumps,
+            )
+        else:
+            key, offset = _build_field_getter(offset, indexes)
+            value = "dumps({})".format(key)
+        parts.append(repr(separator + dumps(field) + ":"))
+        parts.append(value)
+        separator = ","
+
+    parts.append(repr("}" if parts else "{}"))
+    return " + ".join(parts), offset
+
+
+def _encode(encoder, rows):
+    for row in rows:
+        yield encoder(row)
+
+
+def _get_projection(fields, mapping, columns, joins, indexes=None):
+    return _Projection(columns, joins, _get_offsets(fields, mapping, indexes))
+
+
+def _get_joins(columns, separator):
+    joins = OrderedDict()
+    for column in columns:
+        path = column.split(separator)
+        for index in range(1, len(path)):
+            joins[separator.join(path[:index])] = None
+    return tuple(joins)
+
+
+def _get_offsets(fields, mapping, indexes):
+    offsets = OrderedDict()
+    _collect_offsets(fields, mapping, "", 0, offsets)
+    if indexes is not None:
+        for field, offset in offsets.items():
+            offsets[field] = indexes[offset]
+    return offsets
+
+
+def _collect_offsets(fields, mapping, prefix, offset, offsets):
+    for field, field_type in fields:
+        value = mapping[field]
+        if isinstance(value, _Mapper) and not field_type["is_collection"]:
+            offset = _collect_offsets(
+                value.iterable.fields,
+                value.iterable.mapping,
+                prefix + field + ".",
+                offset,
+                offsets,
+            )
+        else:
+            offsets[prefix + field] = offset
+            offset += 1
+    return offset
@@ -0,0 +1,101 @@
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import FrozenSet
+from typing import Hashable
+from typing import Iterable
+from typing import Iterator
+from typing import NamedTuple
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+from _mappers.columns import _Columns
+from _mappers.entities import _EntityFactory
+from _mappers.entities import _EntityFields
+from _mappers.entities import _FieldDef as _EntityFieldDef
+from _mappers.sources import _DataSourceFields
+from _mappers.sources import _FieldDef
+from _mappers.sources import _FieldName
+from _mappers.validation import _Mapping
+
+class _Projection(NamedTuple):
+    columns: Tuple[str, ...]
+    joins: Tuple[str, ...]
+    offsets: Dict[str, int]
+
+class _LazyFields:
+    def __init__(
+        self, get_fields: Callable[..., _DataSourceFields], *arguments: Any
+    ) -> None: ...
+    def __getitem__(self, name: _FieldName) -> _FieldDef: ...
+
+def _get_mapping_key(mapping: _Mapping) -> FrozenSet[Tuple[str, Hashable]]: ...
+def _get_mapping_value_key(value: Any) -> Hashable: ...
+def _deduplicate(
+    columns: Iterable[Hashable], key: Optional[Callable[[Any], Hashable]] = ...
+) -> Tuple[Tuple[Any, ...], Tuple[int, ...]]: ...
+def _has_duplicates(indexes: Sequence[int]) -> bool: ...
+def _transpose(
+    rows: Iterable[Sequence[Any]], indexes: Sequence[int], chunk_size: int = ...
+) -> Iterator[_Columns]: ...
+def _compile_entity_getter(
+    entity_factory: _EntityFactory,
+    fields: _EntityFields,
+    mapping: _Mapping,
+    indexes: Optional[Sequence[int]] = ...,
+) -> Callable: ...
+def _has_lazy_fields(fields: _EntityFields, mapping: _Mapping) -> bool: ...
+def _is_lazy_field(value: Any, field_type: _EntityFieldDef) -> bool: ...
+def _build_lazy_getter(
+    field: str, offset: int, indexes: Optional[Sequence[int]]
+) -> Tuple[str, int]: ...
+def _build_field_getter(
+    offset: int, indexes: Optional[Sequence[int]]
+) -> Tuple[str, int]: ...
+def _build_entity_getter(
+    entity_factory: _EntityFactory,
+    fields: _EntityFields,
+    mapping: _Mapping,
+    offset: int,
+    namespace: Dict[str, _EntityFactory],
+    indexes: Optional[Sequence[int]],
+) -> Tuple[str, int]: ...
+
+_Encoder = Callable[[Sequence[Any]], str]
+
+def _get_encoder(
+    encoders: Dict[Optional[Tuple[int, ...]], _Encoder],
+    fields: _EntityFields,
+    mapping: _Mapping,
+    indexes: Optional[Tuple[int, ...]] = ...,
+) -> _Encoder: ...
+def _compile_encoder(
+    fields: _EntityFields, mapping: _Mapping, indexes: Optional[Tuple[int, ...]]
+) -> _Encoder: ...
+def _build_object_encoder(
+    fields: _EntityFields,
+    mapping: _Mapping,
+    offset: int,
+    indexes: Optional[Sequence[int]],
+    dumps: Callable[[Any], str],
+) -> Tuple[str, int]: ...
+def _encode(encoder: _Encoder, rows: Iterable[Sequence[Any]]) -> Iterator[str]: ...
+def _get_projection(
+    fields: _EntityFields,
+    mapping: _Mapping,
+    columns: Tuple[str, ...],
+    joins: Tuple[str, ...],
+    indexes: Optional[Sequence[int]] = ...,
+) -> _Projection: ...
+def _get_joins(columns: Tuple[str, ...], separator: str) -> Tuple[str, ...]: ...
+def _get_offsets(
+    fields: _EntityFields, mapping: _Mapping, indexes: Optional[Sequence[int]]
+) -> Dict[str, int]: ...
+def _collect_offsets(
+    fields: _EntityFields,
+    mapping: _Mapping,
+    prefix: str,
+    offset: int,
+    offsets: Dict[str, int],
+) -> int: ...
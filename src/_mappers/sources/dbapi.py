@@ -0,0 +1,142 @@
+from _mappers.exceptions import MapperError
+from _mappers.exceptions import MultipleResultsError
+from _mappers.exceptions import NotFoundError
+from _mappers.mapper import Evaluated
+from _mappers.sources.common import _compile_entity_getter
+from _mappers.sources.common import _encode
+from _mappers.sources.common import _get_encoder
+from _mappers.sources.common import _get_projection
+from _mappers.sources.common import _transpose
+from _mappers.tracing import _timed
+
+
+class Description(object):
+    """Describe columns of the raw SQL query result.
+
+    Columns could be given as names or as DB-API cursor description.
+    """
+
+    def __init__(self, description):
+        self.columns = tuple(_get_column(column) for column in description)
+
+    def __eq__(self, other):
+        return isinstance(other, Description) and self.columns == other.columns
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self.columns)
+
+
+def _get_column(column):
+    if isinstance(column, str):
+        return column, False
+    else:
+        return column[0], len(column) > 6 and bool(column[6])
+
+
+def _is_description(data_source):
+    return isinstance(data_source, Description)
+
+
+def _get_fields(data_source):
+    return {
+        name: {"is_nullable": is_nullable, "is_link": False, "is_collection": False}
+        for name, is_nullable in data_source.columns
+    }
+
+
+def _factory(data_source, fields, entity_factory, mapping):
+    return _Rows(fields, entity_factory, mapping, _get_names(fields, mapping))
+
+
+class _Rows(object):
+    def __init__(self, fields, entity_factory, mapping, names):
+        self.fields = fields
+        self.entity_factory = entity_factory
+        self.mapping = mapping
+        self.names = names
+        self.getters = {}
+        self.encoders = {}
+
+    def __call__(self, cursor):
+        return _Result(cursor, _timed(self.getter(cursor.description)))
+
+    def columnar(self, cursor):
+        key = _get_key(cursor.description)
+        # Rows are fetched in chunks.
+        return _transpose(_Result(cursor, tuple), self.indexes(key))
+
+    def encoded(self, cursor):
+        indexes = tuple(self.indexes(_get_key(cursor.description)))
+        encoder = _get_encoder(self.encoders, self.fields, self.mapping, indexes)
+        return _encode(encoder, cursor)
+
+    def projection(self, data_source):
+        return _get_projection(self.fields, self.mapping, self.names, ())
+
+    def getter(self, description):
+        key = _get_key(description)
+        if key not in self.getters:
+            self.getters[key] = self.compile(key)
+        return self.getters[key]
+
+    def compile(self, key):
+        return _compile_entity_getter(
+            self.entity_factory, self.fields, self.mapping, self.indexes(key)
+        )
+
+    def indexes(self, key):
+        positions = {name: index for index, name in enumerate(key)}
+        for name in self.names:
+            if name not in positions:
+                message = "Can not find {!r} column in the cursor description"
+                raise MapperError(message.format(name))
+        return [positions[name] for name in self.names]
+
+
+def _get_key(description):
+    return tuple(column[0] for column in description)
+
+
+class _Result(object):
+    def __init__(self, cursor, getter):
+        self.cursor = cursor
+        self.getter = getter
+
+    def __iter__(self):
+        return self.iterator()
+
+    def iterator(self, chunk_size=1000):
+        getter = self.getter
+        rows = self.cursor.fetchmany(chunk_size)
+        while rows:
+            for row in rows:
+                yield getter(row)
+            rows = self.cursor.fetchmany(chunk_size)
+
+    def get(self):
+        rows = self.cursor.fetchmany(2)
+        if not rows:
+            raise NotFoundError
+        elif len(rows) > 1:
+            raise MultipleResultsError
+        return self.getter(rows[0])
+
+    def first(self):
+        row = self.cursor.fetchone()
+        return None if row is None else self.getter(row)
+
+
+def _get_names(fields, mapping):
+    return tuple(_get_name(field, mapping[field]) for field, _field_type in fields)
+
+
+def _get_name(field, value):
+    if isinstance(value, Evaluated):
+        return value.name or field
+    elif isinstance(value, str):
+        return value
+    else:
+        raise MapperError
@@ -0,0 +1,71 @@
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import Union
+
+from _mappers.columns import _Columns
+from _mappers.entities import _Entity
+from _mappers.entities import _EntityFactory
+from _mappers.entities import _EntityFields
+from _mappers.mapper import _ConfigValue
+from _mappers.sources import _DataSourceFields
+from _mappers.sources.common import _Encoder
+from _mappers.sources.common import _Projection
+from _mappers.validation import _Mapping
+
+_Column = Union[str, Sequence[Any]]
+_Names = Tuple[str, ...]
+_RowGetter = Callable[[Sequence[Any]], _Entity]
+
+class Description:
+    columns: Tuple[Tuple[str, bool], ...]
+    def __init__(self, description: Iterable[_Column]) -> None: ...
+    def __eq__(self, other: object) -> bool: ...
+    def __ne__(self, other: object) -> bool: ...
+    def __hash__(self) -> int: ...
+
+def _get_column(column: _Column) -> Tuple[str, bool]: ...
+def _is_description(data_source: Any) -> bool: ...
+def _get_fields(data_source: Description) -> _DataSourceFields: ...
+def _factory(
+    data_source: Description,
+    fields: _EntityFields,
+    entity_factory: _EntityFactory,
+    mapping: _Mapping,
+) -> _Rows: ...
+
+class _Rows:
+    getters: Dict[_Names, _RowGetter]
+    encoders: Dict[Optional[Tuple[int, ...]], _Encoder]
+    def __init__(
+        self,
+        fields: _EntityFields,
+        entity_factory: _EntityFactory,
+        mapping: _Mapping,
+        names: _Names,
+    ) -> None: ...
+    def __call__(self, cursor: Any) -> _Result: ...
+    def columnar(self, cursor: Any) -> Iterator[_Columns]: ...
+    def encoded(self, cursor: Any) -> Iterator[str]: ...
+    def projection(self, data_source: Description) -> _Projection: ...
+    def getter(self, description: Sequence[Sequence[Any]]) -> _RowGetter: ...
+    def compile(self, key: _Names) -> _RowGetter: ...
+    def indexes(self, key: _Names) -> List[int]: ...
+
+def _get_key(description: Sequence[Sequence[Any]]) -> _Names: ...
+
+class _Result:
+    def __init__(self, cursor: Any, getter: _RowGetter) -> None: ...
+    def __iter__(self) -> Iterator[_Entity]: ...
+    def iterator(self, chunk_size: int = ...) -> Iterator[_Entity]: ...
+    def get(self) -> _Entity: ...
+    def first(self) -> Optional[_Entity]: ...
+
+def _get_names(fields: _EntityFields, mapping: _Mapping) -> _Names: ...
+def _get_name(field: str, value: _ConfigValue) -> str: ...
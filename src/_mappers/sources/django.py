@@ -1,13 +1,45 @@
 from __future__ import absolute_import
 
 import inspect
-
+from collections import OrderedDict
+from datetime import date
+from datetime import datetime
+from datetime import time
+from datetime import timedelta
+from decimal import Decimal
+from functools import partial
+from itertools import islice
+from typing import Any
+from typing import Optional
+from uuid import UUID
+
+from _mappers.configuration import _get_shared
+from _mappers.exceptions import MapperError
+from _mappers.mapper import _LazyMapper
 from _mappers.mapper import _Mapper
+from _mappers.mapper import Deferred
 from _mappers.mapper import Evaluated
+from _mappers.parallel import _parallel_map
+from _mappers.sources.common import _compile_entity_getter
+from _mappers.sources.common import _deduplicate
+from _mappers.sources.common import _encode
+from _mappers.sources.common import _get_encoder
+from _mappers.sources.common import _get_mapping_key
+from _mappers.sources.common import _get_offsets
+from _mappers.sources.common import _get_projection
+from _mappers.sources.common import _has_duplicates
+from _mappers.sources.common import _has_lazy_fields
+from _mappers.sources.common import _LazyFields
+from _mappers.sources.common import _transpose
+from _mappers.tracing import _timed
 
 try:
+    from django import VERSION
+    from django.core.exceptions import FieldDoesNotExist
+    from django.db import connections
     from django.db.models import Model as DjangoModel
     from django.db.models.query import ValuesListIterable
+    from django.utils.functional import SimpleLazyObject
 
     IS_AVAILABLE = True
 except ImportError:
@@ -22,6 +54,12 @@ def _is_django_model(data_source):
 
 
 def _get_fields(data_source, exclude=None):
+    return _get_shared(
+        _disassemble_fields, (data_source, exclude), data_source, exclude
+    )
+
+
+def _disassemble_fields(data_source, exclude):
     fields = {}
     for field in data_source._meta._get_fields():
         if field is exclude:
@@ -41,52 +79,382 @@ def _get_field_names(field):
 
 
 def _disassemble_field(field):
+    is_collection = _is_collection_field(field)
     disassembled = {
-        "is_nullable": bool(field.null),
+        # Empty collection is loaded as an empty list.
+        "is_nullable": bool(field.null) and not is_collection,
         "is_link": field.is_relation,
-        "is_collection": field.many_to_many,
+        "is_collection": is_collection,
     }
-    if disassembled["is_link"] and not disassembled["is_collection"]:
+    if field.is_relation:
         disassembled["link"] = field.related_model
-        disassembled["link_to"] = _get_fields(
-            field.related_model, exclude=field.remote_field
-        )
+        # Reverse foreign key could be a part of the related field path.
+        if not field.many_to_many:
+            disassembled["link_to"] = _LazyFields(
+                _get_fields, field.related_model, field.remote_field
+            )
     return disassembled
 
 
-def _factory(fields, entity_factory, mapping):
+def _is_collection_field(field):
+    return bool(field.many_to_many or field.one_to_many)
+
+
+def _get_read_model_fields(data_source, config):
+    fields = []
+    for name, value in config.items():
+        if isinstance(value, _LazyMapper):
+            raise MapperError
+        fields.append((name, _get_read_model_type(data_source, value)))
+    return fields
+
+
+def _get_read_model_type(data_source, value):
+    fields = _get_path_fields(data_source, _get_path(value))
+    if not fields:
+        return Any
+    python_type = _python_types.get(_get_column_field(fields[-1]).get_internal_type())
+    if python_type is None:
+        return Any
+    elif any(field.null for field in fields):
+        return Optional[python_type]
+    else:
+        return python_type
+
+
+def _get_path(value):
+    if isinstance(value, str):
+        return (value,)
+    elif isinstance(value, tuple):
+        return value
+    else:
+        # Types of evaluated and deferred fields are unknown.
+        return ()
+
+
+def _get_path_fields(data_source, path):
+    fields = []
+    for name in path:
+        try:
+            field = data_source._meta.get_field(name)
+        except FieldDoesNotExist:
+            # Unknown fields are reported by the validation.
+            return []
+        fields.append(field)
+        data_source = field.related_model
+    return fields
+
+
+def _get_column_field(field):
+    if field.is_relation and field.concrete:
+        return field.target_field
+    else:
+        return field
+
+
+_python_types = {
+    "AutoField": int,
+    "BigAutoField": int,
+    "SmallAutoField": int,
+    "IntegerField": int,
+    "BigIntegerField": int,
+    "SmallIntegerField": int,
+    "PositiveIntegerField": int,
+    "PositiveBigIntegerField": int,
+    "PositiveSmallIntegerField": int,
+    "FloatField": float,
+    "DecimalField": Decimal,
+    "BooleanField": bool,
+    "NullBooleanField": bool,
+    "CharField": str,
+    "TextField": str,
+    "SlugField": str,
+    "EmailField": str,
+    "URLField": str,
+    "FileField": str,
+    "FilePathField": str,
+    "DateTimeField": datetime,
+    "DateField": date,
+    "TimeField": time,
+    "DurationField": timedelta,
+    "UUIDField": UUID,
+}
+
+
+def _factory(data_source, fields, entity_factory, mapping):
+    # Every mapper with the same model, the same entity, and the same
+    # resolved mapping shares one projection.
+    key = (data_source, entity_factory, _get_mapping_key(mapping))
+    return _get_shared(
+        _build_values_list, key, data_source, fields, entity_factory, mapping
+    )
+
+
+def _build_values_list(data_source, fields, entity_factory, mapping):
+    arguments, indexes = _deduplicate(
+        _get_values_list_arguments(fields, mapping),
+        partial(_get_column_key, data_source),
+    )
     return _ValuesList(
         fields,
         entity_factory,
         mapping,
-        _get_values_list_arguments(fields, mapping),
-        _get_values_list_iterable_class(entity_factory, fields, mapping),
+        arguments,
+        indexes,
+        _get_values_list_iterable_class(entity_factory, fields, mapping, indexes),
     )
 
 
 class _ValuesList(object):
-    def __init__(self, fields, entity_factory, mapping, arguments, iterable_class):
+    def __init__(
+        self, fields, entity_factory, mapping, arguments, indexes, iterable_class
+    ):
         self.fields = fields
         self.entity_factory = entity_factory
         self.mapping = mapping
         self.arguments = arguments
+        self.indexes = indexes
         self.iterable_class = iterable_class
+        self.encoders = {}
 
     def __call__(self, queryset):
         result = queryset.values_list(*self.arguments)
         result._iterable_class = self.iterable_class
         return result
 
+    def columnar(self, queryset):
+        rows = queryset.values_list(*self.arguments).iterator()
+        return _transpose(rows, self.indexes)
+
+    def encoded(self, queryset):
+        encoder = _get_encoder(self.encoders, self.fields, self.mapping, self.indexes)
+        return _encode(encoder, queryset.values_list(*self.arguments).iterator())
+
+    def projection(self, data_source):
+        evaluated = _get_evaluated_arguments(self.fields, self.mapping, "")
+        arguments = [arg for arg in self.arguments if arg not in evaluated]
+        joins = _get_query_joins(data_source, arguments)
+        return _get_projection(
+            self.fields, self.mapping, self.arguments, joins, self.indexes
+        )
+
+    def explain(self, queryset):
+        result = queryset.values_list(*self.arguments)
+        if not hasattr(result, "explain"):
+            # QuerySet.explain was added in Django 2.1.
+            raise MapperError
+        return result.explain()
+
+    def lookup(self, field):
+        value = self.mapping.get(field)
+        if value is None or isinstance(value, (_Mapper, Deferred)):
+            raise MapperError
+        (argument,) = builders[type(value)](field, value)
+        lookup = argument + "__in"
+        return lambda queryset, keys: queryset.filter(**{lookup: keys})
+
+    def parallel(self, queryset, processes, batch_size, ordered):
+        if connections[queryset.db].in_atomic_block:
+            # Workers could not see rows of the open transaction.
+            raise MapperError
+        elif not queryset.query.can_filter():
+            # Sliced querysets could not be split into key ranges.
+            raise MapperError
+        elif ordered and queryset.query.order_by:
+            # Ordered results follow key ranges instead.
+            raise MapperError
+        job = partial(_load_key_range, self, queryset)
+        get_ranges = partial(_get_key_ranges, queryset, batch_size)
+        return _parallel_map(job, get_ranges, processes, ordered)
+
+    def writer(self, data_source, batch_size, ignore_conflicts):
+        if ignore_conflicts and VERSION < (2, 2):
+            # Conflicts could be ignored since Django 2.2.
+            raise MapperError
+        targets = _get_model_targets(self.fields, self.mapping)
+        return _BulkWriter(
+            data_source,
+            _compile_model_getter(data_source, targets),
+            _get_update_fields(data_source, targets),
+            batch_size,
+            {"ignore_conflicts": True} if ignore_conflicts else {},
+        )
+
+
+def _get_evaluated_arguments(fields, mapping, prefix):
+    # Annotations of the reader queryset are unknown to the model.
+    result = set()
+    for field, field_type in fields:
+        result |= _get_evaluated_field_arguments(
+            field, field_type, mapping[field], prefix
+        )
+    return result
+
+
+def _get_evaluated_field_arguments(field, field_type, value, prefix):
+    if isinstance(value, Evaluated):
+        return {prefix + (value.name or field)}
+    elif isinstance(value, _Mapper) and not field_type["is_collection"]:
+        return _get_evaluated_arguments(
+            value.iterable.fields, value.iterable.mapping, prefix + field + "__"
+        )
+    else:
+        return set()
+
+
+def _get_query_joins(data_source, arguments):
+    # Django does not join relations if only their primary key is
+    # selected, so joins are taken from the compiled query.
+    queryset = data_source._base_manager.values_list(*arguments).order_by()
+    query = queryset.query
+    query.get_compiler(using=queryset.db).as_sql()
+    paths = {}
+    joins = []
+    for alias, join in query.alias_map.items():
+        parent = getattr(join, "parent_alias", None)
+        if parent is None:
+            paths[alias] = ()
+            continue
+        paths[alias] = paths[parent] + (join.join_field.name,)
+        if query.alias_refcount[alias]:
+            joins.append("__".join(paths[alias]))
+    return tuple(joins)
+
+
+def _get_key_ranges(queryset, batch_size):
+    keys = queryset.order_by("pk").values_list("pk", flat=True).iterator()
+    keys = list(islice(keys, 0, None, batch_size))
+    # Worker processes should open their own database connection.
+    connections[queryset.db].close()
+    return list(zip(keys, keys[1:] + [None]))
+
+
+def _load_key_range(values_list, queryset, key_range):
+    start, end = key_range
+    queryset = queryset.filter(pk__gte=start)
+    if end is not None:
+        queryset = queryset.filter(pk__lt=end)
+    return list(values_list(queryset))
+
+
+class _BulkWriter(object):
+    def __init__(self, data_source, getter, update_fields, batch_size, options):
+        self.data_source = data_source
+        self.getter = getter
+        self.update_fields = update_fields
+        self.batch_size = batch_size
+        self.options = options
+
+    def create(self, entities):
+        self.data_source._default_manager.bulk_create(
+            [self.getter(entity) for entity in entities],
+            batch_size=self.batch_size,
+            **self.options
+        )
+
+    def update(self, entities):
+        manager = self.data_source._default_manager
+        if not self.update_fields:
+            # Nothing but the primary key is mapped.
+            raise MapperError
+        elif not hasattr(manager, "bulk_update"):
+            # QuerySet.bulk_update was added in Django 2.2.
+            raise MapperError
+        manager.bulk_update(
+            [self.getter(entity) for entity in entities],
+            self.update_fields,
+            batch_size=self.batch_size,
+        )
+
+
+def _get_model_targets(fields, mapping):
+    targets = []
+    for field, _field_type in fields:
+        value = mapping[field]
+        if isinstance(value, (_Mapper, Deferred)):
+            # Lazy values would be left out of the created rows.
+            raise MapperError
+        elif isinstance(value, str):
+            targets.append((value, field))
+    return targets
+
+
+def _get_update_fields(data_source, targets):
+    primary_key = data_source._meta.pk
+    return [
+        target
+        for target, _field in targets
+        if target not in (primary_key.name, primary_key.attname)
+    ]
+
+
+def _compile_model_getter(data_source, targets):
+    arguments = ", ".join(
+        "{}=entity.{}".format(target, field) for target, field in targets
+    )
+    code = compile("lambda entity: model(" + arguments + ")", "<mappers>", "eval")
+    return eval(code, {"model": data_source})  # nosec
+
 
 def _get_values_list_arguments(fields, mapping):
     result = []
-    for field, _field_type in fields:
-        result.extend(builders[type(mapping[field])](field, mapping[field]))
+    for field, field_type in fields:
+        if field_type["is_collection"]:
+            result.append("pk")
+        else:
+            result.extend(builders[type(mapping[field])](field, mapping[field]))
     return tuple(result)
 
 
+def _get_column_key(data_source, argument):
+    # Lookups of the same column are selected once.  Primary key of the
+    # related model is read from the foreign key column without a join.
+    names = argument.split("__")
+    prefix = ()
+    for index, name in enumerate(names, 1):
+        field = _get_lookup_field(data_source, name)
+        rest = names[index:]
+        if _is_column(field, rest):
+            return prefix, getattr(field, "attname", field.name)
+        elif field is None or not field.is_relation:
+            # Evaluated fields are annotations of the queryset and
+            # transforms of the column are selected as they are.
+            return argument
+        prefix += (field.name,)
+        data_source = field.related_model
+
+
+def _get_lookup_field(data_source, name):
+    if name == "pk":
+        return data_source._meta.pk
+    try:
+        return data_source._meta.get_field(name)
+    except FieldDoesNotExist:
+        return None
+
+
+def _is_column(field, rest):
+    return field is not None and (not rest or _is_foreign_key_target(field, rest))
+
+
+def _is_foreign_key_target(field, rest):
+    return (
+        field.is_relation
+        and field.concrete
+        and len(rest) == 1
+        and rest[0] in ("pk", field.target_field.name)
+    )
+
+
 def _build_mapper_argument(field, value):
-    return [field + "__" + argument for argument in value.iterable.arguments]
+    if _has_lazy_fields(value.iterable.fields, value.iterable.mapping):
+        raise MapperError
+    arguments = value.iterable.arguments
+    return [field + "__" + arguments[index] for index in value.iterable.indexes]
+
+
+def _build_deferred_argument(field, value):
+    return ["pk"]
 
 
 def _build_evaluated_argument(field, value):
@@ -104,62 +472,169 @@ def _build_field_argument(field, value):
 builders = {
     _Mapper: _build_mapper_argument,
     Evaluated: _build_evaluated_argument,
+    Deferred: _build_deferred_argument,
     tuple: _build_related_argument,
     str: _build_field_argument,
 }
 
 
-def _get_values_list_iterable_class(entity_factory, fields, mapping):
-    if any(isinstance(value, _Mapper) for value in mapping.values()):
-        return _get_nested_values_list_iterable_class(entity_factory, fields, mapping)
-    else:
+def _get_values_list_iterable_class(entity_factory, fields, mapping, indexes):
+    if _has_lazy_fields(fields, mapping):
+        return _get_lazy_values_list_iterable_class(
+            entity_factory, fields, mapping, indexes
+        )
+    elif _is_flat(mapping, indexes):
         return _get_flat_values_list_iterable_class(entity_factory)
+    else:
+        return _get_nested_values_list_iterable_class(
+            entity_factory, fields, mapping, indexes
+        )
+
+
+def _is_flat(mapping, indexes):
+    return not _has_duplicates(indexes) and not any(
+        isinstance(value, _Mapper) for value in mapping.values()
+    )
 
 
 def _get_flat_values_list_iterable_class(entity_factory):
     class _ValuesListIterable(ValuesListIterable):
         def __iter__(self):
+            factory = _timed(entity_factory)
             for row in super(_ValuesListIterable, self).__iter__():
-                yield entity_factory(*row)
+                yield factory(*row)
 
     return _ValuesListIterable
 
 
-def _get_nested_values_list_iterable_class(entity_factory, fields, mapping):
-    getter, _offset = _build_entity_getter(entity_factory, fields, mapping, 0)
+def _get_nested_values_list_iterable_class(entity_factory, fields, mapping, indexes):
+    getter = _compile_entity_getter(entity_factory, fields, mapping, indexes)
 
     class _ValuesListIterable(ValuesListIterable):
         def __iter__(self):
+            timed_getter = _timed(getter)
             for row in super(_ValuesListIterable, self).__iter__():
-                yield getter(row)
+                yield timed_getter(row)
+
+    return _ValuesListIterable
+
+
+def _get_lazy_values_list_iterable_class(entity_factory, fields, mapping, indexes):
+    getter = _compile_entity_getter(entity_factory, fields, mapping, indexes)
+    loaders = _get_lazy_loaders(fields, mapping, _get_offsets(fields, mapping, indexes))
+
+    class _ValuesListIterable(ValuesListIterable):
+        def __iter__(self):
+            timed_getter = _timed(getter)
+            rows = super(_ValuesListIterable, self).__iter__()
+            for chunk in _get_chunks(rows, self):
+                lazy = _LazyValues(self.queryset, loaders, chunk)
+                for row in chunk:
+                    yield timed_getter(row, lazy)
 
     return _ValuesListIterable
 
 
-def _build_field_getter(offset):
-    def getter(row):
-        return row[offset]
+def _get_chunks(rows, iterable):
+    # Lazy values are loaded for the keys of fetched rows.  Streamed
+    # querysets are loaded chunk by chunk to keep them streamed.
+    if not getattr(iterable, "chunked_fetch", False):
+        yield list(rows)
+        return
+    chunk_size = iterable.chunk_size
+    for chunk in iter(lambda: list(islice(rows, chunk_size)), []):
+        yield chunk
+
+
+def _get_lazy_loaders(fields, mapping, offsets):
+    loaders = {}
+    for field, field_type in fields:
+        value = mapping[field]
+        if isinstance(value, Deferred):
+            loaders[field] = _DeferredLoader(value.name or field, offsets[field])
+        elif field_type["is_collection"]:
+            loaders[field] = _get_collection_loader(
+                field, value.iterable, offsets[field]
+            )
+    return loaders
 
-    return getter, offset + 1
 
+def _get_collection_loader(field, iterable, offset):
+    if _has_lazy_fields(iterable.fields, iterable.mapping):
+        raise MapperError
+    arguments = ("pk", field + "__pk") + tuple(
+        field + "__" + argument for argument in iterable.arguments
+    )
+    getter = _compile_entity_getter(
+        iterable.entity_factory,
+        iterable.fields,
+        iterable.mapping,
+        [index + 2 for index in iterable.indexes],
+    )
+    return _CollectionLoader(arguments, getter, offset)
 
-def _build_entity_getter(entity_factory, fields, mapping, offset):
-    getters = []
 
-    for field, _field_type in fields:
-        target_field = mapping[field]
-        if isinstance(target_field, _Mapper):
-            getter, offset = _build_entity_getter(
-                target_field.iterable.entity_factory,
-                target_field.iterable.fields,
-                target_field.iterable.mapping,
-                offset,
+class _LazyValues(object):
+    def __init__(self, queryset, loaders, rows):
+        self.queryset = queryset
+        self.loaders = loaders
+        self.rows = rows
+        self.values = {}
+
+    def __call__(self, field, key):
+        return self.loaders[field].get(self, field, key)
+
+    def load(self, field):
+        if field not in self.values:
+            self.values[field] = self.loaders[field].load(self.queryset, self.rows)
+        return self.values[field]
+
+
+class _DeferredLoader(object):
+    def __init__(self, name, offset):
+        self.name = name
+        self.offset = offset
+
+    def get(self, values, field, key):
+        return SimpleLazyObject(lambda: values.load(field)[key])
+
+    def load(self, queryset, rows):
+        manager = queryset.model._base_manager.using(queryset.db)
+        result = {}
+        for related in _filter_keys(manager, rows, self.offset):
+            result.update(related.values_list("pk", self.name))
+        return result
+
+
+class _CollectionLoader(object):
+    def __init__(self, arguments, getter, offset):
+        self.arguments = arguments
+        self.getter = getter
+        self.offset = offset
+
+    def get(self, values, field, key):
+        return values.load(field).get(key, [])
+
+    def load(self, queryset, rows):
+        manager = queryset.model._default_manager.using(queryset.db)
+        result = {}
+        for related in _filter_keys(manager, rows, self.offset):
+            related = related.order_by(*self.arguments[:2]).values_list(
+                *self.arguments
             )
-        else:
-            getter, offset = _build_field_getter(offset)
-        getters.append(getter)
+            for row in related:
+                if row[1] is not None:
+                    result.setdefault(row[0], []).append(self.getter(row))
+        return result
+
+
+def _filter_keys(manager, rows, offset):
+    # Keys are taken from the fetched rows.  The subquery of sliced
+    # queryset is not supported by every database.
+    keys = iter(OrderedDict.fromkeys(row[offset] for row in rows))
+    for batch in iter(lambda: list(islice(keys, _key_batch_size)), []):
+        yield manager.filter(pk__in=batch)
 
-    def getter(row):
-        return entity_factory(*(getter(row) for getter in getters))
 
-    return getter, offset
+# Keys of the lazy value queries are split into bounded IN lookups.
+_key_batch_size = 500
@@ -1,25 +1,38 @@
 from typing import Any
 from typing import Callable
+from typing import Dict
 from typing import Iterable
+from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Sequence
+from typing import Set
 from typing import Tuple
 from typing import Type
+from typing import Union
 
 from django.db.models import Field
+from django.db.models import Manager
 from django.db.models import Model
 from django.db.models import QuerySet
 from django.db.models.query import ValuesListIterable
 from django.db.models.query import ValuesQuerySet
 
+from _mappers.columns import _Columns
+from _mappers.entities import _Entity
 from _mappers.entities import _EntityFactory
 from _mappers.entities import _EntityFields
+from _mappers.entities import _FieldDef as _EntityFieldDef
+from _mappers.mapper import _Config
+from _mappers.mapper import _ConfigValue
 from _mappers.mapper import _Mapper
 from _mappers.mapper import _RelatedField
+from _mappers.mapper import Deferred
 from _mappers.mapper import Evaluated
 from _mappers.sources import _DataSourceFields
 from _mappers.sources import _FieldDef
 from _mappers.sources import _FieldName
+from _mappers.sources.common import _Projection
 from _mappers.validation import _Mapping
 
 _DjangoModel = Type[Model]
@@ -29,10 +42,34 @@ def _is_django_model(data_source: Any) -> bool: ...
 def _get_fields(
     data_source: _DjangoModel, exclude: Optional[Field] = ...
 ) -> _DataSourceFields: ...
+def _disassemble_fields(
+    data_source: _DjangoModel, exclude: Optional[Field]
+) -> _DataSourceFields: ...
 def _get_field_names(field: Field) -> Iterable[_FieldName]: ...
 def _disassemble_field(field: Field) -> _FieldDef: ...
+def _is_collection_field(field: Field) -> bool: ...
+
+def _get_read_model_fields(
+    data_source: _DjangoModel, config: _Config
+) -> List[Tuple[str, Any]]: ...
+def _get_read_model_type(data_source: _DjangoModel, value: _ConfigValue) -> Any: ...
+def _get_path(value: _ConfigValue) -> Tuple[str, ...]: ...
+def _get_path_fields(data_source: _DjangoModel, path: Tuple[str, ...]) -> List[Field]: ...
+def _get_column_field(field: Field) -> Field: ...
+
+_python_types: Dict[str, type]
+
 def _factory(
-    fields: _EntityFields, entity_factory: _EntityFactory, mapping: _Mapping
+    data_source: _DjangoModel,
+    fields: _EntityFields,
+    entity_factory: _EntityFactory,
+    mapping: _Mapping,
+) -> _ValuesList: ...
+def _build_values_list(
+    data_source: _DjangoModel,
+    fields: _EntityFields,
+    entity_factory: _EntityFactory,
+    mapping: _Mapping,
 ) -> _ValuesList: ...
 
 class _ValuesList:
@@ -42,30 +79,159 @@ class _ValuesList:
         entity_factory: _EntityFactory,
         mapping: _Mapping,
         arguments: Tuple[str, ...],
+        indexes: Tuple[int, ...],
         iterable_class: _ValuesListIterable,
     ) -> None: ...
     def __call__(self, queryset: QuerySet) -> ValuesQuerySet: ...
+    def columnar(self, queryset: QuerySet) -> Iterator[_Columns]: ...
+    def encoded(self, queryset: QuerySet) -> Iterator[str]: ...
+    def projection(self, data_source: _DjangoModel) -> _Projection: ...
+    def explain(self, queryset: QuerySet) -> str: ...
+    def lookup(self, field: str) -> Callable[[QuerySet, List[Any]], QuerySet]: ...
+    def parallel(
+        self,
+        queryset: QuerySet,
+        processes: Optional[int],
+        batch_size: int,
+        ordered: bool,
+    ) -> Iterator[_Entity]: ...
+    def writer(
+        self,
+        data_source: _DjangoModel,
+        batch_size: Optional[int],
+        ignore_conflicts: bool,
+    ) -> _BulkWriter: ...
+
+def _get_evaluated_arguments(
+    fields: _EntityFields, mapping: _Mapping, prefix: str
+) -> Set[str]: ...
+def _get_evaluated_field_arguments(
+    field: str, field_type: _EntityFieldDef, value: Any, prefix: str
+) -> Set[str]: ...
+def _get_query_joins(
+    data_source: _DjangoModel, arguments: Sequence[str]
+) -> Tuple[str, ...]: ...
+
+_KeyRange = Tuple[Any, Optional[Any]]
+
+def _get_key_ranges(queryset: QuerySet, batch_size: int) -> List[_KeyRange]: ...
+def _load_key_range(
+    values_list: _ValuesList, queryset: QuerySet, key_range: _KeyRange
+) -> List[_Entity]: ...
+
+_ModelGetter = Callable[[_Entity], Model]
+_Target = Tuple[str, str]
+
+class _BulkWriter:
+    def __init__(
+        self,
+        data_source: _DjangoModel,
+        getter: _ModelGetter,
+        update_fields: List[str],
+        batch_size: Optional[int],
+        options: Dict[str, bool],
+    ) -> None: ...
+    def create(self, entities: Iterable[_Entity]) -> None: ...
+    def update(self, entities: Iterable[_Entity]) -> None: ...
+
+def _get_model_targets(fields: _EntityFields, mapping: _Mapping) -> List[_Target]: ...
+def _get_update_fields(
+    data_source: _DjangoModel, targets: List[_Target]
+) -> List[str]: ...
+def _compile_model_getter(
+    data_source: _DjangoModel, targets: List[_Target]
+) -> _ModelGetter: ...
 
 def _get_values_list_arguments(
     fields: _EntityFields, mapping: _Mapping
 ) -> Tuple[str, ...]: ...
+def _get_column_key(
+    data_source: _DjangoModel, argument: str
+) -> Union[str, Tuple[Tuple[str, ...], str]]: ...
+def _get_lookup_field(data_source: _DjangoModel, name: str) -> Optional[Field]: ...
+def _is_column(field: Optional[Field], rest: List[str]) -> bool: ...
+def _is_foreign_key_target(field: Field, rest: List[str]) -> bool: ...
 def _build_mapper_argument(field: str, value: _Mapper) -> List[str]: ...
+def _build_deferred_argument(field: str, value: Deferred) -> List[str]: ...
 def _build_evaluated_argument(field: str, value: Evaluated) -> List[str]: ...
 def _build_related_argument(field: str, value: _RelatedField) -> List[str]: ...
 def _build_field_argument(field: str, value: str) -> List[str]: ...
 def _get_values_list_iterable_class(
-    entity_factory: _EntityFactory, fields: _EntityFields, mapping: _Mapping
+    entity_factory: _EntityFactory,
+    fields: _EntityFields,
+    mapping: _Mapping,
+    indexes: Tuple[int, ...],
 ) -> _ValuesListIterable: ...
+def _is_flat(mapping: _Mapping, indexes: Tuple[int, ...]) -> bool: ...
 def _get_flat_values_list_iterable_class(
     entity_factory: _EntityFactory,
 ) -> _ValuesListIterable: ...
 def _get_nested_values_list_iterable_class(
-    entity_factory: _EntityFactory, fields: _EntityFields, mapping: _Mapping
+    entity_factory: _EntityFactory,
+    fields: _EntityFields,
+    mapping: _Mapping,
+    indexes: Tuple[int, ...],
 ) -> _ValuesListIterable: ...
-def _build_field_getter(offset: int) -> Callable: ...
-def _build_entity_getter(
+def _get_lazy_values_list_iterable_class(
     entity_factory: _EntityFactory,
     fields: _EntityFields,
     mapping: _Mapping,
-    offset: int,
-) -> Callable: ...
+    indexes: Tuple[int, ...],
+) -> _ValuesListIterable: ...
+
+def _get_chunks(
+    rows: Iterator[Tuple[Any, ...]], iterable: ValuesListIterable
+) -> Iterator[List[Tuple[Any, ...]]]: ...
+
+_Loader = Union[_DeferredLoader, _CollectionLoader]
+
+def _get_lazy_loaders(
+    fields: _EntityFields, mapping: _Mapping, offsets: Dict[str, int]
+) -> Dict[str, _Loader]: ...
+def _get_collection_loader(
+    field: str, iterable: _ValuesList, offset: int
+) -> _CollectionLoader: ...
+
+class _LazyValues:
+    queryset: QuerySet
+    loaders: Dict[str, _Loader]
+    rows: Iterable[Tuple[Any, ...]]
+    values: Dict[str, Dict[Any, Any]]
+    def __init__(
+        self,
+        queryset: QuerySet,
+        loaders: Dict[str, _Loader],
+        rows: Iterable[Tuple[Any, ...]],
+    ) -> None: ...
+    def __call__(self, field: str, key: Any) -> Any: ...
+    def load(self, field: str) -> Dict[Any, Any]: ...
+
+class _DeferredLoader:
+    name: str
+    offset: int
+    def __init__(self, name: str, offset: int) -> None: ...
+    def get(self, values: _LazyValues, field: str, key: Any) -> Any: ...
+    def load(
+        self, queryset: QuerySet, rows: Iterable[Tuple[Any, ...]]
+    ) -> Dict[Any, Any]: ...
+
+class _CollectionLoader:
+    arguments: Tuple[str, ...]
+    getter: Callable[[Tuple[Any, ...]], _Entity]
+    offset: int
+    def __init__(
+        self,
+        arguments: Tuple[str, ...],
+        getter: Callable[[Tuple[Any, ...]], _Entity],
+        offset: int,
+    ) -> None: ...
+    def get(self, values: _LazyValues, field: str, key: Any) -> List[_Entity]: ...
+    def load(
+        self, queryset: QuerySet, rows: Iterable[Tuple[Any, ...]]
+    ) -> Dict[Any, List[_Entity]]: ...
+
+def _filter_keys(
+    manager: Manager, rows: Iterable[Tuple[Any, ...]], offset: int
+) -> Iterator[QuerySet]: ...
+
+_key_batch_size: int
@@ -0,0 +1,232 @@
+from __future__ import absolute_import
+
+import inspect
+from collections import OrderedDict
+
+from _mappers.configuration import _get_shared
+from _mappers.exceptions import MapperError
+from _mappers.mapper import _Mapper
+from _mappers.mapper import Deferred
+from _mappers.mapper import Evaluated
+from _mappers.sources.common import _compile_entity_getter
+from _mappers.sources.common import _deduplicate
+from _mappers.sources.common import _encode
+from _mappers.sources.common import _get_encoder
+from _mappers.sources.common import _get_joins
+from _mappers.sources.common import _get_projection
+from _mappers.sources.common import _LazyFields
+from _mappers.sources.common import _transpose
+from _mappers.tracing import _timed
+
+try:
+    import sqlalchemy
+    from sqlalchemy.orm import aliased
+    from sqlalchemy.orm.interfaces import MANYTOONE
+
+    IS_AVAILABLE = True
+except ImportError:
+    IS_AVAILABLE = False
+
+
+def _is_sqlalchemy_model(data_source):
+    if IS_AVAILABLE:
+        return (
+            inspect.isclass(data_source)
+            and sqlalchemy.inspect(data_source, raiseerr=False) is not None
+        )
+    else:
+        return False
+
+
+def _get_fields(data_source):
+    return _get_shared(_disassemble_fields, data_source, data_source)
+
+
+def _disassemble_fields(data_source):
+    mapper = sqlalchemy.inspect(data_source)
+    fields = {}
+    for attribute in mapper.column_attrs:
+        fields[attribute.key] = _disassemble_column(attribute)
+    for relationship in mapper.relationships:
+        fields[relationship.key] = _disassemble_relationship(relationship)
+    return fields
+
+
+def _disassemble_column(attribute):
+    return {
+        "is_nullable": any(column.nullable for column in attribute.columns),
+        "is_link": False,
+        "is_collection": False,
+    }
+
+
+def _disassemble_relationship(relationship):
+    disassembled = {
+        "is_nullable": _is_nullable_relationship(relationship),
+        "is_link": True,
+        "is_collection": relationship.uselist,
+        "link": relationship.mapper.class_,
+    }
+    if not disassembled["is_collection"]:
+        disassembled["link_to"] = _LazyFields(_get_fields, relationship.mapper.class_)
+    return disassembled
+
+
+def _is_nullable_relationship(relationship):
+    return relationship.direction is not MANYTOONE or any(
+        column.nullable for column in relationship.local_columns
+    )
+
+
+def _factory(data_source, fields, entity_factory, mapping):
+    paths, indexes = _deduplicate(_get_paths(fields, mapping))
+    joins = OrderedDict()
+    columns = [_resolve_path(data_source, path, joins) for path in paths]
+    return _Select(
+        fields,
+        entity_factory,
+        mapping,
+        paths,
+        indexes,
+        columns,
+        list(joins.values()),
+        _compile_entity_getter(entity_factory, fields, mapping, indexes),
+    )
+
+
+class _Select(object):
+    def __init__(
+        self, fields, entity_factory, mapping, paths, indexes, columns, joins, getter
+    ):
+        self.fields = fields
+        self.entity_factory = entity_factory
+        self.mapping = mapping
+        self.paths = paths
+        self.indexes = indexes
+        self.columns = columns
+        self.joins = joins
+        self.getter = getter
+        self.encoders = {}
+
+    def __call__(self, query):
+        return _Result(self.select(query), _timed(self.getter))
+
+    def columnar(self, query):
+        return _transpose(self.select(query).yield_per(1000), self.indexes)
+
+    def encoded(self, query):
+        encoder = _get_encoder(self.encoders, self.fields, self.mapping, self.indexes)
+        return _encode(encoder, self.select(query))
+
+    def select(self, query):
+        for _alias, relationship, is_outer in self.joins:
+            query = query.join(relationship, isouter=is_outer)
+        return query.with_entities(*_get_columns(self.columns, query))
+
+    def projection(self, data_source):
+        columns = tuple(
+            path if isinstance(path, str) else ".".join(path) for path in self.paths
+        )
+        # Every prefix of the related path is joined by the select.
+        joins = _get_joins(columns, ".")
+        return _get_projection(self.fields, self.mapping, columns, joins, self.indexes)
+
+    def lookup(self, field):
+        value = self.mapping.get(field)
+        if value is None or isinstance(value, (_Mapper, Evaluated)):
+            raise MapperError
+        (path,) = builders[type(value)](field, value)
+        column = dict(zip(self.paths, self.columns))[path]
+        return lambda query, keys: query.filter(column.in_(keys))
+
+
+def _get_columns(columns, query):
+    labels = {
+        description["name"]: description["expr"]
+        for description in query.column_descriptions
+    }
+    return [labels[column] if isinstance(column, str) else column for column in columns]
+
+
+class _Result(object):
+    def __init__(self, query, getter):
+        self.query = query
+        self.getter = getter
+
+    def __iter__(self):
+        return _convert(self.getter, self.query)
+
+    def iterator(self, chunk_size=1000):
+        return _convert(self.getter, self.query.yield_per(chunk_size))
+
+    def get(self):
+        return self.getter(self.query.one())
+
+    def first(self):
+        row = self.query.first()
+        return None if row is None else self.getter(row)
+
+
+def _convert(getter, rows):
+    for row in rows:
+        yield getter(row)
+
+
+def _get_paths(fields, mapping):
+    result = []
+    for field, field_type in fields:
+        if field_type["is_collection"]:
+            raise MapperError
+        result.extend(builders[type(mapping[field])](field, mapping[field]))
+    return tuple(result)
+
+
+def _build_mapper_path(field, value):
+    paths = [value.iterable.paths[index] for index in value.iterable.indexes]
+    return [path if isinstance(path, str) else (field,) + path for path in paths]
+
+
+def _build_evaluated_path(field, value):
+    return [value.name or field]
+
+
+def _build_deferred_path(field, value):
+    raise MapperError
+
+
+def _build_related_path(field, value):
+    return [value]
+
+
+def _build_field_path(field, value):
+    return [(value,)]
+
+
+builders = {
+    _Mapper: _build_mapper_path,
+    Evaluated: _build_evaluated_path,
+    Deferred: _build_deferred_path,
+    tuple: _build_related_path,
+    str: _build_field_path,
+}
+
+
+def _resolve_path(data_source, path, joins):
+    if isinstance(path, str):
+        return path
+    target = data_source
+    is_outer = False
+    for index in range(1, len(path)):
+        prefix = path[:index]
+        if prefix not in joins:
+            joins[prefix] = _join(target, path[index - 1], is_outer)
+        target, _relationship, is_outer = joins[prefix]
+    return getattr(target, path[-1])
+
+
+def _join(target, name, is_outer):
+    relationship = getattr(target, name)
+    alias = aliased(relationship.property.mapper.class_)
+    # Inner join below the outer one would drop rows without the parent.
+    is_outer = is_outer or _is_nullable_relationship(relationship.property)
+    return alias, relationship.of_type(alias), is_outer
@@ -0,0 +1,89 @@
+from collections import OrderedDict
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Type
+from typing import Union
+
+from sqlalchemy.orm import ColumnProperty
+from sqlalchemy.orm import Query
+from sqlalchemy.orm import RelationshipProperty
+
+from _mappers.columns import _Columns
+from _mappers.entities import _Entity
+from _mappers.entities import _EntityFactory
+from _mappers.entities import _EntityFields
+from _mappers.mapper import _Mapper
+from _mappers.mapper import _RelatedField
+from _mappers.mapper import Deferred
+from _mappers.mapper import Evaluated
+from _mappers.sources import _DataSourceFields
+from _mappers.sources import _FieldDef
+from _mappers.sources.common import _Projection
+from _mappers.validation import _Mapping
+
+_SQLAlchemyModel = Type[Any]
+_Path = Union[str, Tuple[str, ...]]
+_Column = Any
+_Join = Tuple[Any, Any, bool]
+_Joins = OrderedDict[Tuple[str, ...], _Join]
+_RowGetter = Callable[[Tuple[Any, ...]], _Entity]
+
+def _is_sqlalchemy_model(data_source: Any) -> bool: ...
+
+def _get_fields(data_source: _SQLAlchemyModel) -> _DataSourceFields: ...
+def _disassemble_fields(data_source: _SQLAlchemyModel) -> _DataSourceFields: ...
+def _disassemble_column(attribute: ColumnProperty) -> _FieldDef: ...
+def _disassemble_relationship(relationship: RelationshipProperty) -> _FieldDef: ...
+def _is_nullable_relationship(relationship: RelationshipProperty) -> bool: ...
+def _factory(
+    data_source: _SQLAlchemyModel,
+    fields: _EntityFields,
+    entity_factory: _EntityFactory,
+    mapping: _Mapping,
+) -> _Select: ...
+
+class _Select:
+    def __init__(
+        self,
+        fields: _EntityFields,
+        entity_factory: _EntityFactory,
+        mapping: _Mapping,
+        paths: Tuple[_Path, ...],
+        indexes: Tuple[int, ...],
+        columns: List[_Column],
+        joins: List[_Join],
+        getter: _RowGetter,
+    ) -> None: ...
+    def __call__(self, query: Query) -> _Result: ...
+    def columnar(self, query: Query) -> Iterator[_Columns]: ...
+    def encoded(self, query: Query) -> Iterator[str]: ...
+    def projection(self, data_source: _SQLAlchemyModel) -> _Projection: ...
+    def select(self, query: Query) -> Query: ...
+    def lookup(self, field: str) -> Callable[[Query, List[Any]], Query]: ...
+
+def _get_columns(columns: List[_Column], query: Query) -> List[_Column]: ...
+
+class _Result:
+    def __init__(self, query: Query, getter: _RowGetter) -> None: ...
+    def __iter__(self) -> Iterator[_Entity]: ...
+    def iterator(self, chunk_size: int = ...) -> Iterator[_Entity]: ...
+    def get(self) -> _Entity: ...
+    def first(self) -> Optional[_Entity]: ...
+
+def _convert(getter: _RowGetter, rows: Iterable[Any]) -> Iterator[_Entity]: ...
+def _get_paths(fields: _EntityFields, mapping: _Mapping) -> Tuple[_Path, ...]: ...
+def _build_mapper_path(field: str, value: _Mapper) -> List[_Path]: ...
+def _build_evaluated_path(field: str, value: Evaluated) -> List[_Path]: ...
+def _build_deferred_path(field: str, value: Deferred) -> List[_Path]: ...
+def _build_related_path(field: str, value: _RelatedField) -> List[_Path]: ...
+def _build_field_path(field: str, value: str) -> List[_Path]: ...
+def _resolve_path(
+    data_source: _SQLAlchemyModel, path: _Path, joins: _Joins
+) -> _Column: ...
+def _join(target: Any, name: str, is_outer: bool) -> _Join: ...
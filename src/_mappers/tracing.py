@@ -0,0 +1,104 @@
+import threading
+from collections import namedtuple
+from timeit import default_timer
+
+
+_ReadInfo = namedtuple(
+    "ReadInfo",
+    ["reader", "entity", "converter", "rows", "query_time", "construction_time"],
+)
+
+
+class _Timer(object):
+    def __init__(self):
+        self.rows = 0
+        self.construction_time = 0.0
+
+
+class _LocalVar(object):
+    # Context variables are available since Python 3.7.
+
+    def __init__(self):
+        self.local = threading.local()
+
+    def get(self):
+        return getattr(self.local, "value", None)
+
+    def set(self, value):
+        previous = self.get()
+        self.local.value = value
+        return previous
+
+    def reset(self, previous):
+        self.local.value = previous
+
+
+def _get_current_timer():
+    try:
+        from contextvars import ContextVar
+    except ImportError:
+        return _LocalVar()
+    else:
+        # Async queries of Django run in the other thread with a copy of
+        # the caller context.
+        return ContextVar("timer", default=None)
+
+
+_tracers = []
+
+_current_timer = _get_current_timer()
+
+
+def add_tracer(tracer):
+    """Report every reader call to the given callback."""
+    _tracers.append(tracer)
+
+
+def remove_tracer(tracer):
+    """Stop reporting reader calls to the given callback."""
+    _tracers.remove(tracer)
+
+
+def _is_tracing():
+    return bool(_tracers)
+
+
+def _trace(reader, args, kwargs):
+    timer = _Timer()
+    token = _current_timer.set(timer)
+    start = default_timer()
+    try:
+        result = reader.read(*args, **kwargs)
+    finally:
+        elapsed = default_timer() - start
+        _current_timer.reset(token)
+    _report(reader, timer, elapsed)
+    return result
+
+
+def _report(reader, timer, elapsed):
+    info = _ReadInfo(
+        getattr(reader.f, "__qualname__", reader.f.__name__),
+        reader.entity,
+        reader.ret,
+        timer.rows,
+        elapsed - timer.construction_time,
+        timer.construction_time,
+    )
+    for tracer in list(_tracers):
+        tracer(info)
+
+
+def _timed(getter):
+    timer = _current_timer.get()
+    if timer is None:
+        return getter
+
+    def timed(*args):
+        start = default_timer()
+        entity = getter(*args)
+        timer.construction_time += default_timer() - start
+        timer.rows += 1
+        return entity
+
+    return timed
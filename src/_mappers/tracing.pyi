@@ -0,0 +1,55 @@
+import threading
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+from _mappers.asynchronous import _AsyncReader
+from _mappers.entities import _Entity
+from _mappers.entities import _EntityClass
+from _mappers.mapper import _BatchReader
+from _mappers.mapper import _Reader
+
+class _ReadInfo(NamedTuple):
+    reader: str
+    entity: _EntityClass
+    converter: Any
+    rows: int
+    query_time: float
+    construction_time: float
+
+class _Timer:
+    rows: int
+    construction_time: float
+    def __init__(self) -> None: ...
+
+_AnyReader = Union[_Reader, _BatchReader, _AsyncReader]
+
+_Tracer = Callable[[_ReadInfo], None]
+
+class _LocalVar:
+    local: threading.local
+    def __init__(self) -> None: ...
+    def get(self) -> Optional[_Timer]: ...
+    def set(self, value: Optional[_Timer]) -> Optional[_Timer]: ...
+    def reset(self, previous: Optional[_Timer]) -> None: ...
+
+def _get_current_timer() -> Any: ...
+
+_tracers: List[_Tracer]
+
+_current_timer: Any
+
+def add_tracer(tracer: _Tracer) -> None: ...
+def remove_tracer(tracer: _Tracer) -> None: ...
+def _is_tracing() -> bool: ...
+def _trace(reader: _AnyReader, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Any: ...
+def _report(reader: _AnyReader, timer: _Timer, elapsed: float) -> None: ...
+
+_Getter = Callable[..., _Entity]
+
+def _timed(getter: _Getter) -> _Getter: ...
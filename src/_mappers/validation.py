@@ -1,9 +1,11 @@
+from _mappers.entities import _entity_hooks
 from _mappers.exceptions import MapperError
 from _mappers.mapper import _LazyMapper
+from _mappers.mapper import Deferred
 from _mappers.mapper import Evaluated
 
 
-def _validate(entity_fields, data_source_fields, config, data_source):
+def _validate(entity, entity_fields, data_source_fields, config, data_source, trusted):
     _config_types(config)
     _unknown_entity_fields_in_config(entity_fields, config)
     _unknown_data_source_fields_in_config(data_source_fields, config)
@@ -11,8 +13,10 @@ def _validate(entity_fields, data_source_fields, config, data_source):
     _required_entity_fields(entity_fields, data_source_fields)
     _nested_entity_data_source_fields(entity_fields, data_source_fields)
     _nested_entity_config_fields(entity_fields, config)
+    _nested_entity_links(entity_fields, data_source_fields)
     _related_config_fields(data_source_fields, config)
-    return _get_mapping(entity_fields, data_source_fields, config)
+    _deferred_config_fields(entity, entity_fields, data_source_fields, config, trusted)
+    return _get_mapping(entity_fields, data_source_fields, config, trusted)
 
 
 def _config_types(config):
@@ -27,7 +31,7 @@ def _config_key_type(key):
 
 
 def _config_value_type(value):
-    if isinstance(value, (_LazyMapper, Evaluated, str)):
+    if isinstance(value, (_LazyMapper, Evaluated, Deferred, str)):
         pass
     elif isinstance(value, tuple):
         _related_field_type(value)
@@ -76,7 +80,8 @@ def _nested_entity_data_source_fields(entity_fields, data_source_fields):
     for field_name in set(entity_fields) & set(data_source_fields):
         if (
             entity_fields[field_name]["is_entity"]
-            and data_source_fields[field_name]["is_collection"]
+            and entity_fields[field_name]["is_collection"]
+            != data_source_fields[field_name]["is_collection"]
         ):
             raise MapperError
 
@@ -89,6 +94,13 @@ def _nested_entity_config_fields(entity_fields, config):
             raise MapperError
 
 
+def _nested_entity_links(entity_fields, data_source_fields):
+    for field_name, field_type in entity_fields.items():
+        data_source_field = data_source_fields.get(field_name, {"is_link": False})
+        if field_type["is_entity"] and not data_source_field["is_link"]:
+            raise MapperError
+
+
 def _related_config_fields(data_source_fields, config):
     link_to = data_source_fields
     for value in config.values():
@@ -101,11 +113,35 @@ def _related_config_fields(data_source_fields, config):
 def _related_field_link(value):
     if not value["is_link"]:
         raise MapperError
-    if value["is_collection"]:
+    if "link_to" not in value:
+        raise MapperError
+
+
+def _deferred_config_fields(entity, entity_fields, data_source_fields, config, trusted):
+    for key, value in config.items():
+        if isinstance(value, Deferred):
+            _deferred_field(data_source_fields, value.name or key, trusted)
+            _deferred_entity(entity, entity_fields[key])
+
+
+def _deferred_field(data_source_fields, name, trusted):
+    # Lazy values can not pass validation of the entity.  Lazy None
+    # value would not be None.
+    field = data_source_fields.get(name, {"is_link": True, "is_nullable": True})
+    if not trusted:
+        raise MapperError
+    elif field["is_link"] or field["is_nullable"]:
+        raise MapperError
+
+
+def _deferred_entity(entity, field_type):
+    # Post init hooks and converters of the entity would force or
+    # reject the lazy value.
+    if _entity_hooks(entity) or field_type["is_optional"]:
         raise MapperError
 
 
-def _get_mapping(entity_fields, data_source_fields, config):
+def _get_mapping(entity_fields, data_source_fields, config, trusted):
     from _mappers.factory import mapper_factory
 
     mapping = {}
@@ -115,6 +151,7 @@ def _get_mapping(entity_fields, data_source_fields, config):
                 field_type["type"],
                 data_source_fields[field]["link"],
                 config.get(field, mapper_factory()).config,
+                trusted,
             )
         else:
             mapping[field] = config.get(field, field)
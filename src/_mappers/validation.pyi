@@ -1,23 +1,28 @@
+from typing import Any
 from typing import Dict
 from typing import Union
 
 from _mappers.entities import _EntityFields
+from _mappers.entities import _FieldDef as _EntityFieldDef
 from _mappers.mapper import _Config
 from _mappers.mapper import _ConfigValue
 from _mappers.mapper import _Mapper
 from _mappers.mapper import _RelatedField
+from _mappers.mapper import Deferred
 from _mappers.mapper import Evaluated
 from _mappers.sources import _DataSource
 from _mappers.sources import _DataSourceFields
 from _mappers.sources import _FieldDef
 
-_Mapping = Dict[str, Union[str, _Mapper, Evaluated, _RelatedField]]
+_Mapping = Dict[str, Union[str, _Mapper, Evaluated, Deferred, _RelatedField]]
 
 def _validate(
+    entity: Any,
     entity_fields: _EntityFields,
     data_source_fields: _DataSourceFields,
     config: _Config,
     data_source: _DataSource,
+    trusted: bool,
 ) -> _Mapping: ...
 def _config_types(config: _Config) -> None: ...
 def _config_key_type(key: str) -> None: ...
@@ -44,10 +49,27 @@ def _nested_entity_data_source_fields(
 def _nested_entity_config_fields(
     entity_fields: _EntityFields, config: _Config
 ) -> None: ...
+def _nested_entity_links(
+    entity_fields: _EntityFields, data_source_fields: _DataSourceFields
+) -> None: ...
 def _related_config_fields(
     data_source_fields: _DataSourceFields, config: _Config
 ) -> None: ...
 def _related_field_link(value: _FieldDef) -> None: ...
+def _deferred_config_fields(
+    entity: Any,
+    entity_fields: _EntityFields,
+    data_source_fields: _DataSourceFields,
+    config: _Config,
+    trusted: bool,
+) -> None: ...
+def _deferred_field(
+    data_source_fields: _DataSourceFields, name: str, trusted: bool
+) -> None: ...
+def _deferred_entity(entity: Any, field_type: _EntityFieldDef) -> None: ...
 def _get_mapping(
-    entity_fields: _EntityFields, data_source_fields: _DataSourceFields, config: _Config
+    entity_fields: _EntityFields,
+    data_source_fields: _DataSourceFields,
+    config: _Config,
+    trusted: bool,
 ) -> _Mapping: ...
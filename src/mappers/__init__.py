@@ -3,8 +3,12 @@
 :copyright: (c) 2019-2020 dry-python team.
 :license: BSD, see LICENSE for more details.
 """
+from _mappers.columns import Columns
+from _mappers.encoding import JSON
 from _mappers.factory import mapper_factory as Mapper
+from _mappers.mapper import Deferred
 from _mappers.mapper import Evaluated
+from _mappers.sources.dbapi import Description
 
 
-__all__ = ["Evaluated", "Mapper"]
+__all__ = ["Columns", "Deferred", "Description", "Evaluated", "JSON", "Mapper"]
@@ -0,0 +1,17 @@
+"""Registry of entity and data source backends.
+
+:copyright: (c) 2019-2020 dry-python team.
+:license: BSD, see LICENSE for more details.
+"""
+from _mappers.backends import register_data_source
+from _mappers.backends import register_entity
+from _mappers.backends import unregister_data_source
+from _mappers.backends import unregister_entity
+
+
+__all__ = [
+    "register_data_source",
+    "register_entity",
+    "unregister_data_source",
+    "unregister_entity",
+]
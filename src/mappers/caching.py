@@ -0,0 +1,9 @@
+"""Caching of the reader results.
+
+:copyright: (c) 2019-2020 dry-python team.
+:license: BSD, see LICENSE for more details.
+"""
+from _mappers.caching import LRUCache
+
+
+__all__ = ["LRUCache"]
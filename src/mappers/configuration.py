@@ -0,0 +1,10 @@
+"""Process-wide cache of the mapper configurations.
+
+:copyright: (c) 2019-2020 dry-python team.
+:license: BSD, see LICENSE for more details.
+"""
+from _mappers.configuration import cache_clear
+from _mappers.configuration import cache_info
+
+
+__all__ = ["cache_clear", "cache_info"]
@@ -4,6 +4,8 @@
 :license: BSD, see LICENSE for more details.
 """
 from _mappers.exceptions import MapperError
+from _mappers.exceptions import MultipleResultsError
+from _mappers.exceptions import NotFoundError
 
 
-__all__ = ["MapperError"]
+__all__ = ["MapperError", "MultipleResultsError", "NotFoundError"]
@@ -0,0 +1,10 @@
+"""Instrumentation of the reader calls.
+
+:copyright: (c) 2019-2020 dry-python team.
+:license: BSD, see LICENSE for more details.
+"""
+from _mappers.tracing import add_tracer
+from _mappers.tracing import remove_tracer
+
+
+__all__ = ["add_tracer", "remove_tracer"]
@@ -39,6 +39,13 @@ def _entities():
     except (SyntaxError, ImportError):
         pass
 
+    try:
+        import examples.msgspec_structs
+
+        yield examples.msgspec_structs
+    except (SyntaxError, ImportError):
+        pass
+
 
 @pytest.fixture(params=_entities())
 def e(request):
@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import List
 from typing import NewType
 from typing import Optional
 
@@ -40,6 +41,14 @@ class OptionalGroup(object):
     name = attrib(type=Optional[str])
 
 
+@attrs(slots=True, frozen=True)
+class FrozenGroup(object):
+    """Group domain model."""
+
+    primary_key = attrib(type=GroupId)
+    name = attrib(type=Optional[str])
+
+
 @attrs
 class UserGroup(object):
     """Group domain model."""
@@ -69,6 +78,15 @@ class UserChat(object):
     subscribers = attrib(type=User)
 
 
+@attrs
+class SubscribedChat(object):
+    """Chat domain model."""
+
+    primary_key = attrib(type=ChatId)
+    name = attrib(type=str)
+    subscribers = attrib(type=List[User])
+
+
 MessageId = NewType("MessageId", int)
 
 
@@ -94,6 +112,15 @@ class FlatMessage(object):
     text = attrib(type=str)
 
 
+@attrs
+class Writer(object):
+    """User domain model."""
+
+    primary_key = attrib(type=UserId)
+    name = attrib(type=str)
+    messages = attrib(type=List[FlatMessage])
+
+
 @attrs
 class NamedMessage(object):
     """Message domain model."""
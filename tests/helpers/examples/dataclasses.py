@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from datetime import datetime
+from typing import List
 from typing import NewType
 from typing import Optional
 
@@ -38,6 +39,16 @@ class OptionalGroup:
     name: Optional[str]
 
 
+@dataclass(frozen=True)
+class FrozenGroup:
+    """Group domain model."""
+
+    __slots__ = ("primary_key", "name")
+
+    primary_key: GroupId
+    name: Optional[str]
+
+
 @dataclass
 class UserGroup:
     """Group domain model."""
@@ -67,6 +78,15 @@ class UserChat:
     subscribers: User
 
 
+@dataclass
+class SubscribedChat:
+    """Chat domain model."""
+
+    primary_key: ChatId
+    name: str
+    subscribers: List[User]
+
+
 MessageId = NewType("MessageId", int)
 
 
@@ -92,6 +112,15 @@ class FlatMessage:
     text: str
 
 
+@dataclass
+class Writer:
+    """User domain model."""
+
+    primary_key: UserId
+    name: str
+    messages: List[FlatMessage]
+
+
 @dataclass
 class NamedMessage:
     """Message domain model."""
@@ -0,0 +1,136 @@
+from datetime import datetime
+from typing import List
+from typing import NewType
+from typing import Optional
+
+from msgspec import Struct
+
+
+UserId = NewType("UserId", int)
+
+
+class User(Struct):
+    """User domain model."""
+
+    primary_key: UserId
+    created: datetime
+    modified: datetime
+    name: str
+    about: str
+    avatar: str
+
+
+GroupId = NewType("GroupId", int)
+
+
+class Group(Struct):
+    """Group domain model."""
+
+    primary_key: GroupId
+    name: str
+
+
+class OptionalGroup(Struct):
+    """Group domain model."""
+
+    primary_key: GroupId
+    name: Optional[str]
+
+
+class FrozenGroup(Struct, frozen=True):
+    """Group domain model."""
+
+    primary_key: GroupId
+    name: Optional[str]
+
+
+class UserGroup(Struct):
+    """Group domain model."""
+
+    primary_key: GroupId
+    name: User
+
+
+ChatId = NewType("ChatId", int)
+
+
+class Chat(Struct):
+    """Chat domain model."""
+
+    primary_key: ChatId
+    name: str
+    is_hidden: bool
+
+
+class UserChat(Struct):
+    """Chat domain model."""
+
+    primary_key: ChatId
+    name: str
+    subscribers: User
+
+
+class SubscribedChat(Struct):
+    """Chat domain model."""
+
+    primary_key: ChatId
+    name: str
+    subscribers: List[User]
+
+
+MessageId = NewType("MessageId", int)
+
+
+class Message(Struct):
+    """Message domain model."""
+
+    primary_key: MessageId
+    user: User
+    text: str
+
+    def written_by(self, user: User) -> bool:
+        """Check if message was written by given user."""
+        return self.user.primary_key == user.primary_key
+
+
+class FlatMessage(Struct):
+    """Message domain model."""
+
+    primary_key: MessageId
+    user_id: UserId
+    text: str
+
+
+class Writer(Struct):
+    """User domain model."""
+
+    primary_key: UserId
+    name: str
+    messages: List[FlatMessage]
+
+
+class NamedMessage(Struct):
+    """Message domain model."""
+
+    primary_key: MessageId
+    username: str
+    text: str
+
+
+class TotalMessage(Struct):
+    """Message domain model."""
+
+    primary_key: MessageId
+    text: str
+    total: int
+
+
+DeliveryId = NewType("DeliveryId", int)
+
+
+class Delivery(Struct):
+    """Delivery domain model."""
+
+    primary_key: DeliveryId
+    message: Message
+    service: str
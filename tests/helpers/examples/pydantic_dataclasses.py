@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import List
 from typing import NewType
 from typing import Optional
 
@@ -39,6 +40,14 @@ class OptionalGroup:
     name: Optional[str]
 
 
+@dataclass(frozen=True)
+class FrozenGroup:
+    """Group domain model."""
+
+    primary_key: GroupId
+    name: Optional[str]
+
+
 @dataclass
 class UserGroup:
     """Group domain model."""
@@ -68,6 +77,15 @@ class UserChat:
     subscribers: User
 
 
+@dataclass
+class SubscribedChat:
+    """Chat domain model."""
+
+    primary_key: ChatId
+    name: str
+    subscribers: List[User]
+
+
 MessageId = NewType("MessageId", int)
 
 
@@ -93,6 +111,15 @@ class FlatMessage:
     text: str
 
 
+@dataclass
+class Writer:
+    """User domain model."""
+
+    primary_key: UserId
+    name: str
+    messages: List[FlatMessage]
+
+
 @dataclass
 class NamedMessage:
     """Message domain model."""
@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import List
 from typing import NewType
 from typing import Optional
 
@@ -36,6 +37,18 @@ class OptionalGroup(BaseModel):
     name: Optional[str]
 
 
+class FrozenGroup(BaseModel):
+    """Group domain model."""
+
+    primary_key: GroupId
+    name: Optional[str]
+
+    class Config:
+        """Model configuration."""
+
+        allow_mutation = False
+
+
 class UserGroup(BaseModel):
     """Group domain model."""
 
@@ -62,6 +75,14 @@ class UserChat(BaseModel):
     subscribers: User
 
 
+class SubscribedChat(BaseModel):
+    """Chat domain model."""
+
+    primary_key: ChatId
+    name: str
+    subscribers: List[User]
+
+
 MessageId = NewType("MessageId", int)
 
 
@@ -85,6 +106,14 @@ class FlatMessage(BaseModel):
     text: str
 
 
+class Writer(BaseModel):
+    """User domain model."""
+
+    primary_key: UserId
+    name: str
+    messages: List[FlatMessage]
+
+
 class NamedMessage(BaseModel):
     """Message domain model."""
 
@@ -19,3 +19,60 @@ def _models():
 def m(request):
     """Parametrized fixture with all possible data sources."""
     return request.param()
+
+
+@pytest.fixture()
+def s():
+    """Import SQLAlchemy models."""
+    pytest.importorskip("sqlalchemy")
+
+    import sqlalchemy_project.models
+
+    return sqlalchemy_project.models
+
+
+@pytest.fixture()
+def session(s):
+    """Session bound to the database with example rows."""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    engine = create_engine("sqlite://")
+    s.Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    s.examples(session)
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@pytest.fixture()
+def connection():
+    """DB-API connection to the database with example rows."""
+    import sqlite3
+
+    connection = sqlite3.connect(":memory:")
+    connection.executescript(
+        """
+        CREATE TABLE user (
+            id INTEGER PRIMARY KEY,
+            created TIMESTAMP NOT NULL,
+            modified TIMESTAMP NOT NULL,
+            name TEXT NOT NULL,
+            about TEXT NOT NULL,
+            avatar TEXT NOT NULL
+        );
+        CREATE TABLE message (
+            id INTEGER PRIMARY KEY,
+            user_id INTEGER NOT NULL REFERENCES user (id),
+            text TEXT NOT NULL
+        );
+        INSERT INTO user (id, created, modified, name, about, avatar) VALUES
+            (1, '2019-01-01 00:00:00', '2019-01-01 00:00:00', '', '', ''),
+            (2, '2019-01-01 00:00:00', '2019-01-01 00:00:00', '', '', '');
+        INSERT INTO message VALUES (1, 1, '');
+        INSERT INTO message VALUES (2, 2, '');
+        """
+    )
+    yield connection
+    connection.close()
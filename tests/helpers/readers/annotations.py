@@ -1,7 +1,10 @@
+from typing import Iterable
+from typing import Iterator
 from typing import List
 from typing import Optional
 
 from django.db.models import Count
+from django.db.models import F
 
 from django_project import models
 
@@ -19,6 +22,30 @@ def _get_load_users(mapper, user):
     return load_users
 
 
+def _get_load_users_iterator(mapper, user):
+    @mapper.reader
+    def load_users() -> Iterator[user]:
+        return models.UserModel.objects.all()
+
+    return load_users
+
+
+def _get_load_users_iterable(mapper, user):
+    @mapper.reader
+    def load_users() -> Iterable[user]:
+        return models.UserModel.objects.all()
+
+    return load_users
+
+
+def _get_load_users_chunked(mapper, user, chunk_size):
+    @mapper.reader.chunked(chunk_size)
+    def load_users() -> Iterator[user]:
+        return models.UserModel.objects.all()
+
+    return load_users
+
+
 def _get_load_user(mapper, user, user_id):
     @mapper.reader
     def load_user(primary_key: user_id) -> user:
@@ -35,6 +62,14 @@ def _get_load_user_or_none(mapper, user, user_id):
     return load_user
 
 
+def _get_load_users_batch(mapper, ret, batch_size):
+    @mapper.batch_reader("primary_key", batch_size)
+    def load_users() -> ret:
+        return models.UserModel.objects.all()
+
+    return load_users
+
+
 def _get_load_messages(mapper, message):
     @mapper.reader
     def load_messages() -> List[message]:
@@ -52,6 +87,14 @@ def _get_load_total_messages(mapper, message, field_name):
     return load_messages
 
 
+def _get_load_text_total_messages(mapper, message):
+    @mapper.reader
+    def load_messages() -> List[message]:
+        return models.MessageModel.objects.annotate(total=F("text"))
+
+    return load_messages
+
+
 def _get_load_deliveries(mapper, delivery):
     @mapper.reader
     def load_deliveries() -> List[delivery]:
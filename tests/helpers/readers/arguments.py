@@ -1,7 +1,10 @@
+from typing import Iterable
+from typing import Iterator
 from typing import List
 from typing import Optional
 
 from django.db.models import Count
+from django.db.models import F
 
 from django_project import models
 
@@ -19,6 +22,32 @@ def _get_load_users(mapper, user):
     return load_users
 
 
+def _get_load_users_iterator(mapper, user):
+    @mapper.reader.of(Iterator[user])
+    def load_users():
+        return models.UserModel.objects.all()
+
+    return load_users
+
+
+def _get_load_users_iterable(mapper, user):
+    @mapper.reader.of(Iterable[user])
+    def load_users():
+        return models.UserModel.objects.all()
+
+    return load_users
+
+
+def _get_load_users_chunked(mapper, user, chunk_size):
+    reader = mapper.reader.of(Iterator[user]).chunked(chunk_size)
+
+    @reader
+    def load_users():
+        return models.UserModel.objects.all()
+
+    return load_users
+
+
 def _get_load_user(mapper, user, user_id):
     @mapper.reader.of(user)
     def load_user(primary_key):
@@ -35,6 +64,16 @@ def _get_load_user_or_none(mapper, user, user_id):
     return load_user
 
 
+def _get_load_users_batch(mapper, ret, batch_size):
+    reader = mapper.batch_reader("primary_key", batch_size).of(ret)
+
+    @reader
+    def load_users():
+        return models.UserModel.objects.all()
+
+    return load_users
+
+
 def _get_load_messages(mapper, message):
     @mapper.reader.of(List[message])
     def load_messages():
@@ -52,6 +91,14 @@ def _get_load_total_messages(mapper, message, field_name):
     return load_messages
 
 
+def _get_load_text_total_messages(mapper, message):
+    @mapper.reader.of(List[message])
+    def load_messages():
+        return models.MessageModel.objects.annotate(total=F("text"))
+
+    return load_messages
+
+
 def _get_load_deliveries(mapper, delivery):
     @mapper.reader.of(List[delivery])
     def load_deliveries():
@@ -0,0 +1,76 @@
+from typing import AsyncIterator
+from typing import List
+from typing import Optional
+
+from asgiref.sync import async_to_sync
+
+from django_project import models
+
+
+def get(name, mapper, *args):
+    """Define reader function."""
+    return globals()["_get_" + name](mapper, *args)
+
+
+def run(reader, *args):
+    """Await reader result in the current thread."""
+
+    async def main():
+        return await reader(*args)
+
+    return async_to_sync(main)()
+
+
+def collect(reader, *args):
+    """Consume asynchronous iterator returned by reader."""
+
+    async def main():
+        return [entity async for entity in reader(*args)]
+
+    return async_to_sync(main)()
+
+
+def _get_load_users(mapper, user):
+    @mapper.reader
+    async def load_users() -> List[user]:
+        return models.UserModel.objects.all()
+
+    return load_users
+
+
+def _get_load_users_iterator(mapper, user):
+    @mapper.reader.chunked(1)
+    async def load_users() -> AsyncIterator[user]:
+        return models.UserModel.objects.all()
+
+    return load_users
+
+
+def _get_load_users_parallel(mapper, user):
+    @mapper.reader.parallel()
+    async def load_users() -> List[user]:
+        return models.UserModel.objects.all()
+
+    return load_users
+
+
+def _get_load_user(mapper, user, user_id):
+    @mapper.reader
+    async def load_user(primary_key: user_id) -> user:
+        return models.UserModel.objects.filter(pk=primary_key)
+
+    return load_user
+
+
+def _get_load_user_or_none(mapper, user, user_id):
+    @mapper.reader.of(Optional[user])
+    async def load_user(primary_key):
+        return models.UserModel.objects.filter(pk=primary_key)
+
+    return load_user
+
+
+def _get_invalid_converter(mapper, value):
+    @mapper.reader.of(value)
+    async def invalid():
+        pass  # pragma: no cover
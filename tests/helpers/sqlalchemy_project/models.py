@@ -0,0 +1,111 @@
+from datetime import datetime
+
+from sqlalchemy import Column
+from sqlalchemy import DateTime
+from sqlalchemy import ForeignKey
+from sqlalchemy import Integer
+from sqlalchemy import String
+from sqlalchemy import Text
+from sqlalchemy.orm import relationship
+
+try:
+    from sqlalchemy.orm import declarative_base
+except ImportError:
+    # We are on SQLAlchemy 1.3 or older.
+    from sqlalchemy.ext.declarative import declarative_base
+
+
+Base = declarative_base()
+
+
+class UserModel(Base):
+    """User table."""
+
+    __tablename__ = "user"
+
+    id = Column(Integer, primary_key=True)
+    created = Column(DateTime, nullable=False, default=datetime.now)
+    modified = Column(DateTime, nullable=False, default=datetime.now)
+    name = Column(String(255), nullable=False)
+    about = Column(Text, nullable=False)
+    avatar = Column(String(100), nullable=False)
+
+
+class GroupModel(Base):
+    """Group table."""
+
+    __tablename__ = "group"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(255), nullable=True)
+
+
+class ChatModel(Base):
+    """Chat table."""
+
+    __tablename__ = "chat"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(255), nullable=False)
+    subscribers = relationship(
+        "UserModel", secondary="chat_subscription", backref="chats"
+    )
+
+
+class ChatSubscriptionModel(Base):
+    """Chat subscription table."""
+
+    __tablename__ = "chat_subscription"
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("user.id"), nullable=False)
+    chat_id = Column(Integer, ForeignKey("chat.id"), nullable=False)
+
+
+class MessageModel(Base):
+    """Message table."""
+
+    __tablename__ = "message"
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("user.id"), nullable=False)
+    user = relationship("UserModel", backref="messages")
+    text = Column(Text, nullable=False)
+
+
+class MessageDeliveryModel(Base):
+    """Message delivery domain model."""
+
+    __tablename__ = "message_delivery"
+
+    id = Column(Integer, primary_key=True)
+    message_id = Column(Integer, ForeignKey("message.id"), nullable=False)
+    message = relationship("MessageModel", backref="deliveries")
+    service = Column(String(100), nullable=False)
+
+
+class PinModel(Base):
+    """Pinned message table."""
+
+    __tablename__ = "pin"
+
+    id = Column(Integer, primary_key=True)
+    message_id = Column(Integer, ForeignKey("message.id"), nullable=True)
+    message = relationship("MessageModel", backref="pins")
+
+
+def examples(session):
+    """Populate database with the same rows as the Django fixture."""
+    created = datetime(2019, 1, 1)
+    for pk in [1, 2]:
+        session.add(
+            UserModel(
+                id=pk, created=created, modified=created, name="", about="", avatar=""
+            )
+        )
+        session.add(GroupModel(id=pk, name=None if pk == 1 else ""))
+        session.add(ChatModel(id=pk, name=""))
+        session.add(MessageModel(id=pk, user_id=pk, text=""))
+        session.add(MessageDeliveryModel(id=pk, message_id=pk, service=""))
+        session.add(PinModel(id=pk, message_id=pk if pk == 1 else None))
+    session.commit()
@@ -0,0 +1,115 @@
+"""Tests related to asynchronous readers."""
+from logging import Logger
+
+import django
+import pytest
+
+from mappers import Mapper
+from mappers.exceptions import MapperError
+
+
+pytestmark = [
+    pytest.mark.django_db,
+    pytest.mark.skipif(
+        django.VERSION < (4, 1), reason="Async queryset API requires Django 4.1"
+    ),
+]
+
+
+@pytest.fixture()
+def a():
+    """Asynchronous reader definitions."""
+    import readers.coroutines
+
+    return readers.coroutines
+
+
+def test_result_list_converter(e, m, a):
+    """Infer collection converter from the coroutine result annotation.
+
+    This code should return a list of `User` instances.
+    """
+    mapper = Mapper(e.User, m.UserModel, {"primary_key": "id"})
+
+    load_users = a.get("load_users", mapper, e.User)
+
+    result = a.run(load_users)
+
+    assert isinstance(result, list)
+
+    user1, user2 = result
+
+    assert isinstance(user1, e.User)
+    assert isinstance(user2, e.User)
+
+
+def test_result_object_converter(e, m, a):
+    """Return a single object.
+
+    If instead of converter annotation will be an entity class, we
+    should return a single object.  Not a collection.
+    """
+    mapper = Mapper(e.User, m.UserModel, {"primary_key": "id"})
+
+    load_user = a.get("load_user", mapper, e.User, e.UserId)
+
+    user1 = a.run(load_user, 1)
+
+    assert isinstance(user1, e.User)
+
+    with pytest.raises(m.UserModel.DoesNotExist):
+        a.run(load_user, 3)
+
+
+def test_result_optional_converter(e, m, a):
+    """Return a single object or None."""
+    mapper = Mapper(e.User, m.UserModel, {"primary_key": "id"})
+
+    load_user = a.get("load_user_or_none", mapper, e.User, e.UserId)
+
+    user1 = a.run(load_user, 1)
+
+    assert isinstance(user1, e.User)
+
+    user3 = a.run(load_user, 3)
+
+    assert user3 is None
+
+
+def test_result_iterator_converter(e, m, a):
+    """Stream entities with asynchronous iterator."""
+    mapper = Mapper(e.User, m.UserModel, {"primary_key": "id"})
+
+    load_users = a.get("load_users_iterator", mapper, e.User)
+
+    user1, user2 = a.collect(load_users)
+
+    assert isinstance(user1, e.User)
+    assert isinstance(user2, e.User)
+
+
+@pytest.mark.parametrize("value", [None, False, Logger])
+def test_result_unknown_converter(e, m, a, value):
+    """Raise error in unclear situation."""
+    mapper = Mapper(e.User, m.UserModel, {"primary_key": "id"})
+
+    expected = ""
+
+    with pytest.raises(MapperError) as exc_info:
+        a.get("invalid_converter", mapper, value)
+
+    message = str(exc_info.value)
+    assert message == expected
+
+
+def test_parallel_reader(e, m, a):
+    """Coroutines could not be read in parallel."""
+    mapper = Mapper(e.User, m.UserModel, {"primary_key": "id"})
+
+    expected = ""
+
+    with pytest.raises(MapperError) as exc_info:
+        a.get("load_users_parallel", mapper, e.User)
+
+    message = str(exc_info.value)
+    assert message == expected
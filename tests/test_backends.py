@@ -0,0 +1,288 @@
+"""Tests related to the registry of entity and data source backends."""
+from collections import namedtuple
+from datetime import datetime
+from typing import List
+
+import pytest
+
+from mappers import Mapper
+from mappers.backends import register_data_source
+from mappers.backends import register_entity
+from mappers.backends import unregister_data_source
+from mappers.backends import unregister_entity
+from mappers.exceptions import MapperError
+
+
+pytestmark = pytest.mark.django_db
+
+
+# Helpers.
+
+
+class Record(object):
+    """Entity which declares its fields in the class attribute."""
+
+    __fields__ = ()
+
+    def __init__(self, *values):
+        for name, value in zip(self.__fields__, values):
+            setattr(self, name, value)
+
+
+class Point(Record):
+    """Point with coordinates."""
+
+    __fields__ = ("x", "y")
+
+
+class Person(Record):
+    """Person with a name."""
+
+    __fields__ = ("primary_key", "name")
+
+
+class Table(object):
+    """Data source made of dictionaries with the given keys."""
+
+    def __init__(self, *columns):
+        self.columns = columns
+
+
+class Rows(object):
+    """Rows of the dictionary data source."""
+
+    def __init__(self, getter, rows):
+        self.getter = getter
+        self.rows = rows
+
+    def __iter__(self):
+        return (self.getter(row) for row in self.rows)
+
+    def iterator(self):
+        """Iterate over entities."""
+        return iter(self)
+
+    def get(self):
+        """Return the only entity."""
+        (row,) = self.rows
+        return self.getter(row)
+
+    def first(self):
+        """Return the first entity if any."""
+        return self.getter(self.rows[0]) if self.rows else None
+
+
+def is_record(entity):
+    """Detect entity classes with declared fields."""
+    return isinstance(entity, type) and issubclass(entity, Record)
+
+
+def get_record_fields(entity):
+    """Describe declared fields of the entity."""
+    return [
+        (
+            name,
+            {"is_optional": False, "is_entity": False, "is_collection": False},
+        )
+        for name in entity.__fields__
+    ]
+
+
+def get_record_factory(fields, entity, trusted):
+    """Entities are created from positional values."""
+    return entity
+
+
+def is_table(data_source):
+    """Detect dictionary data sources."""
+    return isinstance(data_source, Table)
+
+
+def get_table_fields(data_source):
+    """Describe columns of the dictionary data source."""
+    return {
+        name: {"is_nullable": False, "is_link": False, "is_collection": False}
+        for name in data_source.columns
+    }
+
+
+def table_factory(data_source, fields, entity_factory, mapping):
+    """Read rows of the dictionary data source."""
+
+    def getter(row):
+        return entity_factory(*[row[mapping[name]] for name, _field in fields])
+
+    return lambda rows: Rows(getter, rows)
+
+
+# Fixtures.
+
+
+@pytest.fixture()
+def detected():
+    """Register entity backend and collect values passed to its detector."""
+    result = []
+
+    def detect(entity):
+        result.append(entity)
+        return is_record(entity)
+
+    register_entity(detect, get_record_fields, get_record_factory)
+    yield result
+    unregister_entity(detect)
+
+
+@pytest.fixture()
+def table():
+    """Register dictionary data source backend."""
+    register_data_source(is_table, get_table_fields, table_factory)
+    yield
+    unregister_data_source(is_table)
+
+
+# Entities.
+
+
+def test_registered_entity(m, detected):
+    """Registered entity backend is used by mappers."""
+    mapper = Mapper(Person, m.UserModel, {"primary_key": "id"})
+
+    @mapper.reader.of(List[Person])
+    def load_users():
+        return m.UserModel.objects.order_by("id")
+
+    user1, user2 = load_users()
+
+    assert isinstance(user1, Person)
+    assert user1.primary_key == 1
+    assert user2.name == ""
+
+
+def test_registered_entity_detected_once(m, detected):
+    """Entity class is detected once for all mappers."""
+
+    class Admin(Record):
+        """Administrator with a name."""
+
+        __fields__ = ("primary_key", "name")
+
+    Mapper(Admin, m.UserModel, {"primary_key": "id"})
+    Mapper(Admin, m.UserModel, {"primary_key": "id", "name": "name"})
+
+    assert detected.count(Admin) == 1
+
+
+def test_registered_entity_after_mapper(m):
+    """Backend registered after the mapper definition replaces built-in one."""
+
+    class Member(namedtuple("Member", ["primary_key", "name"])):
+        """Member with a name."""
+
+        __slots__ = ()
+        __fields__ = ("primary_key", "name")
+
+    created = []
+
+    def is_member(entity):
+        return entity is Member
+
+    def get_member_factory(fields, entity, trusted):
+        def factory(*values):
+            created.append(values)
+            return entity(*values)
+
+        return factory
+
+    mapper1 = Mapper(Member, m.UserModel, {"primary_key": "id"})
+
+    register_entity(is_member, get_record_fields, get_member_factory)
+    try:
+        mapper2 = Mapper(Member, m.UserModel, {"primary_key": "id"})
+    finally:
+        unregister_entity(is_member)
+
+    @mapper2.reader.of(List[Member])
+    def load_members():
+        return m.UserModel.objects.order_by("id")
+
+    member1, member2 = load_members()
+
+    assert mapper1.iterable is not mapper2.iterable
+    assert created == [(1, ""), (2, "")]
+
+
+def test_unregistered_entity(m):
+    """Entity classes of the removed backend are not supported."""
+
+    class Group(Record):
+        """Group with a name."""
+
+        __fields__ = ("primary_key",)
+
+    register_entity(is_record, get_record_fields, get_record_factory)
+    unregister_entity(is_record)
+
+    expected = ""
+
+    with pytest.raises(MapperError) as exc_info:
+        Mapper(Group, m.UserModel, {"primary_key": "id"})
+
+    message = str(exc_info.value)
+    assert message == expected
+
+
+# Data sources.
+
+
+def test_registered_data_source(e, table):
+    """Registered data source backend is used by mappers."""
+    mapper = Mapper(
+        e.User,
+        Table("id", "created", "modified", "name", "about", "avatar"),
+        {"primary_key": "id"},
+    )
+
+    @mapper.reader.of(e.User)
+    def load_user(name):
+        return [
+            {
+                "id": 1,
+                "created": datetime(2020, 1, 1),
+                "modified": datetime(2020, 1, 1),
+                "name": name,
+                "about": "",
+                "avatar": "",
+            }
+        ]
+
+    user = load_user("Bob")
+
+    assert isinstance(user, e.User)
+    assert user.primary_key == 1
+    assert user.name == "Bob"
+
+
+def test_registered_entity_and_data_source(detected, table):
+    """Both entity and data source could be provided by registered backends."""
+    mapper = Mapper(Point, Table("x", "y"))
+
+    @mapper.reader.of(List[Point])
+    def load_points():
+        return [{"x": 1, "y": 2}, {"x": 3, "y": 4}]
+
+    point1, point2 = load_points()
+
+    assert (point1.x, point1.y, point2.x, point2.y) == (1, 2, 3, 4)
+
+
+def test_unregistered_data_source(e, table):
+    """Unknown data sources are not supported."""
+    unregister_data_source(is_table)
+
+    expected = ""
+
+    with pytest.raises(MapperError) as exc_info:
+        Mapper(e.User, Table("id", "name"), {"primary_key": "id"})
+
+    message = str(exc_info.value)
+    assert message == expected
@@ -0,0 +1,154 @@
+"""Tests related to the mapper configuration cache."""
+import pytest
+
+from mappers import Evaluated
+from mappers import Mapper
+from mappers.configuration import cache_clear
+from mappers.configuration import cache_info
+from mappers.exceptions import MapperError
+
+
+pytestmark = pytest.mark.django_db
+
+
+def test_reuse_configuration(e, m):
+    """Reuse configuration of structurally identical mappers.
+
+    Mappers defined with the same entity, data source, and config
+    should share compiled iterable.
+    """
+    cache_clear()
+
+    mapper1 = Mapper(
+        e.TotalMessage, m.MessageModel, {"primary_key": "id", "total": Evaluated()}
+    )
+    mapper2 = Mapper(
+        e.TotalMessage, m.MessageModel, {"total": Evaluated(), "primary_key": "id"}
+    )
+
+    assert mapper1 is not mapper2
+    assert mapper1.iterable is mapper2.iterable
+    assert cache_info() == (1, 1, 1)
+
+
+def test_different_configuration(e, m):
+    """Do not reuse configuration of different mapper definitions."""
+    cache_clear()
+
+    mapper1 = Mapper(
+        e.TotalMessage, m.MessageModel, {"primary_key": "id", "total": Evaluated()}
+    )
+    mapper2 = Mapper(
+        e.TotalMessage,
+        m.MessageModel,
+        {"primary_key": "id", "total": Evaluated("total_number")},
+    )
+    mapper3 = Mapper(
+        e.TotalMessage,
+        m.MessageModel,
+        {"primary_key": "id", "total": Evaluated()},
+        trusted=True,
+    )
+
+    assert mapper1.iterable is not mapper2.iterable
+    assert mapper1.iterable is not mapper3.iterable
+    assert cache_info() == (0, 3, 3)
+
+
+def test_reuse_nested_configuration(e, m):
+    """Nested mappers share configuration with top level mappers."""
+    cache_clear()
+
+    user_mapper = Mapper(e.User, m.UserModel, {"primary_key": "id"})
+    message_mapper = Mapper(
+        e.Message,
+        m.MessageModel,
+        {"primary_key": "id", "user": Mapper({"primary_key": "id"})},
+    )
+
+    assert message_mapper.iterable.mapping["user"].iterable is user_mapper.iterable
+    assert cache_info() == (1, 2, 2)
+
+
+def test_reuse_projection(e, m):
+    """Reuse projection of mappers with the same resolved mapping.
+
+    Configs which differ only in fields mapped to themselves produce
+    the same projection.
+    """
+    cache_clear()
+
+    mapper1 = Mapper(e.User, m.UserModel, {"primary_key": "id"})
+    mapper2 = Mapper(e.User, m.UserModel, {"primary_key": "id", "name": "name"})
+
+    assert mapper1.iterable is mapper2.iterable
+    assert cache_info() == (0, 2, 2)
+
+
+def test_clear_configuration(e, m):
+    """Clear cached configurations and statistics."""
+    cache_clear()
+
+    mapper1 = Mapper(e.User, m.UserModel, {"primary_key": "id"})
+
+    cache_clear()
+
+    assert cache_info() == (0, 0, 0)
+
+    mapper2 = Mapper(e.User, m.UserModel, {"primary_key": "id"})
+
+    assert mapper1.iterable is not mapper2.iterable
+    assert cache_info() == (0, 1, 1)
+
+
+def test_related_model_introspection(e, m, monkeypatch):
+    """Related models are introspected once, on the first use of the link."""
+    import _mappers.sources.django
+
+    introspected = []
+    disassemble_fields = _mappers.sources.django._disassemble_fields
+
+    def spy(data_source, exclude):
+        introspected.append(data_source)
+        return disassemble_fields(data_source, exclude)
+
+    monkeypatch.setattr(_mappers.sources.django, "_disassemble_fields", spy)
+    cache_clear()
+
+    Mapper(e.FlatMessage, m.MessageModel, {"primary_key": "id"})
+
+    assert introspected == [m.MessageModel]
+
+    Mapper(
+        e.NamedMessage,
+        m.MessageModel,
+        {"primary_key": "id", "username": ("user", "name")},
+    )
+    Mapper(
+        e.Message,
+        m.MessageModel,
+        {"primary_key": "id", "user": Mapper({"primary_key": "id"})},
+    )
+
+    assert introspected.count(m.MessageModel) == 1
+    assert introspected.count(m.UserModel) == 1
+
+    cache_clear()
+    Mapper(e.FlatMessage, m.MessageModel, {"primary_key": "id"})
+
+    assert introspected.count(m.MessageModel) == 2
+
+
+@pytest.mark.parametrize("value", [["id"], {"id": "id"}])
+def test_unhashable_configuration(e, m, value):
+    """Unhashable config values are reported as invalid configuration."""
+    cache_clear()
+
+    expected = ""
+
+    with pytest.raises(MapperError) as exc_info:
+        Mapper(e.User, m.UserModel, {"primary_key": value})
+
+    message = str(exc_info.value)
+    assert message == expected
+    assert cache_info() == (0, 0, 0)
@@ -0,0 +1,233 @@
+"""Tests related to the caching of reader results."""
+from typing import Iterator
+from typing import List
+from typing import Optional
+
+import pytest
+
+from mappers import Mapper
+from mappers.caching import LRUCache
+from mappers.exceptions import MapperError
+
+
+pytestmark = pytest.mark.django_db
+
+
+# Readers.
+
+
+def test_cached_reader(e, m, django_assert_num_queries):
+    """Return cached result for the same reader arguments."""
+    mapper = Mapper(e.User, m.UserModel, {"primary_key": "id"})
+
+    reader = mapper.reader.cached().of(e.User)
+
+    @reader
+    def load_user(primary_key):
+        return m.UserModel.objects.filter(id=primary_key)
+
+    with django_assert_num_queries(2):
+        user1 = load_user(1)
+        user2 = load_user(primary_key=2)
+        assert load_user(1) is user1
+        assert load_user(primary_key=2) is user2
+
+    assert load_user.cache_info() == (2, 2)
+
+
+def test_cached_reader_keyword_arguments(e, m, django_assert_num_queries):
+    """Arguments passed by position and by name share the cached result."""
+    mapper = Mapper(e.User, m.UserModel, {"primary_key": "id"})
+
+    reader = mapper.reader.cached().of(e.User)
+
+    @reader
+    def load_user(primary_key, name=""):
+        return m.UserModel.objects.filter(id=primary_key, name=name)
+
+    with django_assert_num_queries(1):
+        user = load_user(1)
+        assert load_user(primary_key=1) is user
+        assert load_user(1, "") is user
+        assert load_user(1, name="") is user
+
+    load_user.invalidate(primary_key=1)
+
+    with django_assert_num_queries(1):
+        assert load_user(1) is not user
+
+
+def test_cached_reader_none(e, m, django_assert_num_queries):
+    """Missing optional entity is cached as well."""
+    mapper = Mapper(e.User, m.UserModel, {"primary_key": "id"})
+
+    reader = mapper.reader.cached().of(Optional[e.User])
+
+    @reader
+    def load_user(primary_key):
+        return m.UserModel.objects.filter(id=primary_key)
+
+    with django_assert_num_queries(1):
+        assert load_user(3) is None
+        assert load_user(3) is None
+
+
+def test_cached_reader_invalidate(e, m, django_assert_num_queries):
+    """Reader result could be removed from the cache."""
+    mapper = Mapper(e.User, m.UserModel, {"primary_key": "id"})
+
+    reader = mapper.reader.cached().of(e.User)
+
+    @reader
+    def load_user(primary_key):
+        return m.UserModel.objects.filter(id=primary_key)
+
+    load_user(1)
+    load_user(2)
+
+    m.UserModel.objects.filter(id=1).update(name="new")
+    load_user.invalidate(1)
+
+    with django_assert_num_queries(1):
+        assert load_user(1).name == "new"
+        assert load_user(2).name == ""
+
+
+def test_cached_reader_clear(e, m, django_assert_num_queries):
+    """All results of the reader could be removed from the shared cache."""
+    mapper = Mapper(e.User, m.UserModel, {"primary_key": "id"})
+    cache = LRUCache()
+
+    reader = mapper.reader.cached(cache).of(e.User)
+
+    @reader
+    def load_user(primary_key):
+        return m.UserModel.objects.filter(id=primary_key)
+
+    reader = mapper.reader.cached(cache).of(List[e.User])
+
+    @reader
+    def load_users():
+        return m.UserModel.objects.all()
+
+    load_user(1)
+    load_user(2)
+    load_users()
+
+    load_user.clear()
+
+    with django_assert_num_queries(2):
+        load_user(1)
+        load_user(2)
+        load_users()
+
+
+def test_cached_reader_shared_namespace(e, m, django_assert_num_queries):
+    """Readers defined with the same name share results of the cache.
+
+    Namespace should not depend on the reader instance, so processes
+    using the same out of process backend share results.
+    """
+    cache = LRUCache()
+
+    def reader_factory():
+        mapper = Mapper(e.User, m.UserModel, {"primary_key": "id"})
+
+        reader = mapper.reader.cached(cache).of(e.User)
+
+        @reader
+        def load_user(primary_key):
+            return m.UserModel.objects.filter(id=primary_key)
+
+        return load_user
+
+    load_user1 = reader_factory()
+    load_user2 = reader_factory()
+
+    with django_assert_num_queries(1):
+        assert load_user1(1) is load_user2(1)
+
+
+def test_cached_reader_namespace(e, m, django_assert_num_queries):
+    """Readers of the same name are separated by explicit namespaces."""
+    cache = LRUCache()
+
+    def reader_factory(entity, model):
+        mapper = Mapper(entity, model, {"primary_key": "id"})
+
+        reader = mapper.reader.cached(cache, namespace=model.__name__).of(entity)
+
+        @reader
+        def load(primary_key):
+            return model.objects.filter(id=primary_key)
+
+        return load
+
+    load_user = reader_factory(e.User, m.UserModel)
+    load_group = reader_factory(e.OptionalGroup, m.GroupModel)
+
+    with django_assert_num_queries(2):
+        assert isinstance(load_user(1), e.User)
+        assert isinstance(load_group(1), e.OptionalGroup)
+
+
+def test_cached_reader_iterator(e, m):
+    """Iterators could not be cached."""
+    mapper = Mapper(e.User, m.UserModel, {"primary_key": "id"})
+
+    expected = ""
+
+    reader = mapper.reader.cached().of(Iterator[e.User])
+
+    with pytest.raises(MapperError) as exc_info:
+
+        @reader
+        def load_users():
+            raise RuntimeError
+
+    message = str(exc_info.value)
+    assert message == expected
+
+
+def test_cached_batch_reader(e, m):
+    """Batch readers could not be cached."""
+    mapper = Mapper(e.User, m.UserModel, {"primary_key": "id"})
+
+    expected = ""
+
+    with pytest.raises(MapperError) as exc_info:
+        mapper.batch_reader("primary_key").cached()
+
+    message = str(exc_info.value)
+    assert message == expected
+
+
+# Backends.
+
+
+def test_lru_cache_eviction():
+    """Least recently used value is evicted first."""
+    cache = LRUCache(maxsize=2)
+
+    cache.set(("reader", (1,), ()), "first")
+    cache.set(("reader", (2,), ()), "second")
+    cache.get(("reader", (1,), ()))
+    cache.set(("reader", (3,), ()), "third")
+
+    assert cache.get(("reader", (1,), ())) == "first"
+    assert cache.get(("reader", (2,), ())) is None
+    assert cache.get(("reader", (3,), ())) == "third"
+
+
+def test_lru_cache_ttl():
+    """Expired value is not returned."""
+    now = [0.0]
+    cache = LRUCache(ttl=10, timer=lambda: now[0])
+
+    cache.set(("reader", (), ()), "value")
+    now[0] = 9.0
+    assert cache.get(("reader", (), ())) == "value"
+
+    now[0] = 10.0
+    assert cache.get(("reader", (), ())) is None
+    assert not cache.data
@@ -0,0 +1,194 @@
+"""Tests related to the collection fields."""
+from typing import List
+
+import pytest
+
+from mappers import Columns
+from mappers import Deferred
+from mappers import Mapper
+from mappers.exceptions import MapperError
+
+
+pytestmark = pytest.mark.django_db
+
+
+# Loading.
+
+
+def test_many_to_many_collection(e, m, django_assert_num_queries):
+    """Load many-to-many collection with a single prefetch query."""
+    m.ChatSubscriptionModel.objects.create(chat_id=1, user_id=1)
+    m.ChatSubscriptionModel.objects.create(chat_id=1, user_id=2)
+
+    mapper = Mapper(
+        e.SubscribedChat,
+        m.ChatModel,
+        {"primary_key": "id", "subscribers": Mapper({"primary_key": "id"})},
+    )
+
+    @mapper.reader.of(List[e.SubscribedChat])
+    def load_chats():
+        return m.ChatModel.objects.order_by("id")
+
+    with django_assert_num_queries(2):
+        chat1, chat2 = load_chats()
+
+    assert [user.primary_key for user in chat1.subscribers] == [1, 2]
+    assert chat2.subscribers == []
+
+
+def test_reverse_foreign_key_collection(e, m, django_assert_num_queries):
+    """Load reverse foreign key collection with a single prefetch query."""
+    m.MessageModel.objects.create(user_id=1, text="second")
+
+    mapper = Mapper(
+        e.Writer,
+        m.UserModel,
+        {"primary_key": "id", "messages": Mapper({"primary_key": "id"})},
+    )
+
+    @mapper.reader.of(List[e.Writer])
+    def load_writers():
+        return m.UserModel.objects.order_by("id")
+
+    with django_assert_num_queries(2):
+        user1, user2 = load_writers()
+
+    assert [message.text for message in user1.messages] == ["", "second"]
+    assert [message.user_id for message in user1.messages] == [1, 1]
+    assert [message.primary_key for message in user2.messages] == [2]
+
+
+def test_collection_single_entity(e, m, django_assert_num_queries):
+    """Prefetch query is limited to the entities of the main query."""
+    m.ChatSubscriptionModel.objects.create(chat_id=1, user_id=1)
+    m.ChatSubscriptionModel.objects.create(chat_id=2, user_id=2)
+
+    mapper = Mapper(
+        e.SubscribedChat,
+        m.ChatModel,
+        {"primary_key": "id", "subscribers": Mapper({"primary_key": "id"})},
+    )
+
+    @mapper.reader.of(e.SubscribedChat)
+    def load_chat(primary_key):
+        return m.ChatModel.objects.filter(id=primary_key)
+
+    with django_assert_num_queries(2):
+        chat = load_chat(2)
+
+    assert [user.primary_key for user in chat.subscribers] == [2]
+
+
+def test_collection_sliced_queryset(e, m, django_assert_num_queries):
+    """Prefetch query uses keys of the fetched rows instead of a subquery."""
+    m.ChatSubscriptionModel.objects.create(chat_id=1, user_id=1)
+    m.ChatSubscriptionModel.objects.create(chat_id=2, user_id=2)
+
+    mapper = Mapper(
+        e.SubscribedChat,
+        m.ChatModel,
+        {"primary_key": "id", "subscribers": Mapper({"primary_key": "id"})},
+    )
+
+    @mapper.reader.of(List[e.SubscribedChat])
+    def load_chats():
+        return m.ChatModel.objects.order_by("-id")[:1]
+
+    with django_assert_num_queries(2) as context:
+        (chat,) = load_chats()
+
+    assert chat.primary_key == 2
+    assert [user.primary_key for user in chat.subscribers] == [2]
+    assert "LIMIT" not in context.captured_queries[1]["sql"]
+
+
+def test_reverse_foreign_key_related_field(m):
+    """Related field could be loaded through the reverse foreign key."""
+    mapper = Mapper(m.UserModel, {"primary_key": "id", "text": ("messages", "text")})
+
+    @mapper.reader.of(List[mapper.entity])
+    def load_users():
+        return m.UserModel.objects.order_by("id")
+
+    user1, user2 = load_users()
+
+    assert user1 == (1, "")
+    assert user2 == (2, "")
+
+
+# Validation.
+
+
+def test_collection_single_field(e, m):
+    """Collection entity field could not be loaded from the single relation."""
+    expected = ""
+
+    with pytest.raises(MapperError) as exc_info:
+        Mapper(
+            e.Writer,
+            m.MessageModel,
+            {
+                "primary_key": "id",
+                "name": "text",
+                "messages": Mapper({"primary_key": "id"}),
+            },
+        )
+
+    message = str(exc_info.value)
+    assert message == expected
+
+
+def test_collection_deferred_field(e, m):
+    """Collection mappers could not have deferred fields."""
+    expected = ""
+
+    with pytest.raises(MapperError) as exc_info:
+        Mapper(
+            e.SubscribedChat,
+            m.ChatModel,
+            {
+                "primary_key": "id",
+                "subscribers": Mapper(
+                    {"primary_key": "id", "about": Deferred()}, trusted=True
+                ),
+            },
+        )
+
+    message = str(exc_info.value)
+    assert message == expected
+
+
+def test_collection_columns(e, m):
+    """Collection fields could not be read as columns."""
+    mapper = Mapper(
+        e.SubscribedChat,
+        m.ChatModel,
+        {"primary_key": "id", "subscribers": Mapper({"primary_key": "id"})},
+    )
+
+    expected = ""
+
+    with pytest.raises(MapperError) as exc_info:
+
+        @mapper.reader.of(Columns[e.SubscribedChat])
+        def load_chats():
+            raise RuntimeError
+
+    message = str(exc_info.value)
+    assert message == expected
+
+
+def test_collection_sqlalchemy_field(e, s):
+    """Collection fields are supported by Django data sources only."""
+    expected = ""
+
+    with pytest.raises(MapperError) as exc_info:
+        Mapper(
+            e.SubscribedChat,
+            s.ChatModel,
+            {"primary_key": "id", "subscribers": Mapper({"primary_key": "id"})},
+        )
+
+    message = str(exc_info.value)
+    assert message == expected
@@ -0,0 +1,198 @@
+"""Tests related to the columnar reader results."""
+import pytest
+from django.db.models import BooleanField
+from django.db.models import Count
+from django.db.models import Value
+
+from mappers import Columns
+from mappers import Description
+from mappers import Evaluated
+from mappers import Mapper
+from mappers.exceptions import MapperError
+
+
+numpy = pytest.importorskip("numpy")
+
+
+pytestmark = pytest.mark.django_db
+
+
+# Data sources.
+
+
+def test_django_columns(e, m):
+    """Read entity fields as arrays of columns.
+
+    Entity instances should not be created.  Arrays should be typed
+    from the entity field annotations.
+    """
+    mapper = Mapper(
+        e.Chat, m.ChatModel, {"primary_key": "id", "is_hidden": Evaluated()}
+    )
+
+    @mapper.reader.of(Columns[e.Chat])
+    def load_chats():
+        is_hidden = Value(False, output_field=BooleanField())
+        return m.ChatModel.objects.annotate(is_hidden=is_hidden).order_by("id")
+
+    result = load_chats()
+
+    assert list(result) == ["primary_key", "name", "is_hidden"]
+    assert result["primary_key"].dtype == numpy.int64
+    assert result["name"].dtype == object
+    assert result["is_hidden"].dtype == bool
+    assert result["is_hidden"].tolist() == [False, False]
+
+
+def test_django_evaluated_columns(e, m):
+    """Read evaluated fields of the queryset as columns."""
+    mapper = Mapper(
+        e.TotalMessage,
+        m.MessageModel,
+        {"primary_key": "id", "total": Evaluated("total_number")},
+    )
+
+    @mapper.reader.of(Columns[e.TotalMessage])
+    def load_messages():
+        return m.MessageModel.objects.annotate(total_number=Count("id")).order_by("id")
+
+    result = load_messages()
+
+    assert result["total"].dtype == numpy.int64
+    assert result["total"].tolist() == [1, 1]
+
+
+def test_sqlalchemy_columns(e, s, session):
+    """Read selected columns of the SQLAlchemy query."""
+    from sqlalchemy import func
+
+    mapper = Mapper(
+        e.TotalMessage,
+        s.MessageModel,
+        {"primary_key": "id", "total": Evaluated("total_number")},
+    )
+
+    @mapper.reader.of(Columns[e.TotalMessage])
+    def load_messages():
+        return (
+            session.query(
+                s.MessageModel, func.count(s.MessageModel.id).label("total_number")
+            )
+            .group_by(s.MessageModel.id)
+            .order_by(s.MessageModel.id)
+        )
+
+    result = load_messages()
+
+    assert result["primary_key"].tolist() == [1, 2]
+    assert result["total"].tolist() == [1, 1]
+
+
+def test_dbapi_columns(e, connection):
+    """Find columns of the raw query result by name."""
+    mapper = Mapper(
+        e.FlatMessage, Description(["id", "user_id", "text"]), {"primary_key": "id"}
+    )
+
+    @mapper.reader.of(Columns[e.FlatMessage])
+    def load_messages():
+        return connection.execute("SELECT text, user_id, id FROM message ORDER BY id")
+
+    result = load_messages()
+
+    assert result["primary_key"].tolist() == [1, 2]
+    assert result["user_id"].tolist() == [1, 2]
+    assert result["text"].tolist() == ["", ""]
+
+
+def test_empty_columns(e, connection):
+    """Return empty arrays if the query result has no rows."""
+    mapper = Mapper(
+        e.FlatMessage, Description(["id", "user_id", "text"]), {"primary_key": "id"}
+    )
+
+    @mapper.reader.of(Columns[e.FlatMessage])
+    def load_messages():
+        return connection.execute("SELECT * FROM message WHERE id < 0")
+
+    result = load_messages()
+
+    assert result["primary_key"].dtype == numpy.int64
+    assert result["primary_key"].tolist() == []
+
+
+def test_chunked_columns(e, m):
+    """Arrays are filled from the rows of many chunks."""
+    m.ChatModel.objects.bulk_create(
+        [m.ChatModel(name=str(number)) for number in range(2500)]
+    )
+
+    mapper = Mapper(
+        e.Chat, m.ChatModel, {"primary_key": "id", "is_hidden": Evaluated()}
+    )
+
+    @mapper.reader.of(Columns[e.Chat])
+    def load_chats():
+        is_hidden = Value(False, output_field=BooleanField())
+        return m.ChatModel.objects.annotate(is_hidden=is_hidden).order_by("id")
+
+    result = load_chats()
+    expected = list(m.ChatModel.objects.order_by("id").values_list("id", flat=True))
+
+    assert len(result["primary_key"]) == 2502
+    assert result["primary_key"].tolist() == expected
+    assert result["name"].tolist()[2:] == [str(number) for number in range(2500)]
+
+
+def test_optional_columns(e, m):
+    """Nullable fields are stored in arrays of objects."""
+    mapper = Mapper(e.OptionalGroup, m.GroupModel, {"primary_key": "id"})
+
+    @mapper.reader.of(Columns[e.OptionalGroup])
+    def load_groups():
+        return m.GroupModel.objects.all()
+
+    result = load_groups()
+
+    assert result["name"].dtype == object
+
+
+# Validation.
+
+
+def test_nested_entities_columns(e, m):
+    """Nested entities could not be stored in columns."""
+    mapper = Mapper(
+        e.Message,
+        m.MessageModel,
+        {"primary_key": "id", "user": Mapper({"primary_key": "id"})},
+    )
+
+    expected = ""
+
+    with pytest.raises(MapperError) as exc_info:
+
+        @mapper.reader.of(Columns[e.Message])
+        def load_messages():
+            raise RuntimeError
+
+    message = str(exc_info.value)
+    assert message == expected
+
+
+def test_chunked_reader_columns(e, m):
+    """Columns could not be read in chunks of the reader."""
+    mapper = Mapper(e.User, m.UserModel, {"primary_key": "id"})
+
+    expected = ""
+
+    reader = mapper.reader.of(Columns[e.User]).chunked(1)
+
+    with pytest.raises(MapperError) as exc_info:
+
+        @reader
+        def load_users():
+            raise RuntimeError
+
+    message = str(exc_info.value)
+    assert message == expected
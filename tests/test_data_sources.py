@@ -1,7 +1,12 @@
 """Tests related to different data sources."""
 from logging import Logger
+from typing import Dict
+from typing import List
+from typing import Optional
 
+import django
 import pytest
+from django.db.models import QuerySet
 
 from mappers import Evaluated
 from mappers import Mapper
@@ -95,6 +100,87 @@ def test_result_optional_converter(e, m, r):
     assert user3 is None
 
 
+@pytest.mark.parametrize("name", ["load_users_iterator", "load_users_iterable"])
+def test_result_iterator_converter(e, m, r, name):
+    """Stream entities from the data source.
+
+    If annotation of the reader will be an iterator or an iterable of
+    entity class, we should return an iterator.  Entities should be
+    fetched lazily in chunks instead of loading the whole collection
+    into memory.
+    """
+    mapper = Mapper(e.User, m.UserModel, {"primary_key": "id"})
+
+    load_users = r.get(name, mapper, e.User)
+
+    result = load_users()
+
+    assert not isinstance(result, list)
+
+    user1 = next(result)
+    user2 = next(result)
+
+    assert isinstance(user1, e.User)
+    assert isinstance(user2, e.User)
+
+    with pytest.raises(StopIteration):
+        next(result)
+
+
+@pytest.mark.skipif(
+    django.VERSION < (2, 0), reason="QuerySet.iterator chunk size requires Django 2.0"
+)
+def test_result_iterator_chunk_size(e, m, r, monkeypatch):
+    """Set chunk size of the iterator converter.
+
+    Chunk size could be defined on the mapper and overridden on the
+    reader.
+    """
+    chunk_sizes = []
+    iterator = QuerySet.iterator
+
+    def spy(queryset, chunk_size):
+        chunk_sizes.append(chunk_size)
+        return iterator(queryset, chunk_size=chunk_size)
+
+    monkeypatch.setattr(QuerySet, "iterator", spy)
+
+    mapper = Mapper(e.User, m.UserModel, {"primary_key": "id"}, chunk_size=100)
+
+    load_users = r.get("load_users_iterator", mapper, e.User)
+
+    user1, user2 = load_users()
+
+    assert isinstance(user1, e.User)
+    assert isinstance(user2, e.User)
+
+    load_users = r.get("load_users_chunked", mapper, e.User, 1)
+
+    user1, user2 = load_users()
+
+    assert isinstance(user1, e.User)
+    assert isinstance(user2, e.User)
+    assert chunk_sizes == [100, 1]
+
+
+@pytest.mark.skipif(
+    django.VERSION >= (2, 0), reason="QuerySet.iterator chunk size requires Django 2.0"
+)
+def test_result_iterator_chunk_size_validation(e, m, r):
+    """Chunk size of the iterator is not supported by old Django versions."""
+    mapper = Mapper(e.User, m.UserModel, {"primary_key": "id"})
+
+    load_users = r.get("load_users_chunked", mapper, e.User, 1)
+
+    expected = ""
+
+    with pytest.raises(MapperError) as exc_info:
+        load_users()
+
+    message = str(exc_info.value)
+    assert message == expected
+
+
 @pytest.mark.parametrize("value", [None, False, Logger])
 def test_result_unknown_converter(e, m, r, value):
     """Raise error in unclear situation.
@@ -113,6 +199,115 @@ def test_result_unknown_converter(e, m, r, value):
     assert message == expected
 
 
+# Batch readers.
+
+
+@pytest.mark.parametrize("batch_size", [1, 500])
+def test_batch_reader_dict_converter(e, m, r, batch_size):
+    """Load many entities by their keys in one query.
+
+    If annotation of the batch reader will be a dict of entities, we
+    should return entities found by the given keys.  Missing keys should
+    be absent in the result.
+    """
+    mapper = Mapper(e.User, m.UserModel, {"primary_key": "id"})
+
+    load_users = r.get("load_users_batch", mapper, Dict[e.UserId, e.User], batch_size)
+
+    result = load_users([2, 3, 1])
+
+    assert isinstance(result, dict)
+    assert set(result) == {1, 2}
+    assert isinstance(result[1], e.User)
+    assert isinstance(result[2], e.User)
+    assert result[1].primary_key == 1
+    assert result[2].primary_key == 2
+
+
+@pytest.mark.parametrize("batch_size", [1, 500])
+def test_batch_reader_optional_list_converter(e, m, r, batch_size):
+    """Return entities in the order of given keys.
+
+    If annotation of the batch reader will be a list of optional
+    entities, we should return None in place of missing keys.
+    """
+    mapper = Mapper(e.User, m.UserModel, {"primary_key": "id"})
+
+    load_users = r.get("load_users_batch", mapper, List[Optional[e.User]], batch_size)
+
+    user2, user3, user1, user2_again = load_users([2, 3, 1, 2])
+
+    assert user1.primary_key == 1
+    assert user2.primary_key == 2
+    assert user3 is None
+    assert user2_again.primary_key == 2
+
+
+@pytest.mark.parametrize("batch_size", [1, 500])
+def test_batch_reader_list_converter(e, m, r, batch_size):
+    """Skip missing keys.
+
+    If annotation of the batch reader will be a list of entities, we
+    should return found entities in the order of given keys.
+    """
+    mapper = Mapper(e.User, m.UserModel, {"primary_key": "id"})
+
+    load_users = r.get("load_users_batch", mapper, List[e.User], batch_size)
+
+    user2, user1 = load_users([2, 3, 1])
+
+    assert user1.primary_key == 1
+    assert user2.primary_key == 2
+
+
+@pytest.mark.parametrize("value", [None, False, Logger])
+def test_batch_reader_unknown_converter(e, m, r, value):
+    """Raise error in unclear situation.
+
+    If annotation of the batch reader will be something unknown, we
+    should raise MapperError.
+    """
+    mapper = Mapper(e.User, m.UserModel, {"primary_key": "id"})
+
+    expected = ""
+
+    with pytest.raises(MapperError) as exc_info:
+        r.get("load_users_batch", mapper, value, 500)
+
+    message = str(exc_info.value)
+    assert message == expected
+
+
+def test_batch_reader_nested_mapper_key(e, m):
+    """Nested mapper field could not be used as batch reader key."""
+    mapper = Mapper(
+        e.Message,
+        m.MessageModel,
+        {"primary_key": "id", "user": Mapper({"primary_key": "id"})},
+    )
+
+    expected = ""
+
+    with pytest.raises(MapperError) as exc_info:
+        mapper.batch_reader("user")
+
+    message = str(exc_info.value)
+    assert message == expected
+
+
+def test_batch_reader_chunked(e, m):
+    """Batch readers could not be chunked."""
+    mapper = Mapper(e.User, m.UserModel, {"primary_key": "id"})
+
+    expected = ""
+
+    with pytest.raises(MapperError) as exc_info:
+        mapper.batch_reader("primary_key").chunked(1)
+
+    message = str(exc_info.value)
+    assert message == expected
+
+
 # Nested mappers.
 
 
@@ -290,3 +485,76 @@ def test_named_evaluated_field(e, m, r):
     assert isinstance(message2, e.TotalMessage)
     assert message1.total == 1
     assert message2.total == 1
+
+
+# Trusted mappers.
+
+
+def test_trusted_mapper(e, m, r):
+    """Skip entity validation for trusted data sources.
+
+    Trusted mapper should pass values from the data source to the entity
+    as is.  Entity libraries with validation on instantiation should
+    not coerce or reject them.
+    """
+    mapper = Mapper(
+        e.TotalMessage,
+        m.MessageModel,
+        {"primary_key": "id", "total": Evaluated()},
+        trusted=True,
+    )
+
+    load_messages = r.get("load_text_total_messages", mapper, e.TotalMessage)
+
+    result = load_messages()
+
+    assert isinstance(result, list)
+
+    message1, message2 = result
+
+    assert isinstance(message1, e.TotalMessage)
+    assert isinstance(message2, e.TotalMessage)
+    assert message1.total == ""
+    assert message2.total == ""
+
+
+def test_trusted_nested_mapper(e, m, r):
+    """Nested mappers of the trusted mapper are trusted as well."""
+    mapper = Mapper(
+        e.Message,
+        m.MessageModel,
+        {"primary_key": "id", "user": Mapper({"primary_key": "id"})},
+        trusted=True,
+    )
+
+    load_messages = r.get("load_messages", mapper, e.Message)
+
+    result = load_messages()
+
+    assert isinstance(result, list)
+
+    message1, message2 = result
+
+    assert isinstance(message1.user, e.User)
+    assert isinstance(message2.user, e.User)
+    assert message1.user.primary_key == 1
+    assert message2.user.primary_key == 2
+
+
+def test_trusted_frozen_entity(e, m, r):
+    """Trusted mapper could create frozen and slotted entities."""
+    mapper = Mapper(e.FrozenGroup, m.GroupModel, {"primary_key": "id"}, trusted=True)
+
+    load_groups = r.get("load_groups", mapper, e.FrozenGroup)
+
+    result = load_groups()
+
+    assert isinstance(result, list)
+
+    group1, group2 = result
+
+    assert isinstance(group1, e.FrozenGroup)
+    assert isinstance(group2, e.FrozenGroup)
+    assert group1.primary_key == 1
+    assert group2.primary_key == 2
+    assert group1 == e.FrozenGroup(primary_key=1, name=group1.name)
@@ -0,0 +1,237 @@
+"""Tests related to the DB-API cursor data source."""
+from typing import Iterator
+from typing import List
+from typing import Optional
+
+import pytest
+
+from mappers import Description
+from mappers import Evaluated
+from mappers import Mapper
+from mappers.exceptions import MapperError
+from mappers.exceptions import MultipleResultsError
+from mappers.exceptions import NotFoundError
+
+user_description = Description(["id", "created", "modified", "name", "about", "avatar"])
+
+
+# Converters.
+
+
+def test_result_list_converter(e, connection):
+    """Map rows of the raw SQL query to entities.
+
+    This code should return a list of `User` instances.
+    """
+    mapper = Mapper(e.User, user_description, {"primary_key": "id"})
+
+    @mapper.reader.of(List[e.User])
+    def load_users():
+        return connection.execute("SELECT * FROM user ORDER BY id")
+
+    result = load_users()
+
+    assert isinstance(result, list)
+
+    user1, user2 = result
+
+    assert isinstance(user1, e.User)
+    assert isinstance(user2, e.User)
+    assert user1.primary_key == 1
+    assert user2.primary_key == 2
+
+
+def test_result_object_converter(e, connection):
+    """Return a single object."""
+    mapper = Mapper(e.User, user_description, {"primary_key": "id"})
+
+    @mapper.reader.of(e.User)
+    def load_user(primary_key):
+        return connection.execute("SELECT * FROM user WHERE id = ?", [primary_key])
+
+    user1 = load_user(1)
+
+    assert isinstance(user1, e.User)
+
+    with pytest.raises(NotFoundError):
+        load_user(3)
+
+
+def test_result_object_converter_many_rows(e, connection):
+    """Raise error if the query returned more than one row."""
+    mapper = Mapper(e.User, user_description, {"primary_key": "id"})
+
+    @mapper.reader.of(e.User)
+    def load_user():
+        return connection.execute("SELECT * FROM user")
+
+    with pytest.raises(MultipleResultsError):
+        load_user()
+
+
+def test_result_optional_converter(e, connection):
+    """Return a single object or None."""
+    mapper = Mapper(e.User, user_description, {"primary_key": "id"})
+
+    @mapper.reader.of(Optional[e.User])
+    def load_user(primary_key):
+        return connection.execute("SELECT * FROM user WHERE id = ?", [primary_key])
+
+    user1 = load_user(1)
+
+    assert isinstance(user1, e.User)
+
+    user3 = load_user(3)
+
+    assert user3 is None
+
+
+def test_result_iterator_converter(e, connection):
+    """Fetch rows in batches of the chunk size."""
+    mapper = Mapper(e.User, user_description, {"primary_key": "id"}, chunk_size=1)
+
+    @mapper.reader.of(Iterator[e.User])
+    def load_users():
+        return connection.execute("SELECT * FROM user ORDER BY id")
+
+    result = load_users()
+
+    assert not isinstance(result, list)
+
+    user1, user2 = result
+
+    assert user1.primary_key == 1
+    assert user2.primary_key == 2
+
+
+# Column order.
+
+
+def test_cursor_column_order(e, connection):
+    """Find columns by name in the cursor description.
+
+    Order of columns in the query could differ from the order of the
+    entity fields.
+    """
+    mapper = Mapper(
+        e.FlatMessage, Description(["id", "user_id", "text"]), {"primary_key": "id"}
+    )
+
+    @mapper.reader.of(List[e.FlatMessage])
+    def load_messages():
+        return connection.execute("SELECT text, user_id, id FROM message ORDER BY id")
+
+    message1, message2 = load_messages()
+
+    assert message1.primary_key == 1
+    assert message1.user_id == 1
+    assert message2.primary_key == 2
+    assert message2.user_id == 2
+
+
+def test_cursor_description(e, connection):
+    """Use description of the executed cursor as a data source."""
+    cursor = connection.execute("SELECT * FROM message WHERE 0")
+
+    mapper = Mapper(
+        e.FlatMessage, Description(cursor.description), {"primary_key": "id"}
+    )
+
+    @mapper.reader.of(List[e.FlatMessage])
+    def load_messages():
+        return connection.execute("SELECT * FROM message ORDER BY id")
+
+    message1, message2 = load_messages()
+
+    assert message1.user_id == 1
+    assert message2.user_id == 2
+
+
+def test_evaluated_field(e, connection):
+    """Evaluated fields are read from the query result."""
+    mapper = Mapper(
+        e.TotalMessage,
+        Description(["id", "text"]),
+        {"primary_key": "id", "total": Evaluated("total_number")},
+    )
+
+    @mapper.reader.of(List[e.TotalMessage])
+    def load_messages():
+        return connection.execute(
+            "SELECT id, text, 1 AS total_number FROM message ORDER BY id"
+        )
+
+    message1, message2 = load_messages()
+
+    assert message1.total == 1
+    assert message2.total == 1
+
+
+def test_missing_cursor_column(e, connection):
+    """Raise error if query result does not contain mapped column."""
+    mapper = Mapper(e.User, user_description, {"primary_key": "id"})
+
+    @mapper.reader.of(List[e.User])
+    def load_users():
+        return connection.execute("SELECT id, name FROM user")
+
+    expected = "Can not find 'created' column in the cursor description"
+
+    with pytest.raises(MapperError) as exc_info:
+        load_users()
+
+    message = str(exc_info.value)
+    assert message == expected
+
+
+# Validation.
+
+
+def test_nullable_field_validation(e):
+    """Detect if data source column could be null."""
+    description = Description(
+        [
+            ("id", None, None, None, None, None, False),
+            ("name", None, None, None, None, None, True),
+        ]
+    )
+
+    expected = ""
+
+    with pytest.raises(MapperError) as exc_info:
+        Mapper(e.Group, description, {"primary_key": "id"})
+
+    message = str(exc_info.value)
+    assert message == expected
+
+    mapper = Mapper(e.OptionalGroup, description, {"primary_key": "id"})
+
+    assert mapper.data_source == description
+
+
+def test_nested_entities_validation(e):
+    """Raw rows could not be mapped to nested entities."""
+    expected = ""
+
+    with pytest.raises(MapperError) as exc_info:
+        Mapper(
+            e.Message,
+            Description(["id", "text"]),
+            {"primary_key": "id", "user": Mapper({"primary_key": "id"})},
+        )
+
+    message = str(exc_info.value)
+    assert message == expected
+
+
+def test_batch_reader_validation(e):
+    """Raw SQL queries could not be filtered by a batch of keys."""
+    mapper = Mapper(e.User, user_description, {"primary_key": "id"})
+
+    expected = ""
+
+    with pytest.raises(MapperError) as exc_info:
+        mapper.batch_reader("primary_key")
+
+    message = str(exc_info.value)
+    assert message == expected
@@ -0,0 +1,236 @@
+"""Tests related to the deferred fields."""
+from typing import Iterator
+from typing import List
+
+import pytest
+
+from mappers import Columns
+from mappers import Deferred
+from mappers import Mapper
+from mappers.exceptions import MapperError
+
+
+pytestmark = pytest.mark.django_db
+
+
+# Loading.
+
+
+def test_deferred_field_projection(e, m):
+    """Deferred fields are left out of the main query."""
+    mapper = Mapper(
+        e.User, m.UserModel, {"primary_key": "id", "about": Deferred()}, trusted=True
+    )
+
+    assert "about" not in mapper.iterable.arguments
+
+
+def test_deferred_field_loading(e, m, django_assert_num_queries):
+    """Load deferred field of the whole result set on the first access."""
+    m.UserModel.objects.filter(id=1).update(about="first")
+    m.UserModel.objects.filter(id=2).update(about="second")
+
+    mapper = Mapper(
+        e.User, m.UserModel, {"primary_key": "id", "about": Deferred()}, trusted=True
+    )
+
+    @mapper.reader.of(List[e.User])
+    def load_users():
+        return m.UserModel.objects.order_by("id")
+
+    with django_assert_num_queries(2):
+        user1, user2 = load_users()
+        assert user1.about == "first"
+        assert user2.about == "second"
+
+
+def test_deferred_field_streaming(e, m):
+    """Load deferred field of the fetched chunk only."""
+    m.UserModel.objects.filter(id=1).update(about="first")
+    m.UserModel.objects.filter(id=2).update(about="second")
+
+    mapper = Mapper(
+        e.User, m.UserModel, {"primary_key": "id", "about": Deferred()}, trusted=True
+    )
+
+    reader = mapper.reader.of(Iterator[e.User]).chunked(1)
+
+    @reader
+    def load_users():
+        return m.UserModel.objects.order_by("id")
+
+    users = load_users()
+    user1 = next(users)
+    assert user1.about == "first"
+
+    m.UserModel.objects.filter(id=2).update(about="updated")
+
+    user2 = next(users)
+    assert user2.about == "updated"
+
+
+def test_deferred_field_name(e, m):
+    """Deferred field could be loaded from the field with other name."""
+    m.MessageModel.objects.filter(id=1).update(text="first")
+
+    mapper = Mapper(
+        e.NamedMessage,
+        m.MessageModel,
+        {
+            "primary_key": "id",
+            "username": ("user", "name"),
+            "text": Deferred("text"),
+        },
+        trusted=True,
+    )
+
+    @mapper.reader.of(e.NamedMessage)
+    def load_message(primary_key):
+        return m.MessageModel.objects.filter(id=primary_key)
+
+    message = load_message(1)
+
+    assert message.text == "first"
+
+
+# Validation.
+
+
+def test_deferred_untrusted_mapper(e, m):
+    """Deferred fields are available in trusted mappers only."""
+    expected = ""
+
+    with pytest.raises(MapperError) as exc_info:
+        Mapper(e.User, m.UserModel, {"primary_key": "id", "about": Deferred()})
+
+    message = str(exc_info.value)
+    assert message == expected
+
+
+def test_deferred_entity_hooks(m):
+    """Entity with hooks could not receive lazy values."""
+    from dataclasses import dataclass
+
+    from examples.dataclasses import User
+
+    @dataclass
+    class CheckedUser(User):
+        """User validated after creation."""
+
+        def __post_init__(self):
+            raise RuntimeError
+
+    expected = ""
+
+    with pytest.raises(MapperError) as exc_info:
+        Mapper(
+            CheckedUser,
+            m.UserModel,
+            {"primary_key": "id", "about": Deferred()},
+            trusted=True,
+        )
+
+    message = str(exc_info.value)
+    assert message == expected
+
+
+def test_deferred_nullable_field(e, m):
+    """Deferred field could not be nullable in the data source."""
+    expected = ""
+
+    with pytest.raises(MapperError) as exc_info:
+        Mapper(
+            e.OptionalGroup,
+            m.GroupModel,
+            {"primary_key": "id", "name": Deferred()},
+            trusted=True,
+        )
+
+    message = str(exc_info.value)
+    assert message == expected
+
+
+def test_deferred_optional_field(e, m):
+    """Deferred field could not be optional in the entity."""
+    expected = ""
+
+    with pytest.raises(MapperError) as exc_info:
+        Mapper(
+            e.OptionalGroup,
+            m.UserModel,
+            {"primary_key": "id", "name": Deferred()},
+            trusted=True,
+        )
+
+    message = str(exc_info.value)
+    assert message == expected
+
+
+def test_deferred_unknown_field(e, m):
+    """Deferred field should exist in the data source."""
+    expected = ""
+
+    with pytest.raises(MapperError) as exc_info:
+        Mapper(
+            e.User,
+            m.UserModel,
+            {"primary_key": "id", "about": Deferred("bio")},
+            trusted=True,
+        )
+
+    message = str(exc_info.value)
+    assert message == expected
+
+
+def test_deferred_nested_field(e, m):
+    """Nested mappers could not have deferred fields."""
+    expected = ""
+
+    with pytest.raises(MapperError) as exc_info:
+        Mapper(
+            e.Message,
+            m.MessageModel,
+            {
+                "primary_key": "id",
+                "user": Mapper(
+                    {"primary_key": "id", "about": Deferred()}, trusted=True
+                ),
+            },
+        )
+
+    message = str(exc_info.value)
+    assert message == expected
+
+
+def test_deferred_columns(e, m):
+    """Deferred fields could not be read as columns."""
+    mapper = Mapper(
+        e.User, m.UserModel, {"primary_key": "id", "about": Deferred()}, trusted=True
+    )
+
+    expected = ""
+
+    with pytest.raises(MapperError) as exc_info:
+
+        @mapper.reader.of(Columns[e.User])
+        def load_users():
+            raise RuntimeError
+
+    message = str(exc_info.value)
+    assert message == expected
+
+
+def test_deferred_sqlalchemy_field(e, s):
+    """Deferred fields are supported by Django data sources only."""
+    expected = ""
+
+    with pytest.raises(MapperError) as exc_info:
+        Mapper(
+            e.User,
+            s.UserModel,
+            {"primary_key": "id", "about": Deferred()},
+            trusted=True,
+        )
+
+    message = str(exc_info.value)
+    assert message == expected
@@ -0,0 +1,50 @@
+"""Tests related to the import time of the package."""
+import os
+import subprocess  # nosec
+import sys
+
+import pytest
+
+
+pytestmark = pytest.mark.skipif(
+    sys.version_info < (3, 7), reason="Import time report requires Python 3.7"
+)
+
+
+# Helpers.
+
+
+def imported_modules():
+    """Import the package in a fresh interpreter and report imports."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    output = subprocess.check_output(  # nosec
+        [sys.executable, "-X", "importtime", "-c", "import mappers"],
+        env=env,
+        stderr=subprocess.STDOUT,
+        universal_newlines=True,
+    )
+    result = []
+    for line in output.splitlines()[1:]:
+        _self, _cumulative, name = line.split("|")
+        result.append(name.strip())
+    return result
+
+
+# Import.
+
+
+def test_lazy_libraries():
+    """Entity and data source libraries are not imported with the package."""
+    modules = imported_modules()
+
+    for library in [
+        "attr",
+        "django",
+        "json",
+        "msgspec",
+        "multiprocessing",
+        "numpy",
+        "pydantic",
+        "sqlalchemy",
+    ]:
+        assert library not in modules
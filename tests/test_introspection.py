@@ -0,0 +1,266 @@
+"""Tests related to the introspection of mappers and readers."""
+from typing import List
+
+import django
+import pytest
+
+from mappers import Deferred
+from mappers import Description
+from mappers import Evaluated
+from mappers import Mapper
+from mappers.exceptions import MapperError
+
+
+pytestmark = pytest.mark.django_db
+
+
+# Projections.
+
+
+def test_django_projection(e, m):
+    """Report columns, joins, and row offsets of the Django mapper."""
+    mapper = Mapper(
+        e.NamedMessage,
+        m.MessageModel,
+        {"primary_key": "id", "username": ("user", "name")},
+    )
+
+    columns, joins, offsets = mapper.projection()
+
+    assert columns == ("id", "user__name", "text")
+    assert joins == ("user",)
+    assert offsets == {"primary_key": 0, "username": 1, "text": 2}
+
+
+def test_django_foreign_key_projection(e, m):
+    """Primary key of the related model is read without the join."""
+    mapper = Mapper(
+        e.FlatMessage,
+        m.MessageModel,
+        {"primary_key": "id", "user_id": ("user", "id")},
+    )
+
+    projection = mapper.projection()
+
+    assert projection.columns[projection.offsets["user_id"]] == "user__id"
+    assert projection.joins == ()
+
+
+def test_django_evaluated_projection(e, m):
+    """Evaluated fields are reported without resolving them on the model."""
+    mapper = Mapper(
+        e.TotalMessage,
+        m.MessageModel,
+        {"primary_key": "id", "total": Evaluated("total_number")},
+    )
+
+    projection = mapper.projection()
+
+    assert projection.columns[projection.offsets["total"]] == "total_number"
+    assert projection.joins == ()
+
+
+def test_django_nested_projection(e, m):
+    """Fields of nested mappers are reported with their full path."""
+    mapper = Mapper(
+        e.Delivery,
+        m.MessageDeliveryModel,
+        {
+            "primary_key": "id",
+            "message": Mapper(
+                {"primary_key": "id", "user": Mapper({"primary_key": "id"})}
+            ),
+        },
+    )
+
+    projection = mapper.projection()
+
+    assert projection.columns[:3] == ("id", "message__id", "message__user__id")
+    assert projection.joins == ("message", "message__user")
+    assert list(projection.offsets)[:3] == [
+        "primary_key",
+        "message.primary_key",
+        "message.user.primary_key",
+    ]
+    assert projection.offsets["service"] == len(projection.columns) - 1
+
+
+def test_django_lazy_projection(e, m):
+    """Deferred fields share the primary key column of the entity."""
+    mapper = Mapper(
+        e.User, m.UserModel, {"primary_key": "id", "about": Deferred()}, trusted=True
+    )
+
+    projection = mapper.projection()
+
+    assert projection.offsets["about"] == projection.offsets["primary_key"]
+    assert "pk" not in projection.columns
+    assert projection.joins == ()
+
+
+def test_sqlalchemy_projection(e, s):
+    """Report columns, joins, and row offsets of the SQLAlchemy mapper."""
+    mapper = Mapper(
+        e.NamedMessage,
+        s.MessageModel,
+        {"primary_key": "id", "username": ("user", "name")},
+    )
+
+    assert mapper.projection() == (
+        ("id", "user.name", "text"),
+        ("user",),
+        {"primary_key": 0, "username": 1, "text": 2},
+    )
+
+
+def test_dbapi_projection(e):
+    """Report column names of the raw SQL mapper."""
+    mapper = Mapper(
+        e.TotalMessage,
+        Description(["id", "text", "total_number"]),
+        {"primary_key": "id", "total": Evaluated("total_number")},
+    )
+
+    assert mapper.projection() == (
+        ("id", "text", "total_number"),
+        (),
+        {"primary_key": 0, "text": 1, "total": 2},
+    )
+
+
+# Deduplication.
+
+
+def test_django_duplicate_columns(e, m):
+    """Entity fields mapped to the same column share its row offset."""
+    mapper = Mapper(
+        e.TotalMessage, m.MessageModel, {"primary_key": "id", "total": "id"}
+    )
+
+    @mapper.reader.of(List[e.TotalMessage])
+    def load_messages():
+        return m.MessageModel.objects.order_by("id")
+
+    message1, message2 = load_messages()
+
+    assert mapper.projection() == (
+        ("id", "text"),
+        (),
+        {"primary_key": 0, "text": 1, "total": 0},
+    )
+    assert (message1.primary_key, message1.total) == (1, 1)
+    assert (message2.primary_key, message2.total) == (2, 2)
+
+
+def test_django_duplicate_nested_columns(e, m):
+    """Nested mapper and related field share columns of the same relation."""
+    m.UserModel.objects.filter(id=1).update(name="Bob")
+
+    mapper = Mapper(
+        e.Message,
+        m.MessageModel,
+        {
+            "primary_key": "id",
+            "user": Mapper({"primary_key": "id"}),
+            "text": ("user", "name"),
+        },
+    )
+
+    @mapper.reader.of(List[e.Message])
+    def load_messages():
+        return m.MessageModel.objects.order_by("id")
+
+    message1, message2 = load_messages()
+    projection = mapper.projection()
+
+    assert projection.columns.count("user__name") == 1
+    assert projection.offsets["text"] == projection.offsets["user.name"]
+    assert message1.user.name == message1.text == "Bob"
+    assert message2.user.name == message2.text == ""
+
+
+def test_django_column_aliases(m):
+    """Different lookups of the same column share its row offset."""
+    mapper = Mapper(
+        m.MessageModel,
+        {
+            "primary_key": "id",
+            "user": "user",
+            "user_key": ("user", "id"),
+        },
+    )
+
+    @mapper.reader.of(List[mapper.entity])
+    def load_messages():
+        return m.MessageModel.objects.order_by("id")
+
+    message1, message2 = load_messages()
+
+    assert mapper.projection() == (
+        ("id", "user"),
+        (),
+        {"primary_key": 0, "user": 1, "user_key": 1},
+    )
+    assert message1 == (1, 1, 1)
+    assert message2 == (2, 2, 2)
+
+
+def test_sqlalchemy_duplicate_columns(e, s, session):
+    """Selected columns of the SQLAlchemy query are not repeated."""
+    mapper = Mapper(
+        e.TotalMessage, s.MessageModel, {"primary_key": "id", "total": "id"}
+    )
+
+    @mapper.reader.of(List[e.TotalMessage])
+    def load_messages():
+        return session.query(s.MessageModel).order_by(s.MessageModel.id)
+
+    message1, message2 = load_messages()
+
+    assert mapper.projection().columns == ("id", "text")
+    assert (message1.primary_key, message1.total) == (1, 1)
+    assert (message2.primary_key, message2.total) == (2, 2)
+
+
+# Explain.
+
+
+@pytest.mark.skipif(
+    django.VERSION < (2, 1), reason="QuerySet.explain requires Django 2.1"
+)
+def test_explain_reader(e, m):
+    """Explain the query of the given reader call."""
+    mapper = Mapper(
+        e.NamedMessage,
+        m.MessageModel,
+        {"primary_key": "id", "username": ("user", "name")},
+    )
+
+    @mapper.reader.of(List[e.NamedMessage])
+    def load_messages(text):
+        return m.MessageModel.objects.filter(text=text)
+
+    result = load_messages.explain("")
+
+    assert isinstance(result, str)
+    assert result
+
+
+# Validation.
+
+
+def test_explain_sqlalchemy(e, s, session):
+    """Queries are explained for Django data sources only."""
+    mapper = Mapper(e.User, s.UserModel, {"primary_key": "id"})
+
+    @mapper.reader.of(List[e.User])
+    def load_users():
+        return session.query(s.UserModel)
+
+    expected = ""
+
+    with pytest.raises(MapperError) as exc_info:
+        load_users.explain()
+
+    message = str(exc_info.value)
+    assert message == expected
@@ -0,0 +1,195 @@
+"""Tests related to the JSON encoded reader results."""
+import json
+from typing import Iterator
+
+import pytest
+from django.db.models import Count
+
+from mappers import Deferred
+from mappers import Description
+from mappers import Evaluated
+from mappers import JSON
+from mappers import Mapper
+from mappers.exceptions import MapperError
+
+
+pytestmark = pytest.mark.django_db
+
+
+# Data sources.
+
+
+def test_django_json(e, m):
+    """Encode rows of the queryset directly to JSON.
+
+    Keys should be entity field names.  Nested entities should be
+    encoded as nested objects.
+    """
+    mapper = Mapper(
+        e.Message,
+        m.MessageModel,
+        {"primary_key": "id", "user": Mapper({"primary_key": "id"})},
+    )
+
+    @mapper.reader.of(JSON[e.Message])
+    def load_messages():
+        return m.MessageModel.objects.order_by("id")
+
+    result = load_messages()
+
+    assert isinstance(result, bytes)
+
+    message1, message2 = json.loads(result.decode("utf-8"))
+    user = m.UserModel.objects.get(id=1)
+
+    assert list(message1) == ["primary_key", "user", "text"]
+    assert message1["user"] == {
+        "primary_key": 1,
+        "created": user.created.isoformat(),
+        "modified": user.modified.isoformat(),
+        "name": "",
+        "about": "",
+        "avatar": "",
+    }
+    assert message2["primary_key"] == 2
+    assert message2["user"]["primary_key"] == 2
+
+
+def test_django_json_stream(e, m):
+    """Stream JSON array piece by piece."""
+    mapper = Mapper(
+        e.TotalMessage,
+        m.MessageModel,
+        {"primary_key": "id", "total": Evaluated("total_number")},
+    )
+
+    @mapper.reader.of(Iterator[JSON[e.TotalMessage]])
+    def load_messages():
+        return m.MessageModel.objects.annotate(total_number=Count("id")).order_by("id")
+
+    result = load_messages()
+
+    assert not isinstance(result, bytes)
+    assert json.loads(b"".join(result).decode("utf-8")) == [
+        {"primary_key": 1, "text": "", "total": 1},
+        {"primary_key": 2, "text": "", "total": 1},
+    ]
+
+
+def test_sqlalchemy_json(e, s, session):
+    """Encode selected columns of the SQLAlchemy query."""
+    from sqlalchemy import func
+
+    mapper = Mapper(
+        e.TotalMessage,
+        s.MessageModel,
+        {"primary_key": "id", "total": Evaluated("total_number")},
+    )
+
+    @mapper.reader.of(JSON[e.TotalMessage])
+    def load_messages():
+        return (
+            session.query(
+                s.MessageModel, func.count(s.MessageModel.id).label("total_number")
+            )
+            .group_by(s.MessageModel.id)
+            .order_by(s.MessageModel.id)
+        )
+
+    assert json.loads(load_messages().decode("utf-8")) == [
+        {"primary_key": 1, "text": "", "total": 1},
+        {"primary_key": 2, "text": "", "total": 1},
+    ]
+
+
+def test_dbapi_json(e, connection):
+    """Find columns of the raw query result by name."""
+    mapper = Mapper(
+        e.FlatMessage, Description(["id", "user_id", "text"]), {"primary_key": "id"}
+    )
+
+    @mapper.reader.of(JSON[e.FlatMessage])
+    def load_messages():
+        return connection.execute("SELECT text, user_id, id FROM message ORDER BY id")
+
+    assert load_messages() == (
+        b'[{"primary_key":1,"user_id":1,"text":""},'
+        b'{"primary_key":2,"user_id":2,"text":""}]'
+    )
+
+
+def test_empty_json(e, connection):
+    """Encode empty array if the query result has no rows."""
+    mapper = Mapper(
+        e.FlatMessage, Description(["id", "user_id", "text"]), {"primary_key": "id"}
+    )
+
+    @mapper.reader.of(JSON[e.FlatMessage])
+    def load_messages():
+        return connection.execute("SELECT * FROM message WHERE id < 0")
+
+    @mapper.reader.of(Iterator[JSON[e.FlatMessage]])
+    def stream_messages():
+        return connection.execute("SELECT * FROM message WHERE id < 0")
+
+    assert load_messages() == b"[]"
+    assert b"".join(stream_messages()) == b"[]"
+
+
+# Validation.
+
+
+def test_deferred_field_json(e, m):
+    """Deferred fields could not be encoded."""
+    mapper = Mapper(
+        e.User, m.UserModel, {"primary_key": "id", "about": Deferred()}, trusted=True
+    )
+
+    expected = ""
+
+    with pytest.raises(MapperError) as exc_info:
+
+        @mapper.reader.of(JSON[e.User])
+        def load_users():
+            raise RuntimeError
+
+    message = str(exc_info.value)
+    assert message == expected
+
+
+def test_chunked_json(e, m):
+    """Encoded results could not be read in chunks of the reader."""
+    mapper = Mapper(e.User, m.UserModel, {"primary_key": "id"})
+
+    expected = ""
+
+    reader = mapper.reader.of(Iterator[JSON[e.User]]).chunked(1)
+
+    with pytest.raises(MapperError) as exc_info:
+
+        @reader
+        def load_users():
+            raise RuntimeError
+
+    message = str(exc_info.value)
+    assert message == expected
+
+
+def test_collection_json(e, m):
+    """Collection fields could not be encoded."""
+    mapper = Mapper(
+        e.SubscribedChat,
+        m.ChatModel,
+        {"primary_key": "id", "subscribers": Mapper({"primary_key": "id"})},
+    )
+
+    expected = ""
+
+    with pytest.raises(MapperError) as exc_info:
+
+        @mapper.reader.of(JSON[e.SubscribedChat])
+        def load_chats():
+            raise RuntimeError
+
+    message = str(exc_info.value)
+    assert message == expected
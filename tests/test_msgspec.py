@@ -0,0 +1,53 @@
+"""Tests related to the msgspec entities."""
+from typing import List
+from typing import Optional
+
+import pytest
+
+from mappers import Evaluated
+from mappers import Mapper
+
+
+msgspec = pytest.importorskip("msgspec")
+
+
+pytestmark = pytest.mark.django_db
+
+
+# Entities.
+
+
+def test_struct_validation(m, r):
+    """Values of the untrusted data source are validated."""
+    import examples.msgspec_structs as e
+
+    mapper = Mapper(
+        e.TotalMessage, m.MessageModel, {"primary_key": "id", "total": Evaluated()}
+    )
+
+    load_messages = r.get("load_text_total_messages", mapper, e.TotalMessage)
+
+    with pytest.raises(msgspec.ValidationError):
+        load_messages()
+
+
+def test_keyword_only_struct(m):
+    """Keyword only fields are passed by name."""
+
+    class Group(msgspec.Struct, kw_only=True):
+        """Group domain model."""
+
+        primary_key: int
+        name: Optional[str] = None
+
+    mapper = Mapper(Group, m.GroupModel, {"primary_key": "id"}, trusted=True)
+
+    @mapper.reader.of(List[Group])
+    def load_groups():
+        return m.GroupModel.objects.order_by("id")
+
+    group1, group2 = load_groups()
+
+    assert isinstance(group1, Group)
+    assert group1.primary_key == 1
+    assert group2.primary_key == 2
@@ -0,0 +1,269 @@
+"""Tests related to the parallel materialization of entities."""
+import multiprocessing
+from typing import Iterator
+from typing import List
+
+import pytest
+from django.db import transaction
+
+from mappers import Columns
+from mappers import Mapper
+from mappers.exceptions import MapperError
+
+
+pytestmark = pytest.mark.django_db(transaction=True)
+
+
+# Readers.
+
+
+def test_parallel_reader(e, m):
+    """Load primary key ranges in worker processes in order."""
+    m.UserModel.objects.bulk_create(
+        [m.UserModel(name=str(index)) for index in range(3, 11)]
+    )
+
+    mapper = Mapper(e.User, m.UserModel, {"primary_key": "id"})
+
+    reader = mapper.reader.parallel(processes=2, batch_size=3).of(Iterator[e.User])
+
+    @reader
+    def load_users():
+        return m.UserModel.objects.all()
+
+    result = load_users()
+    expected = list(m.UserModel.objects.order_by("id").values_list("id", flat=True))
+
+    assert not isinstance(result, list)
+    assert len(expected) == 10
+    assert [user.primary_key for user in result] == expected
+
+
+def test_parallel_reader_unordered(e, m):
+    """Load primary key ranges in the order of completion."""
+    m.UserModel.objects.bulk_create(
+        [m.UserModel(name=str(index)) for index in range(3, 11)]
+    )
+
+    mapper = Mapper(e.User, m.UserModel, {"primary_key": "id"})
+
+    reader = mapper.reader.parallel(processes=2, batch_size=3, ordered=False)
+
+    @reader.of(List[e.User])
+    def load_users():
+        return m.UserModel.objects.filter(id__gt=2)
+
+    result = load_users()
+    expected = m.UserModel.objects.filter(id__gt=2).order_by("id")
+
+    assert isinstance(result, list)
+    assert sorted(user.primary_key for user in result) == list(
+        expected.values_list("id", flat=True)
+    )
+    assert len(result) == 8
+    assert all(isinstance(user, e.User) for user in result)
+
+
+def test_parallel_reader_nested_mapper(e, m):
+    """Nested entities are loaded in worker processes as well."""
+    mapper = Mapper(
+        e.Message,
+        m.MessageModel,
+        {"primary_key": "id", "user": Mapper({"primary_key": "id"})},
+    )
+
+    reader = mapper.reader.parallel(processes=2, batch_size=1).of(List[e.Message])
+
+    @reader
+    def load_messages():
+        return m.MessageModel.objects.all()
+
+    message1, message2 = load_messages()
+
+    assert message1.user.primary_key == 1
+    assert message2.user.primary_key == 2
+
+
+def test_parallel_reader_empty(e, m):
+    """Empty queryset does not start any tasks."""
+    mapper = Mapper(e.User, m.UserModel, {"primary_key": "id"})
+
+    reader = mapper.reader.parallel(processes=2).of(List[e.User])
+
+    @reader
+    def load_users():
+        return m.UserModel.objects.none()
+
+    assert load_users() == []
+
+
+def test_parallel_reader_lazy_workers(e, m):
+    """Worker processes are started on the first iteration."""
+    mapper = Mapper(e.User, m.UserModel, {"primary_key": "id"})
+
+    reader = mapper.reader.parallel(processes=2).of(Iterator[e.User])
+
+    @reader
+    def load_users():
+        return m.UserModel.objects.all()
+
+    result = load_users()
+
+    assert not multiprocessing.active_children()
+
+    user1, user2 = result
+
+    assert not multiprocessing.active_children()
+
+
+# Validation.
+
+
+def test_parallel_reader_single_entity(e, m):
+    """Parallel readers should return a collection of entities."""
+    mapper = Mapper(e.User, m.UserModel, {"primary_key": "id"})
+
+    expected = ""
+
+    reader = mapper.reader.parallel().of(e.User)
+
+    with pytest.raises(MapperError) as exc_info:
+
+        @reader
+        def load_user():
+            raise RuntimeError
+
+    message = str(exc_info.value)
+    assert message == expected
+
+
+def test_parallel_reader_chunked(e, m):
+    """Parallel readers could not be chunked."""
+    mapper = Mapper(e.User, m.UserModel, {"primary_key": "id"})
+
+    expected = ""
+
+    reader = mapper.reader.parallel().of(Iterator[e.User]).chunked(1)
+
+    with pytest.raises(MapperError) as exc_info:
+
+        @reader
+        def load_users():
+            raise RuntimeError
+
+    message = str(exc_info.value)
+    assert message == expected
+
+
+def test_parallel_reader_columns(e, m):
+    """Columns could not be read in parallel."""
+    mapper = Mapper(e.User, m.UserModel, {"primary_key": "id"})
+
+    expected = ""
+
+    reader = mapper.reader.parallel().of(Columns[e.User])
+
+    with pytest.raises(MapperError) as exc_info:
+
+        @reader
+        def load_users():
+            raise RuntimeError
+
+    message = str(exc_info.value)
+    assert message == expected
+
+
+def test_parallel_reader_sqlalchemy(e, s):
+    """Parallel readers are supported by Django data sources only."""
+    mapper = Mapper(e.User, s.UserModel, {"primary_key": "id"})
+
+    expected = ""
+
+    with pytest.raises(MapperError) as exc_info:
+        mapper.reader.parallel()
+
+    message = str(exc_info.value)
+    assert message == expected
+
+
+def test_parallel_reader_transaction(e, m):
+    """Worker processes could not see rows of the open transaction."""
+    mapper = Mapper(e.User, m.UserModel, {"primary_key": "id"})
+
+    reader = mapper.reader.parallel().of(List[e.User])
+
+    @reader
+    def load_users():
+        return m.UserModel.objects.all()
+
+    expected = ""
+
+    with transaction.atomic():
+        with pytest.raises(MapperError) as exc_info:
+            load_users()
+
+    message = str(exc_info.value)
+    assert message == expected
+
+
+def test_parallel_reader_sliced_queryset(e, m):
+    """Sliced querysets could not be split into primary key ranges."""
+    mapper = Mapper(e.User, m.UserModel, {"primary_key": "id"})
+
+    reader = mapper.reader.parallel().of(List[e.User])
+
+    @reader
+    def load_users():
+        return m.UserModel.objects.all()[:1]
+
+    expected = ""
+
+    with pytest.raises(MapperError) as exc_info:
+        load_users()
+
+    message = str(exc_info.value)
+    assert message == expected
+
+
+def test_parallel_reader_ordered_queryset(e, m):
+    """Ordered results follow primary key ranges, not the queryset order."""
+    mapper = Mapper(e.User, m.UserModel, {"primary_key": "id"})
+
+    reader = mapper.reader.parallel().of(List[e.User])
+
+    @reader
+    def load_users():
+        return m.UserModel.objects.order_by("-id")
+
+    expected = ""
+
+    with pytest.raises(MapperError) as exc_info:
+        load_users()
+
+    message = str(exc_info.value)
+    assert message == expected
+
+
+def test_parallel_reader_without_fork(e, m, monkeypatch):
+    """Worker processes could not be started without fork."""
+
+    def get_context(method):
+        raise ValueError
+
+    monkeypatch.setattr(multiprocessing, "get_context", get_context)
+
+    mapper = Mapper(e.User, m.UserModel, {"primary_key": "id"})
+
+    reader = mapper.reader.parallel().of(List[e.User])
+
+    @reader
+    def load_users():
+        return m.UserModel.objects.all()
+
+    expected = ""
+
+    with pytest.raises(MapperError) as exc_info:
+        load_users()
+
+    message = str(exc_info.value)
+    assert message == expected
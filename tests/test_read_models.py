@@ -0,0 +1,157 @@
+"""Tests related to the generated read models."""
+import pickle  # nosec
+from typing import Any
+from typing import List
+from typing import Optional
+
+import pytest
+
+from mappers import Evaluated
+from mappers import Mapper
+from mappers.configuration import cache_clear
+from mappers.exceptions import MapperError
+
+
+pytestmark = pytest.mark.django_db
+
+
+# Read models.
+
+
+def test_read_model_reader(m):
+    """Generate entity class if only data source and config are given."""
+    mapper = Mapper(m.UserModel, {"primary_key": "id", "name": "name"})
+
+    @mapper.reader.of(List[mapper.entity])
+    def load_users():
+        return m.UserModel.objects.order_by("id")
+
+    user1, user2 = load_users()
+
+    assert isinstance(user1, mapper.entity)
+    assert user1.primary_key == 1
+    assert user2.primary_key == 2
+    assert user1 == (1, "")
+
+
+def test_read_model_slots(m):
+    """Generated entities are immutable and have no instance dictionary."""
+    mapper = Mapper(m.UserModel, {"primary_key": "id"})
+
+    @mapper.reader.of(mapper.entity)
+    def load_user(primary_key):
+        return m.UserModel.objects.filter(id=primary_key)
+
+    user = load_user(1)
+
+    assert not hasattr(user, "__dict__")
+    with pytest.raises(AttributeError):
+        user.primary_key = 2
+
+
+def test_read_model_types(m):
+    """Field types of the generated entity are taken from the data source."""
+    mapper = Mapper(
+        m.MessageModel,
+        {
+            "primary_key": "id",
+            "user_id": "user",
+            "username": ("user", "name"),
+            "text": "text",
+            "total": Evaluated(),
+        },
+    )
+
+    assert mapper.entity.__annotations__ == {
+        "primary_key": int,
+        "user_id": int,
+        "username": str,
+        "text": str,
+        "total": Any,
+    }
+
+
+def test_read_model_nullable_field(m):
+    """Nullable fields of the data source are optional in the entity."""
+    mapper = Mapper(m.GroupModel, {"primary_key": "id", "name": "name"})
+
+    assert mapper.entity.__annotations__ == {"primary_key": int, "name": Optional[str]}
+
+
+def test_read_model_cache(m):
+    """Equal projections share the generated entity class."""
+    mapper1 = Mapper(m.UserModel, {"primary_key": "id"})
+    mapper2 = Mapper(m.UserModel, {"primary_key": "id"})
+
+    assert mapper1.entity is mapper2.entity
+
+
+def test_read_model_cache_clear(m):
+    """Generated entity classes are dropped with the configuration cache."""
+    mapper1 = Mapper(m.UserModel, {"primary_key": "id"})
+    cache_clear()
+    mapper2 = Mapper(m.UserModel, {"primary_key": "id"})
+
+    assert mapper1.entity is not mapper2.entity
+
+
+def test_read_model_pickle(m):
+    """Generated entities could be sent to other processes."""
+    mapper = Mapper(m.UserModel, {"primary_key": "id", "name": "name"})
+
+    @mapper.reader.of(mapper.entity)
+    def load_user(primary_key):
+        return m.UserModel.objects.filter(id=primary_key)
+
+    user = load_user(1)
+    restored = pickle.loads(pickle.dumps(user))  # nosec
+
+    assert restored == user
+    assert type(restored) is mapper.entity
+
+
+# Validation.
+
+
+def test_read_model_nested_mapper(m):
+    """Generated entities could not have nested entities."""
+    expected = ""
+
+    with pytest.raises(MapperError) as exc_info:
+        Mapper(m.MessageModel, {"primary_key": "id", "user": Mapper({"name": "name"})})
+
+    message = str(exc_info.value)
+    assert message == expected
+
+
+def test_read_model_unknown_field(m):
+    """Data source fields of the generated entity should exist."""
+    expected = ""
+
+    with pytest.raises(MapperError) as exc_info:
+        Mapper(m.UserModel, {"primary_key": "id", "name": "username"})
+
+    message = str(exc_info.value)
+    assert message == expected
+
+
+def test_read_model_private_field(m):
+    """Fields of the generated entity could not start with underscore."""
+    expected = ""
+
+    with pytest.raises(MapperError) as exc_info:
+        Mapper(m.UserModel, {"_id": "id"})
+
+    message = str(exc_info.value)
+    assert message == expected
+
+
+def test_read_model_sqlalchemy(s):
+    """Entities are generated for Django data sources only."""
+    expected = ""
+
+    with pytest.raises(MapperError) as exc_info:
+        Mapper(s.UserModel, {"primary_key": "id"})
+
+    message = str(exc_info.value)
+    assert message == expected
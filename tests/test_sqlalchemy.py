@@ -0,0 +1,271 @@
+"""Tests related to the SQLAlchemy data source."""
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+
+import pytest
+
+from mappers import Evaluated
+from mappers import Mapper
+from mappers.exceptions import MapperError
+
+
+# Converters.
+
+
+def test_result_list_converter(e, s, session):
+    """Select only mapped columns of the SQLAlchemy model.
+
+    This code should return a list of `User` instances.
+    """
+    mapper = Mapper(e.User, s.UserModel, {"primary_key": "id"})
+
+    @mapper.reader.of(List[e.User])
+    def load_users():
+        return session.query(s.UserModel)
+
+    result = load_users()
+
+    assert isinstance(result, list)
+
+    user1, user2 = result
+
+    assert isinstance(user1, e.User)
+    assert isinstance(user2, e.User)
+    assert user1.primary_key == 1
+    assert user2.primary_key == 2
+
+
+def test_result_object_converter(e, s, session):
+    """Return a single object."""
+    from sqlalchemy.orm.exc import NoResultFound
+
+    mapper = Mapper(e.User, s.UserModel, {"primary_key": "id"})
+
+    @mapper.reader.of(e.User)
+    def load_user(primary_key):
+        return session.query(s.UserModel).filter(s.UserModel.id == primary_key)
+
+    user1 = load_user(1)
+
+    assert isinstance(user1, e.User)
+
+    with pytest.raises(NoResultFound):
+        load_user(3)
+
+
+def test_result_optional_converter(e, s, session):
+    """Return a single object or None."""
+    mapper = Mapper(e.User, s.UserModel, {"primary_key": "id"})
+
+    @mapper.reader.of(Optional[e.User])
+    def load_user(primary_key):
+        return session.query(s.UserModel).filter(s.UserModel.id == primary_key)
+
+    user1 = load_user(1)
+
+    assert isinstance(user1, e.User)
+
+    user3 = load_user(3)
+
+    assert user3 is None
+
+
+def test_result_iterator_converter(e, s, session):
+    """Stream entities in chunks."""
+    mapper = Mapper(e.User, s.UserModel, {"primary_key": "id"}, chunk_size=1)
+
+    @mapper.reader.of(Iterator[e.User])
+    def load_users():
+        return session.query(s.UserModel)
+
+    result = load_users()
+
+    assert not isinstance(result, list)
+
+    user1, user2 = result
+
+    assert isinstance(user1, e.User)
+    assert isinstance(user2, e.User)
+
+
+def test_batch_reader(e, s, session):
+    """Load many entities by their keys."""
+    mapper = Mapper(e.User, s.UserModel, {"primary_key": "id"})
+
+    reader = mapper.batch_reader("primary_key", 1).of(Dict[e.UserId, e.User])
+
+    @reader
+    def load_users():
+        return session.query(s.UserModel)
+
+    result = load_users([2, 3, 1])
+
+    assert set(result) == {1, 2}
+    assert result[1].primary_key == 1
+    assert result[2].primary_key == 2
+
+
+# Nested mappers.
+
+
+def test_nested_mapper(e, s, session):
+    """Join related model of the nested mapper.
+
+    This code should return a list of `Message` instances.  Each
+    `Message` instance should have `User` instance as its attribute.
+    """
+    mapper = Mapper(
+        e.Message,
+        s.MessageModel,
+        {"primary_key": "id", "user": Mapper({"primary_key": "id"})},
+    )
+
+    @mapper.reader.of(List[e.Message])
+    def load_messages():
+        return session.query(s.MessageModel)
+
+    message1, message2 = load_messages()
+
+    assert isinstance(message1, e.Message)
+    assert isinstance(message2, e.Message)
+    assert isinstance(message1.user, e.User)
+    assert isinstance(message2.user, e.User)
+    assert message1.user.primary_key == 1
+    assert message2.user.primary_key == 2
+
+
+def test_deep_nested_mapper(e, s, session):
+    """Join related models of deeply nested mappers."""
+    mapper = Mapper(
+        e.Delivery,
+        s.MessageDeliveryModel,
+        {
+            "primary_key": "id",
+            "message": Mapper(
+                {"primary_key": "id", "user": Mapper({"primary_key": "id"})}
+            ),
+        },
+    )
+
+    @mapper.reader.of(List[e.Delivery])
+    def load_deliveries():
+        return session.query(s.MessageDeliveryModel)
+
+    delivery1, delivery2 = load_deliveries()
+
+    assert isinstance(delivery1.message, e.Message)
+    assert isinstance(delivery2.message, e.Message)
+    assert isinstance(delivery1.message.user, e.User)
+    assert isinstance(delivery2.message.user, e.User)
+    assert delivery1.message.user.primary_key == 1
+    assert delivery2.message.user.primary_key == 2
+
+
+# Related fields.
+
+
+def test_related_field(e, s, session):
+    """Join related model of the related field."""
+    mapper = Mapper(
+        e.NamedMessage,
+        s.MessageModel,
+        {"primary_key": "id", "username": ("user", "name")},
+    )
+
+    @mapper.reader.of(List[e.NamedMessage])
+    def load_messages():
+        return session.query(s.MessageModel)
+
+    message1, message2 = load_messages()
+
+    assert isinstance(message1, e.NamedMessage)
+    assert isinstance(message2, e.NamedMessage)
+    assert message1.username == ""
+    assert message2.username == ""
+
+
+def test_related_field_outer_join(e, s, session):
+    """Relations below the nullable one are joined with outer joins too."""
+    mapper = Mapper(
+        e.OptionalGroup,
+        s.PinModel,
+        {"primary_key": "id", "name": ("message", "user", "name")},
+    )
+
+    @mapper.reader.of(List[e.OptionalGroup])
+    def load_pins():
+        return session.query(s.PinModel).order_by(s.PinModel.id)
+
+    pin1, pin2 = load_pins()
+
+    assert (pin1.primary_key, pin1.name) == (1, "")
+    assert (pin2.primary_key, pin2.name) == (2, None)
+
+
+def test_resolve_id_field_from_foreign_key_without_config(e, s, session):
+    """Use foreign key column as a field."""
+    mapper = Mapper(e.FlatMessage, s.MessageModel, {"primary_key": "id"})
+
+    @mapper.reader.of(List[e.FlatMessage])
+    def load_messages():
+        return session.query(s.MessageModel)
+
+    message1, message2 = load_messages()
+
+    assert message1.user_id == 1
+    assert message2.user_id == 2
+
+
+# Evaluated fields.
+
+
+def test_evaluated_field(e, s, session):
+    """Select labeled column added to the query."""
+    from sqlalchemy import func
+
+    mapper = Mapper(
+        e.TotalMessage,
+        s.MessageModel,
+        {"primary_key": "id", "total": Evaluated("total_number")},
+    )
+
+    @mapper.reader.of(List[e.TotalMessage])
+    def load_messages():
+        total = func.length(s.MessageModel.text) + 1
+        return session.query(s.MessageModel).add_columns(total.label("total_number"))
+
+    message1, message2 = load_messages()
+
+    assert message1.total == 1
+    assert message2.total == 1
+
+
+# Validation.
+
+
+def test_nullable_field_validation(e, s):
+    """Detect if data source field could be null."""
+    expected = ""
+
+    with pytest.raises(MapperError) as exc_info:
+        Mapper(e.Group, s.GroupModel, {"primary_key": "id"})
+
+    message = str(exc_info.value)
+    assert message == expected
+
+
+def test_nested_entities_kind_validation(e, s):
+    """Collection relationships could not be mapped to nested entities."""
+    expected = ""
+
+    with pytest.raises(MapperError) as exc_info:
+        Mapper(
+            e.UserChat,
+            s.ChatModel,
+            {"primary_key": "id", "subscribers": Mapper({"primary_key": "id"})},
+        )
+
+    message = str(exc_info.value)
+    assert message == expected
@@ -0,0 +1,206 @@
+"""Tests related to the instrumentation of reader calls."""
+from typing import Dict
+from typing import Iterator
+from typing import List
+
+import django
+import pytest
+
+from mappers import Columns
+from mappers import Description
+from mappers import JSON
+from mappers import Mapper
+from mappers.tracing import add_tracer
+from mappers.tracing import remove_tracer
+
+
+pytestmark = pytest.mark.django_db
+
+
+# Fixtures.
+
+
+@pytest.fixture()
+def traces():
+    """Collect traces of reader calls made in the test."""
+    result = []
+    add_tracer(result.append)
+    yield result
+    remove_tracer(result.append)
+
+
+# Tracers.
+
+
+def test_trace_reader_call(e, m, traces):
+    """Report reader name, entity, converter, rows, and timings."""
+    mapper = Mapper(e.User, m.UserModel, {"primary_key": "id"})
+
+    @mapper.reader.of(List[e.User])
+    def load_users():
+        return m.UserModel.objects.all()
+
+    load_users()
+
+    (info,) = traces
+
+    assert info.reader.endswith("load_users")
+    assert info.entity is e.User
+    assert info.converter == List[e.User]
+    assert info.rows == 2
+    assert info.query_time >= 0
+    assert info.construction_time >= 0
+
+
+def test_trace_nested_mapper(e, m, traces):
+    """Count rows of readers with nested entities."""
+    mapper = Mapper(
+        e.Message,
+        m.MessageModel,
+        {"primary_key": "id", "user": Mapper({"primary_key": "id"})},
+    )
+
+    @mapper.reader.of(e.Message)
+    def load_message(primary_key):
+        return m.MessageModel.objects.filter(id=primary_key)
+
+    load_message(1)
+
+    (info,) = traces
+
+    assert info.converter is e.Message
+    assert info.rows == 1
+
+
+def test_trace_sqlalchemy_reader(e, s, session, traces):
+    """Report reader calls of the SQLAlchemy data source."""
+    mapper = Mapper(e.User, s.UserModel, {"primary_key": "id"})
+
+    @mapper.reader.of(List[e.User])
+    def load_users():
+        return session.query(s.UserModel)
+
+    load_users()
+
+    (info,) = traces
+
+    assert info.rows == 2
+
+
+def test_trace_dbapi_reader(e, connection, traces):
+    """Report reader calls of the raw SQL queries."""
+    mapper = Mapper(
+        e.FlatMessage, Description(["id", "user_id", "text"]), {"primary_key": "id"}
+    )
+
+    @mapper.reader.of(List[e.FlatMessage])
+    def load_messages():
+        return connection.execute("SELECT * FROM message")
+
+    load_messages()
+
+    (info,) = traces
+
+    assert info.rows == 2
+
+
+def test_trace_streamed_reader(e, m, traces):
+    """Streamed rows are fetched after the call and are not counted."""
+    mapper = Mapper(e.User, m.UserModel, {"primary_key": "id"})
+
+    @mapper.reader.of(Iterator[e.User])
+    def load_users():
+        return m.UserModel.objects.all()
+
+    result = list(load_users())
+
+    (info,) = traces
+
+    assert len(result) == 2
+    assert info.rows == 0
+
+
+def test_trace_batch_reader(e, m, r, traces):
+    """Report calls of batch readers."""
+    mapper = Mapper(e.User, m.UserModel, {"primary_key": "id"})
+
+    load_users = r.get("load_users_batch", mapper, Dict[e.UserId, e.User], 1)
+
+    load_users([1, 2])
+
+    (info,) = traces
+
+    assert info.reader.endswith("load_users")
+    assert info.converter == Dict[e.UserId, e.User]
+    assert info.rows == 2
+
+
+@pytest.mark.skipif(
+    django.VERSION < (4, 1), reason="Async queryset API requires Django 4.1"
+)
+def test_trace_async_reader(e, m, traces):
+    """Report rows of the awaited coroutine."""
+    import readers.coroutines as a
+
+    mapper = Mapper(e.User, m.UserModel, {"primary_key": "id"})
+
+    load_users = a.get("load_users", mapper, e.User)
+
+    a.run(load_users)
+
+    (info,) = traces
+
+    assert info.converter == List[e.User]
+    assert info.rows == 2
+
+
+def test_trace_columns_reader(e, m, traces):
+    """Count rows of columnar results."""
+    pytest.importorskip("numpy")
+
+    mapper = Mapper(e.User, m.UserModel, {"primary_key": "id"})
+
+    @mapper.reader.of(Columns[e.User])
+    def load_users():
+        return m.UserModel.objects.all()
+
+    load_users()
+
+    (info,) = traces
+
+    assert info.converter == Columns[e.User]
+    assert info.rows == 2
+
+
+def test_trace_json_reader(e, m, traces):
+    """Count rows of encoded results."""
+    mapper = Mapper(e.User, m.UserModel, {"primary_key": "id"})
+
+    @mapper.reader.of(JSON[e.User])
+    def load_users():
+        return m.UserModel.objects.all()
+
+    load_users()
+
+    (info,) = traces
+
+    assert info.converter == JSON[e.User]
+    assert info.rows == 2
+
+
+def test_remove_tracer(e, m):
+    """Removed tracers are not called."""
+    result = []
+
+    mapper = Mapper(e.User, m.UserModel, {"primary_key": "id"})
+
+    @mapper.reader.of(List[e.User])
+    def load_users():
+        return m.UserModel.objects.all()
+
+    add_tracer(result.append)
+    load_users()
+    remove_tracer(result.append)
+    load_users()
+
+    assert len(result) == 1
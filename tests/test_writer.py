@@ -0,0 +1,199 @@
+"""Tests related to the bulk writers."""
+import django
+import pytest
+
+from mappers import Deferred
+from mappers import Evaluated
+from mappers import Mapper
+from mappers.exceptions import MapperError
+
+pytestmark = pytest.mark.django_db
+
+
+# Writers.
+
+
+def test_create_entities(e, m):
+    """Insert entities into the data source table in batches."""
+    mapper = Mapper(e.OptionalGroup, m.GroupModel, {"primary_key": "id"})
+
+    writer = mapper.writer(batch_size=1)
+
+    writer.create(
+        [
+            e.OptionalGroup(primary_key=3, name="3"),
+            e.OptionalGroup(primary_key=4, name="4"),
+        ]
+    )
+
+    result = m.GroupModel.objects.filter(id__in=[3, 4]).order_by("id")
+
+    assert list(result.values_list("id", "name")) == [(3, "3"), (4, "4")]
+
+
+@pytest.mark.skipif(
+    django.VERSION < (2, 2), reason="Ignore conflicts requires Django 2.2"
+)
+def test_create_conflicts(e, m):
+    """Skip rows which conflict with existing rows if configured."""
+    mapper = Mapper(e.OptionalGroup, m.GroupModel, {"primary_key": "id"})
+
+    writer = mapper.writer(ignore_conflicts=True)
+
+    writer.create(
+        [
+            e.OptionalGroup(primary_key=1, name="1"),
+            e.OptionalGroup(primary_key=3, name="3"),
+        ]
+    )
+
+    assert m.GroupModel.objects.get(id=1).name != "1"
+    assert m.GroupModel.objects.get(id=3).name == "3"
+
+
+@pytest.mark.skipif(django.VERSION < (2, 2), reason="Bulk update requires Django 2.2")
+def test_update_entities(e, m):
+    """Update mapped fields of existing rows by primary key."""
+    mapper = Mapper(e.FlatMessage, m.MessageModel, {"primary_key": "id"})
+
+    writer = mapper.writer()
+
+    writer.update(
+        [
+            e.FlatMessage(primary_key=1, user_id=2, text="first"),
+            e.FlatMessage(primary_key=2, user_id=1, text="second"),
+        ]
+    )
+
+    result = m.MessageModel.objects.order_by("id")
+
+    assert list(result.values_list("id", "user_id", "text")) == [
+        (1, 2, "first"),
+        (2, 1, "second"),
+    ]
+
+
+@pytest.mark.skipif(django.VERSION < (2, 2), reason="Bulk update requires Django 2.2")
+def test_skip_evaluated_fields(e, m):
+    """Evaluated and related fields are not written to the data source."""
+    mapper = Mapper(
+        e.NamedMessage,
+        m.MessageModel,
+        {"primary_key": "id", "username": ("user", "name")},
+    )
+
+    writer = mapper.writer()
+
+    writer.update([e.NamedMessage(primary_key=1, username="user", text="first")])
+
+    assert m.MessageModel.objects.get(id=1).text == "first"
+    assert m.UserModel.objects.get(id=1).name == ""
+
+    mapper = Mapper(
+        e.TotalMessage,
+        m.MessageModel,
+        {"primary_key": "id", "total": Evaluated()},
+    )
+
+    writer = mapper.writer()
+
+    writer.update([e.TotalMessage(primary_key=2, text="second", total=0)])
+
+    assert m.MessageModel.objects.get(id=2).text == "second"
+
+
+# Validation.
+
+
+def test_nested_entities_writer(e, m):
+    """Nested entities could not be written with bulk writers."""
+    mapper = Mapper(
+        e.Message,
+        m.MessageModel,
+        {"primary_key": "id", "user": Mapper({"primary_key": "id"})},
+    )
+
+    expected = ""
+
+    with pytest.raises(MapperError) as exc_info:
+        mapper.writer()
+
+    message = str(exc_info.value)
+    assert message == expected
+
+
+def test_deferred_fields_writer(e, m):
+    """Deferred fields could not be written with bulk writers."""
+    mapper = Mapper(
+        e.User, m.UserModel, {"primary_key": "id", "about": Deferred()}, trusted=True
+    )
+
+    expected = ""
+
+    with pytest.raises(MapperError) as exc_info:
+        mapper.writer()
+
+    message = str(exc_info.value)
+    assert message == expected
+
+
+def test_primary_key_only_update(e, m):
+    """Entities with nothing but the primary key mapped could not be updated."""
+    mapper = Mapper(
+        e.OptionalGroup, m.GroupModel, {"primary_key": "id", "name": Evaluated()}
+    )
+
+    writer = mapper.writer()
+
+    expected = ""
+
+    with pytest.raises(MapperError) as exc_info:
+        writer.update([e.OptionalGroup(primary_key=1, name="1")])
+
+    message = str(exc_info.value)
+    assert message == expected
+
+
+@pytest.mark.skipif(
+    django.VERSION >= (2, 2), reason="Ignore conflicts requires Django 2.2"
+)
+def test_create_conflicts_validation(e, m):
+    """Conflicts could not be ignored by old Django versions."""
+    mapper = Mapper(e.OptionalGroup, m.GroupModel, {"primary_key": "id"})
+
+    expected = ""
+
+    with pytest.raises(MapperError) as exc_info:
+        mapper.writer(ignore_conflicts=True)
+
+    message = str(exc_info.value)
+    assert message == expected
+
+
+@pytest.mark.skipif(django.VERSION >= (2, 2), reason="Bulk update requires Django 2.2")
+def test_update_entities_validation(e, m):
+    """Entities could not be updated by old Django versions."""
+    mapper = Mapper(e.FlatMessage, m.MessageModel, {"primary_key": "id"})
+
+    writer = mapper.writer()
+
+    expected = ""
+
+    with pytest.raises(MapperError) as exc_info:
+        writer.update([e.FlatMessage(primary_key=1, user_id=2, text="first")])
+
+    message = str(exc_info.value)
+    assert message == expected
+
+
+def test_unsupported_data_source_writer(e, s):
+    """Only Django models could be written with bulk writers."""
+    mapper = Mapper(e.OptionalGroup, s.GroupModel, {"primary_key": "id"})
+
+    expected = ""
+
+    with pytest.raises(MapperError) as exc_info:
+        mapper.writer()
+
+    message = str(exc_info.value)
+    assert message == expected